@@ -0,0 +1,33 @@
+# 과거 일봉 백필 (중단 후 다시 실행하면 종목별 체크포인트부터 재개)
+#
+# 실행 (backend 디렉토리에서):
+#   python -m app.commands.backfill_history [--years 10] [--symbols AAPL MSFT] [--restart] [--providers twelvedata]
+
+import argparse
+import asyncio
+import logging
+
+from ..core import http_client
+from ..events.lifespan import init_db
+from ..services import data_fetcher, history_backfill
+
+logging.basicConfig(level=logging.INFO)
+
+async def backfill_history(symbols, years: int, restart: bool, providers):
+    await init_db()
+    await http_client.init_http_client()
+    try:
+        await history_backfill.run_backfill(
+            symbols=symbols, years=years, restart=restart, providers=data_fetcher.get_providers(providers)
+        )
+    finally:
+        await http_client.close_http_client()
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="제공자별 과거 일봉 백필")
+    parser.add_argument("--years", type=int, default=None, help="백필 기간 (기본값: BACKFILL_YEARS)")
+    parser.add_argument("--symbols", nargs="*", default=None, help="대상 심볼 (기본값: 전체)")
+    parser.add_argument("--restart", action="store_true", help="체크포인트를 지우고 처음부터 적재")
+    parser.add_argument("--providers", nargs="*", default=None, help="대상 제공자 (기본값: MARKET_DATA_PROVIDERS)")
+    args = parser.parse_args()
+    asyncio.run(backfill_history(args.symbols, args.years, args.restart, args.providers))
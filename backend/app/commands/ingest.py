@@ -0,0 +1,32 @@
+# 시세 적재를 API와 분리된 워커 프로세스로 실행 (API는 INGEST_ON_STARTUP=false)
+#
+# 실행 (backend 디렉토리에서): python -m app.commands.ingest [--only-failed]
+#   --only-failed: 직전 적재(다른 프로세스 포함)에서 실패한 종목만 다시 시도
+
+import argparse
+import asyncio
+import logging
+
+from ..core import http_client
+from ..events.lifespan import init_db, run_startup_tasks
+from ..services import data_fetcher
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+async def run_ingest(only_failed: bool = False):
+    await init_db()
+    await http_client.init_http_client()
+    try:
+        if only_failed:
+            await data_fetcher.update_stock_prices(only_failed=True)
+        else:
+            await run_startup_tasks()
+    finally:
+        await http_client.close_http_client()
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="시세 적재 워커")
+    parser.add_argument("--only-failed", action="store_true", help="직전 적재에서 실패한 종목만 다시 시도")
+    args = parser.parse_args()
+    asyncio.run(run_ingest(args.only_failed))
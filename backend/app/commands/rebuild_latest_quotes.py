@@ -0,0 +1,29 @@
+# 최신 시세 스냅샷(stock_latest_quotes) 백필/복구
+#
+# 실행 (backend 디렉토리에서): python -m app.commands.rebuild_latest_quotes
+
+import asyncio
+import logging
+
+from ..db.database import AsyncSessionLocal
+from ..crud import crud_price
+from ..events.lifespan import init_db
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+async def rebuild_latest_quotes():
+    """stock_prices 이력 → stock_latest_quotes 재구성 (단일 트랜잭션)"""
+    await init_db()
+    async with AsyncSessionLocal() as db:
+        try:
+            count = await crud_price.rebuild_latest_quotes(db)
+            await db.commit()
+            logger.info(f"✅ 최신 시세 스냅샷 {count}건을 재구성했습니다.")
+        except Exception as e:
+            await db.rollback()
+            logger.error(f"⛔ 최신 시세 스냅샷을 재구성하는 중 오류가 발생했습니다: {e}")
+            raise
+
+if __name__ == "__main__":
+    asyncio.run(rebuild_latest_quotes())
@@ -0,0 +1,23 @@
+# 기술적 지표(stock_indicators) 전체 재계산
+#
+# 실행 (backend 디렉토리에서): python -m app.commands.recompute_indicators
+
+import asyncio
+import logging
+
+from ..events.lifespan import init_db
+from ..services import indicator_engine, stock_service
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+async def recompute_indicators():
+    """전 종목 지표를 전체 시세 이력으로 다시 계산 (종목 묶음별 트랜잭션)"""
+    await init_db()
+    count = await indicator_engine.recompute_all_indicators()
+    # API 레플리카의 ETag/목록 캐시 키가 바뀌도록 데이터셋 버전 증가
+    await stock_service.invalidate_stock_list_cache()
+    logger.info(f"✅ 기술적 지표 {count}건을 재계산했습니다.")
+
+if __name__ == "__main__":
+    asyncio.run(recompute_indicators())
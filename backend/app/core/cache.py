@@ -0,0 +1,125 @@
+# 응답 캐시 (TTL + LRU, 세대 번호 기반 무효화)
+
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional, Protocol, Tuple
+
+class CacheBackend(Protocol):
+    """
+    캐시 저장소 인터페이스 (Redis 명령 GET/SET EX/INCR과 같은 의미)
+    여러 uvicorn 워커가 공유하려면 Redis 등으로 구현해 교체
+    """
+
+    async def get(self, key: str) -> Optional[bytes]: ...
+
+    async def set(self, key: str, value: bytes, ex: Optional[float] = None) -> None: ...
+
+    async def incr(self, key: str) -> int: ...
+
+    def stats(self) -> Dict[str, Any]: ...
+
+class InMemoryCacheBackend:
+    """프로세스 내 dict 기반 저장소 (만료 시간 + LRU 축출)"""
+
+    def __init__(self, max_entries: int = 1024):
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, Tuple[Optional[float], bytes]]" = OrderedDict()
+        self._counters: Dict[str, int] = {}
+        self.evictions = 0
+        self.expirations = 0
+
+    async def get(self, key: str) -> Optional[bytes]:
+        # incr로 만든 카운터는 LRU 축출 대상이 아님 (Redis처럼 GET으로 조회 가능)
+        if key in self._counters:
+            return str(self._counters[key]).encode()
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if expires_at is not None and expires_at <= time.monotonic():
+            del self._entries[key]
+            self.expirations += 1
+            return None
+        self._entries.move_to_end(key)
+        return value
+
+    async def set(self, key: str, value: bytes, ex: Optional[float] = None) -> None:
+        expires_at = time.monotonic() + ex if ex is not None else None
+        self._entries[key] = (expires_at, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    async def incr(self, key: str) -> int:
+        self._counters[key] = self._counters.get(key, 0) + 1
+        return self._counters[key]
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "backend": "memory",
+            "entries": len(self._entries),
+            "max_entries": self.max_entries,
+            "evictions": self.evictions,
+            "expirations": self.expirations,
+        }
+
+class ResponseCache:
+    """
+    직렬화된 응답(bytes) 캐시
+    invalidate()는 세대 번호만 올림 → 이전 세대 키는 조회되지 않고 TTL/LRU로 정리됨
+    """
+
+    def __init__(self, backend: CacheBackend, namespace: str, ttl_seconds: float):
+        self.backend = backend
+        self.namespace = namespace
+        self.ttl_seconds = ttl_seconds
+        self._generation_key = f"{namespace}:generation"
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+
+    async def _generation(self) -> int:
+        value = await self.backend.get(self._generation_key)
+        return int(value) if value is not None else 0
+
+    async def _key(self, key_parts: Tuple[Hashable, ...]) -> str:
+        generation = await self._generation()
+        return f"{self.namespace}:{generation}:" + ":".join(map(str, key_parts))
+
+    async def get(self, key_parts: Tuple[Hashable, ...]) -> Optional[bytes]:
+        value = await self.backend.get(await self._key(key_parts))
+        if value is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return value
+
+    async def get_or_set(self, key_parts: Tuple[Hashable, ...], produce: Callable[[], Awaitable[bytes]]) -> bytes:
+        """
+        캐시 조회, 없으면 produce() 결과를 저장 후 반환
+        키(세대 번호 포함)는 조회 시점에 한 번만 정함 → 생성 중 invalidate()되면 이전 세대 키에 저장되어 조회되지 않음
+        """
+        key = await self._key(key_parts)
+        value = await self.backend.get(key)
+        if value is not None:
+            self.hits += 1
+            return value
+        self.misses += 1
+        value = await produce()
+        await self.backend.set(key, value, ex=self.ttl_seconds)
+        return value
+
+    async def invalidate(self) -> None:
+        await self.backend.incr(self._generation_key)
+        self.invalidations += 1
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "namespace": self.namespace,
+            "ttl_seconds": self.ttl_seconds,
+            "hits": self.hits,
+            "misses": self.misses,
+            "invalidations": self.invalidations,
+            **self.backend.stats(),
+        }
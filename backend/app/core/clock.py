@@ -0,0 +1,42 @@
+# 시간 소스 추상화 (스케줄러를 실제 시간 없이 테스트하기 위한 FakeClock 포함)
+
+import asyncio
+from datetime import datetime, timedelta, timezone
+from typing import Optional, Protocol
+
+class Clock(Protocol):
+    def now(self) -> datetime:
+        """현재 시각 (timezone-aware, UTC)"""
+        ...
+
+    async def sleep(self, seconds: float) -> None: ...
+
+class SystemClock:
+    """실제 시계"""
+
+    def now(self) -> datetime:
+        return datetime.now(timezone.utc)
+
+    async def sleep(self, seconds: float) -> None:
+        await asyncio.sleep(seconds)
+
+class FakeClock:
+    """
+    가짜 시계: sleep은 실제로 기다리지 않고 시각만 앞으로 이동
+    오프라인에서 스케줄러의 하루/일주일 동작을 즉시 재현할 때 사용
+    """
+
+    def __init__(self, start: Optional[datetime] = None):
+        self._now = start or datetime(2025, 1, 6, 14, 0, tzinfo=timezone.utc)
+        self.sleeps: list[float] = []
+
+    def now(self) -> datetime:
+        return self._now
+
+    def advance(self, seconds: float):
+        self._now += timedelta(seconds=seconds)
+
+    async def sleep(self, seconds: float) -> None:
+        self.sleeps.append(seconds)
+        self.advance(max(0.0, seconds))
+        await asyncio.sleep(0) # 다른 태스크에 실행 기회 양보
@@ -0,0 +1,48 @@
+# 응답 압축 미들웨어: brotli 패키지가 있고 클라이언트가 br을 받으면 brotli, 아니면 gzip
+# (SSE 등 제외 콘텐츠 타입과 최소 크기 처리는 Starlette GZipMiddleware와 같음)
+
+from starlette.datastructures import Headers
+from starlette.middleware.gzip import GZipMiddleware, IdentityResponder
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+try:
+    import brotli
+except ImportError: # 선택 의존성 (없으면 gzip만 사용)
+    brotli = None
+
+class BrotliResponder(IdentityResponder):
+    content_encoding = "br"
+
+    def __init__(self, app: ASGIApp, minimum_size: int, quality: int):
+        super().__init__(app, minimum_size)
+        self.quality = quality
+        self._compressor = None
+
+    async def apply_compression(self, body: bytes, *, more_body: bool) -> bytes:
+        if self._compressor is None:
+            self._compressor = brotli.Compressor(quality=self.quality)
+        if more_body:
+            return self._compressor.process(body) + self._compressor.flush()
+        return self._compressor.process(body) + self._compressor.finish()
+
+def accepts_encoding(headers: Headers, encoding: str) -> bool:
+    """Accept-Encoding에 encoding이 있는지 (q=0은 거부로 처리)"""
+    for token in headers.get("Accept-Encoding", "").split(","):
+        name, _, params = token.partition(";")
+        if name.strip().lower() == encoding:
+            return params.replace(" ", "") not in ("q=0", "q=0.0")
+    return False
+
+class CompressionMiddleware(GZipMiddleware):
+    """GZipMiddleware + brotli (br 우선)"""
+
+    def __init__(self, app: ASGIApp, minimum_size: int = 1024, compresslevel: int = 6, brotli_quality: int = 4):
+        super().__init__(app, minimum_size=minimum_size, compresslevel=compresslevel)
+        self.brotli_quality = brotli_quality
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if brotli is not None and scope["type"] == "http" and accepts_encoding(Headers(scope=scope), "br"):
+            responder = BrotliResponder(self.app, self.minimum_size, self.brotli_quality)
+            await responder(scope, receive, send)
+            return
+        await super().__call__(scope, receive, send)
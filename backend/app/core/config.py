@@ -8,9 +8,98 @@ load_dotenv()
 
 class Settings(BaseSettings):
     DATABASE_URL: str = os.getenv("DATABASE_URL")
+    # 읽기 전용 레플리카 (목록/상세/검색/시세 이력 조회, 비우면 primary 사용)
+    DATABASE_READ_URL: str = os.getenv("DATABASE_READ_URL", "")
     TWELVEDATA_API_KEY: str = os.getenv("TWELVE_DATA_API_KEY")
     TWELVEDATA_BASE_URL: str = os.getenv("TWELVEDATA_BASE_URL")
 
+    # DB 커넥션 풀 (엔진별): 기본 연결 수, 추가 연결 수, 연결 재생성 주기, 연결 대기 한도, 사용 전 연결 확인
+    DB_POOL_SIZE: int = int(os.getenv("DB_POOL_SIZE", "5"))
+    DB_MAX_OVERFLOW: int = int(os.getenv("DB_MAX_OVERFLOW", "10"))
+    DB_POOL_RECYCLE_SECONDS: int = int(os.getenv("DB_POOL_RECYCLE_SECONDS", "1800"))
+    DB_POOL_TIMEOUT_SECONDS: float = float(os.getenv("DB_POOL_TIMEOUT_SECONDS", "30"))
+    DB_POOL_PRE_PING: bool = os.getenv("DB_POOL_PRE_PING", "true").lower() == "true"
+    # 구문 캐시: asyncpg prepared statement 캐시 (연결당, pgbouncer transaction 모드면 0), SQLAlchemy 컴파일 캐시
+    DB_STATEMENT_CACHE_SIZE: int = int(os.getenv("DB_STATEMENT_CACHE_SIZE", "100"))
+    DB_QUERY_CACHE_SIZE: int = int(os.getenv("DB_QUERY_CACHE_SIZE", "500"))
+
+    # 시세 제공자: 적재에 사용할 제공자 (콤마 구분, twelvedata / fake), 제공자별 한도로 동시에 실행
+    MARKET_DATA_PROVIDERS: str = os.getenv("MARKET_DATA_PROVIDERS", "twelvedata")
+    # 가짜 제공자 (오프라인 테스트): 종목 수, 요청당 응답 지연, 재시도 대상 오류 비율, 분당 크레딧 한도
+    FAKE_PROVIDER_SYMBOLS: int = int(os.getenv("FAKE_PROVIDER_SYMBOLS", "100"))
+    FAKE_PROVIDER_LATENCY_MS: float = float(os.getenv("FAKE_PROVIDER_LATENCY_MS", "0"))
+    FAKE_PROVIDER_ERROR_RATE: float = float(os.getenv("FAKE_PROVIDER_ERROR_RATE", "0"))
+    FAKE_PROVIDER_CREDITS_PER_MINUTE: int = int(os.getenv("FAKE_PROVIDER_CREDITS_PER_MINUTE", "6000"))
+
+    # Twelvedata: 요청 1회당 심볼 수 (quote 엔드포인트는 콤마 구분 다중 심볼 지원, 심볼당 1크레딧)
+    TWELVEDATA_BATCH_SIZE: int = int(os.getenv("TWELVEDATA_BATCH_SIZE", "8"))
+
+    # Twelvedata: 분당 크레딧 한도 (Basic 플랜 8)
+    TWELVEDATA_CREDITS_PER_MINUTE: int = int(os.getenv("TWELVEDATA_CREDITS_PER_MINUTE", "8"))
+
+    # 외부 API 호출 스케줄러: 동시 요청 수, 재시도 (지수 백오프 + jitter)
+    FETCH_MAX_CONCURRENCY: int = int(os.getenv("FETCH_MAX_CONCURRENCY", "4"))
+    FETCH_MAX_RETRIES: int = int(os.getenv("FETCH_MAX_RETRIES", "3"))
+    FETCH_BACKOFF_BASE_SECONDS: float = float(os.getenv("FETCH_BACKOFF_BASE_SECONDS", "2"))
+    FETCH_BACKOFF_MAX_SECONDS: float = float(os.getenv("FETCH_BACKOFF_MAX_SECONDS", "60"))
+
+    # 외부 API 공용 HTTP 클라이언트 (커넥션 풀, keep-alive)
+    HTTP_TIMEOUT_SECONDS: float = float(os.getenv("HTTP_TIMEOUT_SECONDS", "10"))
+    HTTP_MAX_CONNECTIONS: int = int(os.getenv("HTTP_MAX_CONNECTIONS", "20"))
+    HTTP_MAX_KEEPALIVE_CONNECTIONS: int = int(os.getenv("HTTP_MAX_KEEPALIVE_CONNECTIONS", "10"))
+    HTTP_KEEPALIVE_EXPIRY_SECONDS: float = float(os.getenv("HTTP_KEEPALIVE_EXPIRY_SECONDS", "30"))
+
+    # 시작 시 적재: API 프로세스에서 백그라운드 실행 여부 (별도 워커 프로세스로 돌리면 false)
+    INGEST_ON_STARTUP: bool = os.getenv("INGEST_ON_STARTUP", "true").lower() == "true"
+    INGEST_MAX_ATTEMPTS: int = int(os.getenv("INGEST_MAX_ATTEMPTS", "3"))
+    INGEST_RETRY_DELAY_SECONDS: float = float(os.getenv("INGEST_RETRY_DELAY_SECONDS", "30"))
+
+    # 주기 적재: 장중에는 INGEST_INTERVAL_SECONDS마다, 장 마감 후 INGEST_POST_CLOSE_DELAY_SECONDS 뒤 1회
+    INGEST_SCHEDULE_ENABLED: bool = os.getenv("INGEST_SCHEDULE_ENABLED", "true").lower() == "true"
+    INGEST_INTERVAL_SECONDS: float = float(os.getenv("INGEST_INTERVAL_SECONDS", "900"))
+    INGEST_POST_CLOSE_DELAY_SECONDS: float = float(os.getenv("INGEST_POST_CLOSE_DELAY_SECONDS", "900"))
+    # 여러 레플리카 중 하나만 적재하도록 잡는 PostgreSQL advisory lock 키
+    INGEST_ADVISORY_LOCK_KEY: int = int(os.getenv("INGEST_ADVISORY_LOCK_KEY", "7270001"))
+
+    # 과거 시세 백필 (time_series): 기본 기간, 요청 1회당 최대 봉 수 (Twelvedata 최대 5000)
+    BACKFILL_YEARS: int = int(os.getenv("BACKFILL_YEARS", "10"))
+    BACKFILL_PAGE_SIZE: int = int(os.getenv("BACKFILL_PAGE_SIZE", "5000"))
+
+    # 시세 적재: 배치당 종목 수 (배치당 트랜잭션 1회)
+    INGEST_BATCH_SIZE: int = int(os.getenv("INGEST_BATCH_SIZE", "200"))
+
+    # 실시간 시세 스트림 (SSE): 구독자별 큐 크기 (가득 차면 끊음), keep-alive 주기, 구독 심볼 최대 수
+    QUOTE_STREAM_QUEUE_SIZE: int = int(os.getenv("QUOTE_STREAM_QUEUE_SIZE", "256"))
+    QUOTE_STREAM_KEEPALIVE_SECONDS: float = float(os.getenv("QUOTE_STREAM_KEEPALIVE_SECONDS", "15"))
+    QUOTE_STREAM_MAX_SYMBOLS: int = int(os.getenv("QUOTE_STREAM_MAX_SYMBOLS", "200"))
+    # LISTEN 리스너 실행 여부 (부하 테스트 등 DB 없이 띄울 때 false)
+    QUOTE_STREAM_LISTEN: bool = os.getenv("QUOTE_STREAM_LISTEN", "true").lower() == "true"
+
+    # 다중 종목 조회(/stocks/batch) 최대 심볼 수
+    STOCK_BATCH_MAX_SYMBOLS: int = int(os.getenv("STOCK_BATCH_MAX_SYMBOLS", "200"))
+
+    # 종목 검색 색인: 이 시간이 지나면 다음 검색 때 백그라운드 재생성 (다른 레플리카의 이름 변경 반영)
+    SEARCH_INDEX_MAX_AGE_SECONDS: float = float(os.getenv("SEARCH_INDEX_MAX_AGE_SECONDS", "300"))
+
+    # HTTP 캐시 (ETag/Last-Modified + Cache-Control): 브라우저/CDN 캐시 유지 시간, 만료 후 재검증 중 이전 응답 사용 시간
+    HTTP_CACHE_MAX_AGE_SECONDS: int = int(os.getenv("HTTP_CACHE_MAX_AGE_SECONDS", "15"))
+    HTTP_CACHE_STALE_WHILE_REVALIDATE_SECONDS: int = int(os.getenv("HTTP_CACHE_STALE_WHILE_REVALIDATE_SECONDS", "60"))
+    # 데이터셋 버전: 이 시간 동안은 DB 조회 없이 마지막으로 읽은 버전 사용
+    DATASET_VERSION_TTL_SECONDS: float = float(os.getenv("DATASET_VERSION_TTL_SECONDS", "1"))
+
+    # 응답 압축: 이 크기(bytes) 이상만 압축, gzip 레벨, brotli 품질 (brotli 패키지가 설치되어 있으면 br 우선)
+    COMPRESSION_MINIMUM_SIZE: int = int(os.getenv("COMPRESSION_MINIMUM_SIZE", "1024"))
+    GZIP_COMPRESS_LEVEL: int = int(os.getenv("GZIP_COMPRESS_LEVEL", "6"))
+    BROTLI_QUALITY: int = int(os.getenv("BROTLI_QUALITY", "4"))
+
+    # OpenTelemetry span 내보내기 (opentelemetry-sdk, opentelemetry-exporter-otlp 설치 필요, 주소는 OTEL_EXPORTER_OTLP_ENDPOINT)
+    OTEL_ENABLED: bool = os.getenv("OTEL_ENABLED", "false").lower() == "true"
+    OTEL_SERVICE_NAME: str = os.getenv("OTEL_SERVICE_NAME", "capstone-stock-api")
+
+    # 주식 목록 응답 캐시
+    STOCK_LIST_CACHE_TTL_SECONDS: float = float(os.getenv("STOCK_LIST_CACHE_TTL_SECONDS", "60"))
+    STOCK_LIST_CACHE_MAX_ENTRIES: int = int(os.getenv("STOCK_LIST_CACHE_MAX_ENTRIES", "1024"))
+
     class Config:
         env_file = ".env"
         env_file_encoding = "utf-8"
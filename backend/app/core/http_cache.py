@@ -0,0 +1,53 @@
+# HTTP 조건부 요청 (If-None-Match / If-Modified-Since → 304)과 캐시 헤더
+
+from datetime import datetime, timezone
+from email.utils import format_datetime, parsedate_to_datetime
+from typing import Dict, Mapping, Optional
+
+from .config import settings
+
+def _as_utc(value: datetime) -> datetime:
+    """timezone 없는 값은 UTC로 간주"""
+    return value.replace(tzinfo=timezone.utc) if value.tzinfo is None else value.astimezone(timezone.utc)
+
+def make_etag(version: int) -> str:
+    """
+    데이터셋 버전 → ETag
+    압축 여부와 무관하게 같은 값이어야 하므로 약한 ETag (W/)
+    """
+    return f'W/"{version}"'
+
+def cache_headers(version: int, last_modified: Optional[datetime]) -> Dict[str, str]:
+    """200/304 응답에 붙일 ETag, Last-Modified, Cache-Control 헤더"""
+    headers = {
+        "ETag": make_etag(version),
+        "Cache-Control": (
+            f"public, max-age={settings.HTTP_CACHE_MAX_AGE_SECONDS}, "
+            f"stale-while-revalidate={settings.HTTP_CACHE_STALE_WHILE_REVALIDATE_SECONDS}"
+        ),
+    }
+    if last_modified is not None:
+        headers["Last-Modified"] = format_datetime(_as_utc(last_modified), usegmt=True)
+    return headers
+
+def is_not_modified(request_headers: Mapping[str, str], version: int, last_modified: Optional[datetime]) -> bool:
+    """
+    클라이언트 캐시가 최신인지 (RFC 9110: If-None-Match가 있으면 If-Modified-Since는 무시)
+    ETag는 약한 비교 (W/ 접두사 무시)
+    """
+    if_none_match = request_headers.get("if-none-match")
+    if if_none_match is not None:
+        if if_none_match.strip() == "*":
+            return True
+        etag = make_etag(version).removeprefix("W/")
+        return any(tag.strip().removeprefix("W/") == etag for tag in if_none_match.split(","))
+
+    if_modified_since = request_headers.get("if-modified-since")
+    if if_modified_since and last_modified is not None:
+        try:
+            since = parsedate_to_datetime(if_modified_since)
+        except (TypeError, ValueError):
+            return False
+        # HTTP 날짜는 초 단위
+        return _as_utc(last_modified).replace(microsecond=0) <= _as_utc(since)
+    return False
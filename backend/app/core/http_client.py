@@ -0,0 +1,75 @@
+# 외부 API 호출용 공용 httpx 클라이언트 (앱 수명 동안 커넥션 재사용)
+
+import httpx
+import time
+from typing import Optional
+from urllib.parse import urlsplit
+
+from . import metrics, tracing
+from .config import settings
+
+_client: Optional[httpx.AsyncClient] = None
+
+def provider_for_host(host: str) -> str:
+    """요청 호스트 → 지표 레이블용 제공자 이름 (설정에 없는 호스트는 호스트 그대로)"""
+    if settings.TWELVEDATA_BASE_URL and host == urlsplit(settings.TWELVEDATA_BASE_URL).hostname:
+        return "twelvedata"
+    return host
+
+class InstrumentedTransport(httpx.AsyncBaseTransport):
+    """제공자/엔드포인트/상태 코드별 호출 시간 기록 (네트워크 오류는 status=error)"""
+
+    def __init__(self, transport: httpx.AsyncBaseTransport):
+        self._transport = transport
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        provider = provider_for_host(request.url.host)
+        endpoint = request.url.path
+        status = "error"
+        start = time.perf_counter()
+        try:
+            with tracing.span(f"{provider} {endpoint}", **{"http.method": request.method}) as span:
+                response = await self._transport.handle_async_request(request)
+                status = str(response.status_code)
+                if span is not None:
+                    span.set_attribute("http.status_code", response.status_code)
+            return response
+        finally:
+            metrics.observe_provider_request(provider, endpoint, status, time.perf_counter() - start)
+
+    async def aclose(self):
+        await self._transport.aclose()
+
+def create_http_client() -> httpx.AsyncClient:
+    """커넥션 풀/keep-alive 설정을 적용한 httpx 클라이언트 생성 (호출 시간 지표 기록)"""
+    transport = httpx.AsyncHTTPTransport(
+        limits=httpx.Limits(
+            max_connections=settings.HTTP_MAX_CONNECTIONS,
+            max_keepalive_connections=settings.HTTP_MAX_KEEPALIVE_CONNECTIONS,
+            keepalive_expiry=settings.HTTP_KEEPALIVE_EXPIRY_SECONDS,
+        ),
+    )
+    return httpx.AsyncClient(
+        timeout=httpx.Timeout(settings.HTTP_TIMEOUT_SECONDS),
+        transport=InstrumentedTransport(transport),
+    )
+
+async def init_http_client():
+    """앱 시작 시 공용 클라이언트 생성 (lifespan)"""
+    global _client
+    if _client is None:
+        _client = create_http_client()
+
+async def close_http_client():
+    """앱 종료 시 공용 클라이언트 종료 (lifespan)"""
+    global _client
+    if _client is not None:
+        await _client.aclose()
+        _client = None
+
+def get_http_client() -> httpx.AsyncClient:
+    """공용 클라이언트 반환 (lifespan 밖에서 호출되면 지연 생성, 명령 실행 등)"""
+    global _client
+    if _client is None:
+        _client = create_http_client()
+    return _client
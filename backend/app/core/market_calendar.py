@@ -0,0 +1,122 @@
+# 거래소 영업일/거래 시간 (미국 주식: NYSE/NASDAQ 정규장)
+
+from dataclasses import dataclass
+from datetime import date, datetime, time, timedelta
+from functools import lru_cache
+from typing import Callable, FrozenSet, Tuple
+from zoneinfo import ZoneInfo
+
+def _nth_weekday(year: int, month: int, weekday: int, n: int) -> date:
+    """year년 month월의 n번째 weekday (월=0)"""
+    first = date(year, month, 1)
+    return first + timedelta(days=(weekday - first.weekday()) % 7 + 7 * (n - 1))
+
+def _last_weekday(year: int, month: int, weekday: int) -> date:
+    """year년 month월의 마지막 weekday"""
+    last = date(year + month // 12, month % 12 + 1, 1) - timedelta(days=1)
+    return last - timedelta(days=(last.weekday() - weekday) % 7)
+
+def _easter(year: int) -> date:
+    """부활절 (그레고리력, Anonymous Gregorian algorithm)"""
+    a, b, c = year % 19, year // 100, year % 100
+    d, e = b // 4, b % 4
+    f = (b + 8) // 25
+    g = (b - f + 1) // 3
+    h = (19 * a + b - d - g + 15) % 30
+    i, k = c // 4, c % 4
+    l = (32 + 2 * e + 2 * i - h - k) % 7
+    m = (a + 11 * h + 22 * l) // 451
+    month, day = divmod(h + l - 7 * m + 114, 31)
+    return date(year, month, day + 1)
+
+def _observed(day: date) -> date:
+    """토요일 휴일 → 금요일, 일요일 휴일 → 월요일"""
+    if day.weekday() == 5:
+        return day - timedelta(days=1)
+    if day.weekday() == 6:
+        return day + timedelta(days=1)
+    return day
+
+@lru_cache(maxsize=None)
+def us_market_holidays(year: int) -> FrozenSet[date]:
+    """NYSE 정규 휴장일 (임시 휴장은 포함하지 않음)"""
+    holidays = {
+        _nth_weekday(year, 1, 0, 3), # Martin Luther King Jr. Day
+        _nth_weekday(year, 2, 0, 3), # Washington's Birthday
+        _easter(year) - timedelta(days=2), # Good Friday
+        _last_weekday(year, 5, 0), # Memorial Day
+        _observed(date(year, 7, 4)), # Independence Day
+        _nth_weekday(year, 9, 0, 1), # Labor Day
+        _nth_weekday(year, 11, 3, 4), # Thanksgiving Day
+        _observed(date(year, 12, 25)), # Christmas Day
+    }
+    # New Year's Day: 토요일이면 전년도 12/31에 대체 휴장하지 않음
+    if date(year, 1, 1).weekday() != 5:
+        holidays.add(_observed(date(year, 1, 1)))
+    if year >= 2022:
+        holidays.add(_observed(date(year, 6, 19))) # Juneteenth
+    return frozenset(holidays)
+
+@dataclass(frozen=True)
+class MarketCalendar:
+    name: str
+    timezone: ZoneInfo
+    open_time: time
+    close_time: time
+    holidays: Callable[[int], FrozenSet[date]]
+
+    def is_trading_day(self, day: date) -> bool:
+        return day.weekday() < 5 and day not in self.holidays(day.year)
+
+    def previous_trading_day(self, day: date) -> date:
+        """day 이전(미포함)의 가장 최근 영업일"""
+        day -= timedelta(days=1)
+        while not self.is_trading_day(day):
+            day -= timedelta(days=1)
+        return day
+
+    def next_trading_day(self, day: date) -> date:
+        """day 이후(미포함)의 가장 가까운 영업일"""
+        day += timedelta(days=1)
+        while not self.is_trading_day(day):
+            day += timedelta(days=1)
+        return day
+
+    def session_bounds(self, day: date) -> Tuple[datetime, datetime]:
+        """영업일 day의 정규장 시작/종료 시각 (거래소 현지 시간대)"""
+        return (
+            datetime.combine(day, self.open_time, tzinfo=self.timezone),
+            datetime.combine(day, self.close_time, tzinfo=self.timezone),
+        )
+
+    def local_date(self, now: datetime) -> date:
+        return now.astimezone(self.timezone).date()
+
+    def is_open(self, now: datetime) -> bool:
+        day = self.local_date(now)
+        if not self.is_trading_day(day):
+            return False
+        open_at, close_at = self.session_bounds(day)
+        return open_at <= now < close_at
+
+    def latest_session_date(self, now: datetime) -> date:
+        """now 시점에 시세가 존재하는 가장 최근 세션 (장 시작 전이면 직전 영업일)"""
+        day = self.local_date(now)
+        if self.is_trading_day(day) and now >= self.session_bounds(day)[0]:
+            return day
+        return self.previous_trading_day(day)
+
+    def next_open(self, now: datetime) -> datetime:
+        """now 이후 가장 가까운 장 시작 시각"""
+        day = self.local_date(now)
+        if self.is_trading_day(day) and now < self.session_bounds(day)[0]:
+            return self.session_bounds(day)[0]
+        return self.session_bounds(self.next_trading_day(day))[0]
+
+US_EQUITY_CALENDAR = MarketCalendar(
+    name="US",
+    timezone=ZoneInfo("America/New_York"),
+    open_time=time(9, 30),
+    close_time=time(16, 0),
+    holidays=us_market_holidays,
+)
@@ -0,0 +1,177 @@
+# Prometheus 지표: HTTP 요청 지연/요청당 SQL 수·시간, 외부 API 호출, 시세 적재, DB 커넥션 풀
+
+import time
+from contextvars import ContextVar
+from typing import Any, Dict, Optional
+
+from prometheus_client import REGISTRY, Counter, Histogram
+from prometheus_client.core import CounterMetricFamily, GaugeMetricFamily
+from prometheus_client.registry import Collector
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from . import tracing
+
+HTTP_REQUEST_SECONDS = Histogram(
+    "http_request_duration_seconds",
+    "HTTP 요청 처리 시간",
+    ["method", "route", "status"],
+)
+HTTP_REQUEST_DB_STATEMENTS = Histogram(
+    "http_request_db_statements",
+    "HTTP 요청 1회에 실행한 SQL 문 수 (N+1 확인용)",
+    ["route"],
+    buckets=(0, 1, 2, 3, 5, 10, 20, 50, 100, 200, 500),
+)
+HTTP_REQUEST_DB_SECONDS = Histogram(
+    "http_request_db_duration_seconds",
+    "HTTP 요청 1회에 SQL 실행에 쓴 시간 합계",
+    ["route"],
+)
+DB_STATEMENT_SECONDS = Histogram(
+    "db_statement_duration_seconds",
+    "SQL 문 실행 시간 (요청 밖의 적재/백필 포함)",
+    ["engine"],
+)
+PROVIDER_REQUEST_SECONDS = Histogram(
+    "provider_request_duration_seconds",
+    "외부 시세 API 호출 시간 (응답 헤더 수신까지)",
+    ["provider", "endpoint", "status"],
+)
+INGEST_RUN_SECONDS = Histogram(
+    "ingest_run_duration_seconds",
+    "시세 적재/백필 실행 시간",
+    ["job", "outcome"],
+    buckets=(1, 5, 15, 30, 60, 120, 300, 600, 1200, 3600, 7200),
+)
+INGEST_SYMBOLS = Counter(
+    "ingest_symbols",
+    "적재/백필 종목별 결과",
+    ["job", "outcome"],
+)
+
+class RequestDbStats:
+    """요청 1회의 SQL 실행 횟수/시간 (SQLAlchemy 이벤트가 누적)"""
+
+    __slots__ = ("statements", "seconds")
+
+    def __init__(self):
+        self.statements = 0
+        self.seconds = 0.0
+
+_request_db_stats: ContextVar[Optional[RequestDbStats]] = ContextVar("request_db_stats", default=None)
+
+# instrument_engine으로 등록한 엔진 (풀 게이지 수집 대상)
+_engines: Dict[str, AsyncEngine] = {}
+
+def instrument_engine(engine: AsyncEngine, name: str):
+    """엔진의 SQL 실행 시간/횟수 기록 + 풀 게이지 수집 대상 등록"""
+    if name in _engines:
+        return
+    _engines[name] = engine
+    statement_seconds = DB_STATEMENT_SECONDS.labels(name)
+
+    # 시작 시각은 실행 컨텍스트에 저장 (실패한 문은 after 이벤트가 없으므로 연결에 쌓아 두면 남음)
+    @event.listens_for(engine.sync_engine, "before_cursor_execute")
+    def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        if context is not None:
+            context._metrics_query_start = time.perf_counter()
+
+    @event.listens_for(engine.sync_engine, "after_cursor_execute")
+    def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        start = getattr(context, "_metrics_query_start", None)
+        if start is None:
+            return
+        elapsed = time.perf_counter() - start
+        statement_seconds.observe(elapsed)
+        stats = _request_db_stats.get()
+        if stats is not None:
+            stats.statements += 1
+            stats.seconds += elapsed
+
+def observe_provider_request(provider: str, endpoint: str, status: str, seconds: float):
+    PROVIDER_REQUEST_SECONDS.labels(provider, endpoint, status).observe(seconds)
+
+def observe_ingest_run(job: str, seconds: float, report: Optional[Any]):
+    """
+    적재 실행 1회 기록 (report: FetchReport, 예외로 끝났으면 None)
+    outcome: 전부 성공 ok / 일부 실패 partial / 예외 error
+    """
+    if report is None:
+        INGEST_RUN_SECONDS.labels(job, "error").observe(seconds)
+        return
+    summary = report.summary()
+    INGEST_RUN_SECONDS.labels(job, "partial" if summary["failed"] else "ok").observe(seconds)
+    INGEST_SYMBOLS.labels(job, "succeeded").inc(summary["succeeded"])
+    INGEST_SYMBOLS.labels(job, "failed").inc(summary["failed"])
+
+class PoolCollector(Collector):
+    """스크레이프 시점의 커넥션 풀 상태 (사용 중/대기/추가 연결 수, 연결 획득 대기 시간)"""
+
+    def collect(self):
+        size = GaugeMetricFamily("db_pool_size", "풀 기본 연결 수", labels=["engine"])
+        checked_out = GaugeMetricFamily("db_pool_checked_out", "사용 중인 연결 수", labels=["engine"])
+        checked_in = GaugeMetricFamily("db_pool_checked_in", "풀에서 대기 중인 연결 수", labels=["engine"])
+        overflow = GaugeMetricFamily("db_pool_overflow", "pool_size를 넘어 추가로 연 연결 수", labels=["engine"])
+        checkouts = CounterMetricFamily("db_pool_checkouts", "풀에서 연결을 얻은 횟수", labels=["engine"])
+        wait_seconds = CounterMetricFamily("db_pool_wait_seconds", "연결을 얻기까지 기다린 시간 합계", labels=["engine"])
+        timeouts = CounterMetricFamily("db_pool_timeouts", "연결 대기 시간 초과 횟수", labels=["engine"])
+
+        for name, engine in _engines.items():
+            pool = engine.pool
+            wait_stats = getattr(pool, "wait_stats", None)
+            if wait_stats is None:
+                continue
+            size.add_metric([name], pool.size())
+            checked_out.add_metric([name], pool.checkedout())
+            checked_in.add_metric([name], pool.checkedin())
+            overflow.add_metric([name], max(pool.overflow(), 0))
+            checkouts.add_metric([name], wait_stats.checkouts)
+            wait_seconds.add_metric([name], wait_stats.total_wait_seconds)
+            timeouts.add_metric([name], wait_stats.timeouts)
+        return [size, checked_out, checked_in, overflow, checkouts, wait_seconds, timeouts]
+
+REGISTRY.register(PoolCollector())
+
+def _route_label(scope: Scope) -> str:
+    """경로 템플릿 (예: /stocks/{symbol}), 라우트가 없으면 unmatched → 레이블 수 제한"""
+    route = scope.get("route")
+    return getattr(route, "path", None) or "unmatched"
+
+class MetricsMiddleware:
+    """요청별 처리 시간, SQL 실행 횟수/시간 기록 (트레이싱이 켜져 있으면 요청 span 생성)"""
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        stats = RequestDbStats()
+        token = _request_db_stats.set(stats)
+        status = 500
+        start = time.perf_counter()
+
+        async def send_with_status(message: Message):
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            await send(message)
+
+        try:
+            with tracing.span(f"{scope['method']} {scope['path']}", **{"http.method": scope["method"]}) as span:
+                await self.app(scope, receive, send_with_status)
+                if span is not None:
+                    span.update_name(f"{scope['method']} {_route_label(scope)}")
+                    span.set_attribute("http.route", _route_label(scope))
+                    span.set_attribute("http.status_code", status)
+                    span.set_attribute("db.statement_count", stats.statements)
+        finally:
+            _request_db_stats.reset(token)
+            route = _route_label(scope)
+            HTTP_REQUEST_SECONDS.labels(scope["method"], route, str(status)).observe(time.perf_counter() - start)
+            HTTP_REQUEST_DB_STATEMENTS.labels(route).observe(stats.statements)
+            HTTP_REQUEST_DB_SECONDS.labels(route).observe(stats.seconds)
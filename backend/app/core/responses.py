@@ -0,0 +1,19 @@
+# orjson 기반 JSON 응답 (이미 직렬화된 bytes는 그대로 전송)
+
+from typing import Any
+
+import orjson
+from fastapi.responses import JSONResponse
+
+class ORJSONResponse(JSONResponse):
+    """
+    orjson으로 직렬화하는 JSON 응답 (date/datetime/dataclass 기본 지원)
+    bytes를 넘기면 다시 직렬화하지 않음 → 서비스에서 만든(캐시된) JSON을 그대로 반환할 때 사용
+    라우트에서 이 응답을 직접 반환하면 response_model 재검증/직렬화도 생략됨
+    """
+    media_type = "application/json"
+
+    def render(self, content: Any) -> bytes:
+        if isinstance(content, bytes):
+            return content
+        return orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS)
@@ -0,0 +1,51 @@
+# OpenTelemetry 트레이싱 (선택): OTEL_ENABLED이고 SDK/OTLP exporter가 설치되어 있으면 span 내보내기
+# 내보낼 주소 등은 OTel 표준 환경 변수(OTEL_EXPORTER_OTLP_ENDPOINT 등)로 설정
+
+import logging
+from contextlib import contextmanager
+from typing import Any, Iterator, Optional
+
+from .config import settings
+
+logger = logging.getLogger(__name__)
+
+_tracer: Optional[Any] = None
+_provider: Optional[Any] = None
+
+def init_tracing():
+    """트레이서 초기화 (비활성/패키지 없음이면 span은 아무것도 하지 않음)"""
+    global _tracer, _provider
+    if not settings.OTEL_ENABLED or _tracer is not None:
+        return
+    try:
+        from opentelemetry import trace
+        from opentelemetry.exporter.otlp.proto.http.trace_exporter import OTLPSpanExporter
+        from opentelemetry.sdk.resources import Resource
+        from opentelemetry.sdk.trace import TracerProvider
+        from opentelemetry.sdk.trace.export import BatchSpanProcessor
+    except ImportError:
+        logger.warning("⚠️ opentelemetry-sdk/opentelemetry-exporter-otlp 패키지가 없어 트레이싱을 건너뜁니다.")
+        return
+
+    _provider = TracerProvider(resource=Resource.create({"service.name": settings.OTEL_SERVICE_NAME}))
+    _provider.add_span_processor(BatchSpanProcessor(OTLPSpanExporter()))
+    trace.set_tracer_provider(_provider)
+    _tracer = trace.get_tracer(__name__)
+    logger.info("✅ OpenTelemetry 트레이싱을 시작합니다.")
+
+def shutdown_tracing():
+    """남은 span 내보내기 후 종료"""
+    global _tracer, _provider
+    if _provider is not None:
+        _provider.shutdown()
+    _tracer = None
+    _provider = None
+
+@contextmanager
+def span(name: str, **attributes: Any) -> Iterator[Optional[Any]]:
+    """현재 span의 하위 span (트레이싱이 꺼져 있으면 None)"""
+    if _tracer is None:
+        yield None
+        return
+    with _tracer.start_as_current_span(name, attributes=attributes) as current:
+        yield current
@@ -0,0 +1,44 @@
+from sqlalchemy import delete
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.future import select
+from sqlalchemy.sql import func
+from datetime import date
+from typing import Dict, Optional, Sequence
+
+from ..models import stock_model
+
+async def get_checkpoints(db: AsyncSession, stock_ids: Sequence[int]) -> Dict[int, stock_model.BackfillCheckpoint]:
+    """종목별 백필 체크포인트 조회 {stock_id: checkpoint}"""
+    result = await db.execute(
+        select(stock_model.BackfillCheckpoint).filter(stock_model.BackfillCheckpoint.stock_id.in_(stock_ids))
+    )
+    return {checkpoint.stock_id: checkpoint for checkpoint in result.scalars().all()}
+
+async def save_checkpoint(
+    db: AsyncSession,
+    stock_id: int,
+    start_date: date,
+    end_date: date,
+    last_date: Optional[date],
+    completed: bool,
+):
+    """백필 체크포인트 저장 (커밋은 호출자가 담당, 같은 트랜잭션의 가격 저장과 함께 커밋)"""
+    values = {
+        "start_date": start_date,
+        "end_date": end_date,
+        "last_date": last_date,
+        "completed": completed,
+    }
+    stmt = pg_insert(stock_model.BackfillCheckpoint).values(stock_id=stock_id, **values)
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[stock_model.BackfillCheckpoint.stock_id],
+        set_={**values, "updated_at": func.now()},
+    )
+    await db.execute(stmt)
+
+async def delete_checkpoints(db: AsyncSession, stock_ids: Sequence[int]):
+    """백필 체크포인트 삭제 (처음부터 다시 적재), 커밋은 호출자가 담당"""
+    await db.execute(
+        delete(stock_model.BackfillCheckpoint).where(stock_model.BackfillCheckpoint.stock_id.in_(stock_ids))
+    )
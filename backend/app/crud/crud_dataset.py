@@ -0,0 +1,26 @@
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.future import select
+from sqlalchemy.sql import func
+from datetime import datetime
+from typing import Optional, Tuple
+
+from ..models import stock_model
+
+async def get_dataset_version(db: AsyncSession, name: str) -> Optional[Tuple[int, datetime]]:
+    """데이터셋 버전 조회 (version, updated_at), 아직 없으면 None"""
+    result = await db.execute(
+        select(stock_model.DatasetVersion.version, stock_model.DatasetVersion.updated_at)
+        .filter(stock_model.DatasetVersion.name == name)
+    )
+    return result.tuples().first()
+
+async def bump_dataset_version(db: AsyncSession, name: str) -> Tuple[int, datetime]:
+    """데이터셋 버전 1 증가 후 (version, updated_at) 반환 (커밋은 호출자가 담당)"""
+    stmt = pg_insert(stock_model.DatasetVersion).values(name=name, version=1)
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[stock_model.DatasetVersion.name],
+        set_={"version": stock_model.DatasetVersion.version + 1, "updated_at": func.now()},
+    ).returning(stock_model.DatasetVersion.version, stock_model.DatasetVersion.updated_at)
+    result = await db.execute(stmt)
+    return result.tuples().one()
@@ -0,0 +1,33 @@
+from sqlalchemy import delete, insert
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.future import select
+from typing import Dict, Sequence, Set, Tuple
+
+from ..models import stock_model
+from .crud_price import UPSERT_CHUNK_SIZE
+
+async def get_failed_symbols(db: AsyncSession, api_source: str) -> Set[str]:
+    """직전 적재에서 실패한 심볼 조회"""
+    result = await db.execute(
+        select(stock_model.FetchFailure.symbol).filter(stock_model.FetchFailure.api_source == api_source)
+    )
+    return set(result.scalars().all())
+
+async def save_fetch_results(
+    db: AsyncSession, api_source: str, attempted: Sequence[str], failures: Dict[str, Tuple[str, int]]
+):
+    """
+    이번에 시도한 심볼의 실패 기록을 교체 (성공한 심볼은 삭제, 실패한 심볼은 {symbol: (사유, 시도 횟수)}로 저장)
+    커밋은 호출자가 담당
+    """
+    failure = stock_model.FetchFailure
+    attempted = list(attempted)
+    for i in range(0, len(attempted), UPSERT_CHUNK_SIZE):
+        await db.execute(
+            delete(failure).where(failure.api_source == api_source, failure.symbol.in_(attempted[i:i + UPSERT_CHUNK_SIZE]))
+        )
+    if failures:
+        await db.execute(insert(failure), [
+            {"api_source": api_source, "symbol": symbol, "error": error, "attempts": attempts}
+            for symbol, (error, attempts) in failures.items()
+        ])
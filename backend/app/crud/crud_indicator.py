@@ -0,0 +1,64 @@
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.future import select
+from sqlalchemy.sql import func
+from typing import Any, Dict, List, Mapping, Sequence
+
+from ..models import stock_model
+from .crud_price import UPSERT_CHUNK_SIZE
+
+# StockIndicator에 저장하는 컬럼 (stock_id, updated_at 제외)
+INDICATOR_COLUMNS = tuple(
+    column.name
+    for column in stock_model.StockIndicator.__table__.columns
+    if column.name not in ("stock_id", "updated_at")
+)
+
+async def get_indicators(db: AsyncSession, stock_ids: Sequence[int]) -> Dict[int, stock_model.StockIndicator]:
+    """종목별 지표 상태 조회 {stock_id: indicator}"""
+    result = await db.execute(
+        select(stock_model.StockIndicator).filter(stock_model.StockIndicator.stock_id.in_(stock_ids))
+    )
+    return {indicator.stock_id: indicator for indicator in result.scalars().all()}
+
+async def get_price_tails(db: AsyncSession, stock_ids: Sequence[int], bars: int) -> List[tuple]:
+    """
+    종목별 최근 bars개 일봉 (stock_id, date, high, low, close), stock_id/date 순
+    (stock_id, date) 인덱스 역방향 스캔 + 윈도 함수로 종목당 bars개만 읽음
+    """
+    price = stock_model.StockPrice
+    row_number = func.row_number().over(partition_by=price.stock_id, order_by=price.date.desc()).label("rn")
+    recent = (
+        select(price.stock_id, price.date, price.high_price, price.low_price, price.close_price, row_number)
+        .filter(price.stock_id.in_(stock_ids))
+        .subquery()
+    )
+    result = await db.execute(
+        select(recent.c.stock_id, recent.c.date, recent.c.high_price, recent.c.low_price, recent.c.close_price)
+        .filter(recent.c.rn <= bars)
+        .order_by(recent.c.stock_id, recent.c.date)
+    )
+    return result.tuples().all()
+
+async def get_price_closes(db: AsyncSession, stock_ids: Sequence[int]) -> List[tuple]:
+    """종목별 전체 종가 이력 (stock_id, date, close), stock_id/date 순 (지표 전체 재계산용)"""
+    price = stock_model.StockPrice
+    result = await db.execute(
+        select(price.stock_id, price.date, price.close_price)
+        .filter(price.stock_id.in_(stock_ids))
+        .order_by(price.stock_id, price.date)
+    )
+    return result.tuples().all()
+
+async def upsert_indicators(db: AsyncSession, rows: Sequence[Mapping[str, Any]]):
+    """지표 다중 행 upsert (stock_id 충돌 시 갱신), 커밋은 호출자가 담당"""
+    for i in range(0, len(rows), UPSERT_CHUNK_SIZE):
+        stmt = pg_insert(stock_model.StockIndicator).values(list(rows[i:i + UPSERT_CHUNK_SIZE]))
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[stock_model.StockIndicator.stock_id],
+            set_={
+                **{column: stmt.excluded[column] for column in INDICATOR_COLUMNS},
+                "updated_at": func.now(),
+            },
+        )
+        await db.execute(stmt)
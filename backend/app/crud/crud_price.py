@@ -1,11 +1,29 @@
+from sqlalchemy import delete, literal_column
+from sqlalchemy.dialects.postgresql import aggregate_order_by, array_agg, insert as pg_insert
 from sqlalchemy.future import select
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.sql import func
 from datetime import date
-from typing import Optional
+from typing import Any, Dict, List, Mapping, Optional, Sequence
 
 from ..models import stock_model
 from ..schemas import stock_schema
 
+# StockPrice → StockLatestQuote 로 복사되는 시세 컬럼
+LATEST_QUOTE_COLUMNS = (
+    "date",
+    "close_price",
+    "open_price",
+    "high_price",
+    "low_price",
+    "volume",
+    "change",
+    "percent_change",
+)
+
+# 다중 행 INSERT 1문장당 최대 행 수 (asyncpg 바인드 파라미터 한도 32767 이내)
+UPSERT_CHUNK_SIZE = 1000
+
 async def get_latest_price_data(db: AsyncSession, stock_id: int) -> Optional[date]:
     """특정 주식의 가장 최근 종가 날짜 조회"""
     result = await db.execute(
@@ -16,10 +34,15 @@ async def get_latest_price_data(db: AsyncSession, stock_id: int) -> Optional[dat
     )
     return result.scalar_one_or_none()
 
-async def create_stock_price(db: AsyncSession, price:stock_schema.StockPriceCreate) -> stock_model.StockPrice:
-    """새로운 주식 가격 정보 생성"""
+async def create_stock_price(
+    db: AsyncSession, price:stock_schema.StockPriceCreate, commit: bool = True
+) -> stock_model.StockPrice:
+    """새로운 주식 가격 정보 생성 (commit=False면 flush만 하고 커밋은 호출자가 담당)"""
     db_price = stock_model.StockPrice(**price.model_dump())
     db.add(db_price)
+    if not commit:
+        await db.flush()
+        return db_price
     await db.commit()
     await db.refresh(db_price)
     return db_price
@@ -32,4 +55,125 @@ async def get_latest_price_for_stock(db: AsyncSession, stock_id: int) -> Optiona
         .order_by(stock_model.StockPrice.date.desc())
         .limit(1)
     )
-    return result.scalar_one_or_none()
\ No newline at end of file
+    return result.scalar_one_or_none()
+
+async def get_close_before(db: AsyncSession, stock_id: int, before: date) -> Optional[float]:
+    """before 이전(미포함) 마지막 종가 조회 (전일 대비 변동 계산용)"""
+    result = await db.execute(
+        select(stock_model.StockPrice.close_price)
+        .filter(stock_model.StockPrice.stock_id == stock_id, stock_model.StockPrice.date < before)
+        .order_by(stock_model.StockPrice.date.desc())
+        .limit(1)
+    )
+    return result.scalar_one_or_none()
+
+async def upsert_stock_prices(db: AsyncSession, prices: Sequence[Dict[str, Any]]) -> List[Mapping[str, Any]]:
+    """
+    가격 정보 일괄 저장: INSERT ... ON CONFLICT (stock_id, date) DO UPDATE
+    저장된 행(id 포함)을 반환, 커밋은 호출자가 담당
+    """
+    # 같은 문장 안에서 같은 (stock_id, date)가 두 번 나오면 ON CONFLICT 오류 → 마지막 값만 사용
+    rows = list({(price["stock_id"], price["date"]): price for price in prices}.values())
+    update_columns = [column for column in LATEST_QUOTE_COLUMNS if column != "date"]
+
+    saved: List[Mapping[str, Any]] = []
+    for i in range(0, len(rows), UPSERT_CHUNK_SIZE):
+        stmt = pg_insert(stock_model.StockPrice).values(rows[i:i + UPSERT_CHUNK_SIZE])
+        stmt = stmt.on_conflict_do_update(
+            constraint="uq_stock_prices_stock_id_date",
+            set_={column: stmt.excluded[column] for column in update_columns},
+        ).returning(
+            stock_model.StockPrice.id,
+            stock_model.StockPrice.stock_id,
+            *(getattr(stock_model.StockPrice, column) for column in LATEST_QUOTE_COLUMNS),
+        )
+        result = await db.execute(stmt)
+        saved.extend(result.mappings().all())
+    return saved
+
+async def upsert_latest_quotes(db: AsyncSession, prices: Sequence[Mapping[str, Any]]):
+    """
+    최신 시세 스냅샷 일괄 갱신 (prices: id, stock_id, 시세 컬럼을 가진 행)
+    기존 스냅샷보다 과거 날짜면 무시, 커밋은 호출자가 담당
+    """
+    latest_by_stock: Dict[int, Mapping[str, Any]] = {}
+    for price in prices:
+        current = latest_by_stock.get(price["stock_id"])
+        if current is None or price["date"] >= current["date"]:
+            latest_by_stock[price["stock_id"]] = price
+
+    rows = [
+        {
+            "stock_id": price["stock_id"],
+            "price_id": price["id"],
+            **{column: price[column] for column in LATEST_QUOTE_COLUMNS},
+        }
+        for price in latest_by_stock.values()
+    ]
+    for i in range(0, len(rows), UPSERT_CHUNK_SIZE):
+        stmt = pg_insert(stock_model.StockLatestQuote).values(rows[i:i + UPSERT_CHUNK_SIZE])
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[stock_model.StockLatestQuote.stock_id],
+            set_={
+                "price_id": stmt.excluded.price_id,
+                **{column: stmt.excluded[column] for column in LATEST_QUOTE_COLUMNS},
+                "updated_at": func.now(),
+            },
+            where=stock_model.StockLatestQuote.date <= stmt.excluded.date,
+        )
+        await db.execute(stmt)
+
+async def rebuild_latest_quotes(db: AsyncSession) -> int:
+    """stock_prices 전체 이력에서 최신 시세 스냅샷 재구성 (커밋은 호출자가 담당)"""
+    price = stock_model.StockPrice
+    latest_prices = (
+        select(price.stock_id, price.id, *(getattr(price, column) for column in LATEST_QUOTE_COLUMNS))
+        .distinct(price.stock_id)
+        .order_by(price.stock_id, price.date.desc(), price.id.desc())
+    )
+
+    await db.execute(delete(stock_model.StockLatestQuote))
+    await db.execute(
+        pg_insert(stock_model.StockLatestQuote).from_select(
+            ["stock_id", "price_id", *LATEST_QUOTE_COLUMNS], latest_prices
+        )
+    )
+    result = await db.execute(select(func.count()).select_from(stock_model.StockLatestQuote))
+    return result.scalar_one()
+
+async def get_price_history(db: AsyncSession, stock_id: int, start: date, end: date) -> list[tuple]:
+    """기간별 일봉 조회 (date, open, high, low, close, volume), (stock_id, date) 인덱스 범위 스캔"""
+    price = stock_model.StockPrice
+    result = await db.execute(
+        select(price.date, price.open_price, price.high_price, price.low_price, price.close_price, price.volume)
+        .filter(price.stock_id == stock_id, price.date >= start, price.date <= end)
+        .order_by(price.date)
+    )
+    return result.tuples().all()
+
+async def get_price_history_aggregated(
+    db: AsyncSession, stock_id: int, start: date, end: date, period: str
+) -> list[tuple]:
+    """
+    기간별 주봉/월봉 집계 (period: week / month), SQL에서 OHLC 집계
+    봉의 날짜는 해당 기간의 첫 거래일
+    """
+    if period not in ("week", "month"):
+        raise ValueError(f"지원하지 않는 집계 단위입니다: {period}")
+    price = stock_model.StockPrice
+    # GROUP BY/ORDER BY가 같은 식으로 인식되도록 단위는 바인드 파라미터 대신 리터럴로 사용
+    bucket = func.date_trunc(literal_column(f"'{period}'"), price.date)
+    result = await db.execute(
+        select(
+            func.min(price.date),
+            array_agg(aggregate_order_by(price.open_price, price.date.asc()))[1],
+            func.max(price.high_price),
+            func.min(price.low_price),
+            array_agg(aggregate_order_by(price.close_price, price.date.desc()))[1],
+            func.sum(price.volume),
+        )
+        .filter(price.stock_id == stock_id, price.date >= start, price.date <= end)
+        .group_by(bucket)
+        .order_by(bucket)
+    )
+    return result.tuples().all()
\ No newline at end of file
@@ -1,10 +1,14 @@
+from sqlalchemy import RowMapping
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
-from sqlalchemy.sql import func
-from typing import Optional
+from sqlalchemy.sql import func, or_, tuple_
+from datetime import date, datetime
+from typing import Any, Dict, Optional, Sequence, Tuple
 
 from ..models import stock_model
 from ..schemas import stock_schema
+from .crud_price import UPSERT_CHUNK_SIZE
 
 async def get_stock_by_symbol(db: AsyncSession, symbol: str) -> Optional[stock_model.Stock]:
     """심볼로 주식 정보 조회"""
@@ -21,6 +25,27 @@ async def create_stock(db: AsyncSession, stock: stock_schema.StockCreate) -> sto
     await db.refresh(db_stock)
     return db_stock
 
+async def upsert_stocks(
+    db: AsyncSession, stocks: Sequence[Dict[str, Any]], update_columns: Sequence[str]
+) -> Dict[str, int]:
+    """
+    주식 정보 일괄 저장: INSERT ... ON CONFLICT (symbol) DO UPDATE (update_columns만 갱신)
+    {symbol: id} 반환, 커밋은 호출자가 담당
+    """
+    rows = list({stock["symbol"]: stock for stock in stocks}.values())
+    if not rows:
+        return {}
+
+    stock_ids: Dict[str, int] = {}
+    for i in range(0, len(rows), UPSERT_CHUNK_SIZE):
+        stmt = pg_insert(stock_model.Stock).values(rows[i:i + UPSERT_CHUNK_SIZE])
+        # update_columns가 없으면 symbol을 자기 자신으로 갱신 (DO NOTHING은 기존 행을 RETURNING하지 않음)
+        set_ = {column: stmt.excluded[column] for column in update_columns} or {"symbol": stmt.excluded.symbol}
+        stmt = stmt.on_conflict_do_update(index_elements=[stock_model.Stock.symbol], set_=set_)
+        result = await db.execute(stmt.returning(stock_model.Stock.symbol, stock_model.Stock.id))
+        stock_ids.update(result.tuples().all())
+    return stock_ids
+
 async def get_stocks_by_source(db: AsyncSession, api_source: str) -> list[stock_model.Stock]:
     """API 출처별 모든 주식 정보 조회"""
     result = await db.execute(
@@ -37,11 +62,201 @@ async def get_stocks_paginated(db: AsyncSession, skip: int, limit: int, market_t
     result = await db.execute(query.offset(skip).limit(limit))
     return result.scalars().all()
 
-async def count_stocks(db: AsyncSession, market_type: Optional[str] = None) -> int:
-    """주식 정보의 총 개수 조회"""
+async def count_stocks(
+    db: AsyncSession, market_type: Optional[str] = None, screener: Optional[stock_schema.StockScreener] = None
+) -> int:
+    """주식 정보의 총 개수 조회 (스크리너 조건 적용 시 최신 시세 스냅샷/지표 조인)"""
     query = select(func.count()).select_from(stock_model.Stock)
     if market_type:
         query = query.filter(stock_model.Stock.market_type == market_type)
+    if screener is not None:
+        # 필터만 사용 (정렬은 집계 쿼리에서 PostgreSQL 오류)
+        query = _apply_screener(_join_latest_quote_and_indicator(query), screener).order_by(None)
 
     result = await db.execute(query)
-    return result.scalar_one()
\ No newline at end of file
+    return result.scalar_one()
+
+# 스크리너 정렬 키 → 최신 시세 스냅샷 컬럼 (각각 (컬럼, stock_id) 인덱스)
+SCREENER_SORT_COLUMNS = {
+    "percent_change": stock_model.StockLatestQuote.percent_change,
+    "volume": stock_model.StockLatestQuote.volume,
+    "close": stock_model.StockLatestQuote.close_price,
+}
+
+def _apply_screener(query, screener: stock_schema.StockScreener):
+    """스크리너 필터/정렬 적용 (최신 시세 스냅샷/지표가 조인된 쿼리)"""
+    stock = stock_model.Stock
+    quote = stock_model.StockLatestQuote
+
+    if screener.exchange:
+        query = query.filter(stock.exchange == screener.exchange)
+    if screener.currency:
+        query = query.filter(stock.currency == screener.currency)
+
+    ranges = (
+        (quote.close_price, screener.min_price, screener.max_price),
+        (quote.volume, screener.min_volume, screener.max_volume),
+    )
+    for column, low, high in ranges:
+        if low is not None:
+            query = query.filter(column >= low)
+        if high is not None:
+            query = query.filter(column <= high)
+
+    if screener.min_from_52w_high is not None or screener.max_from_52w_high is not None:
+        # 52주 최고가: 시세 이력으로 계산한 값, 없으면 공급자 값
+        high_52w = func.coalesce(stock_model.StockIndicator.high_52w, stock.fifty_two_week_high)
+        query = query.filter(high_52w > 0)
+        # 하락률(%) = (high - close) / high * 100 → close 기준 범위로 변환
+        if screener.min_from_52w_high is not None:
+            query = query.filter(quote.close_price <= high_52w * (1 - screener.min_from_52w_high / 100))
+        if screener.max_from_52w_high is not None:
+            query = query.filter(quote.close_price >= high_52w * (1 - screener.max_from_52w_high / 100))
+
+    if screener.sort:
+        # 정렬 값이 없는 종목은 제외 → (컬럼, stock_id) 인덱스를 정방향/역방향으로 그대로 사용
+        column = SCREENER_SORT_COLUMNS[screener.sort]
+        query = query.filter(column.isnot(None))
+        if screener.order == "desc":
+            query = query.order_by(column.desc(), quote.stock_id.desc())
+        else:
+            query = query.order_by(column.asc(), quote.stock_id.asc())
+    return query
+
+def _join_latest_quote_and_indicator(query):
+    """Stock 기준 쿼리에 최신 시세 스냅샷/지표 LEFT JOIN (둘 다 stock_id PK)"""
+    return query.outerjoin(
+        stock_model.StockLatestQuote,
+        stock_model.StockLatestQuote.stock_id == stock_model.Stock.id,
+    ).outerjoin(
+        stock_model.StockIndicator,
+        stock_model.StockIndicator.stock_id == stock_model.Stock.id,
+    )
+
+# 목록/상세 응답 컬럼 (엔터티 대신 컬럼만 조회 → 행 매핑, 응답 필드 순서와 같음)
+# 최신 시세 컬럼은 quote_, 지표 컬럼은 indicator_ 접두사 (지표 증분 상태 컬럼은 제외)
+STOCK_RESPONSE_COLUMNS = (
+    "symbol", "name_en", "name_ko", "market_type", "api_source",
+    "exchange", "currency", "fifty_two_week_low", "fifty_two_week_high", "id",
+)
+QUOTE_RESPONSE_COLUMNS = (
+    "date", "close_price", "open_price", "high_price", "low_price",
+    "volume", "change", "percent_change",
+)
+INDICATOR_RESPONSE_COLUMNS = (
+    "date", "sma_20", "sma_50", "sma_200", "rsi_14", "macd", "macd_signal", "macd_hist",
+    "bb_upper", "bb_lower", "high_52w", "low_52w",
+)
+
+def _select_stock_rows():
+    """Stock + 최신 시세 스냅샷 + 지표 응답 컬럼 조회"""
+    return _join_latest_quote_and_indicator(
+        select(
+            *(getattr(stock_model.Stock, column) for column in STOCK_RESPONSE_COLUMNS),
+            stock_model.StockLatestQuote.price_id.label("quote_price_id"),
+            *(getattr(stock_model.StockLatestQuote, column).label(f"quote_{column}") for column in QUOTE_RESPONSE_COLUMNS),
+            *(getattr(stock_model.StockIndicator, column).label(f"indicator_{column}") for column in INDICATOR_RESPONSE_COLUMNS),
+        ).select_from(stock_model.Stock)
+    )
+
+async def get_stock_with_latest_quote(db: AsyncSession, symbol: str) -> Optional[RowMapping]:
+    """심볼로 단일 주식 조회 + 최신 시세 스냅샷 + 지표 (행 매핑)"""
+    result = await db.execute(_select_stock_rows().filter(stock_model.Stock.symbol == symbol))
+    return result.mappings().first()
+
+# 다중 종목 조회에서 선택 가능한 필드 → 컬럼 (최신 시세/지표 컬럼을 고르면 해당 테이블만 조인)
+BATCH_FIELD_COLUMNS = {
+    **{
+        column: getattr(stock_model.Stock, column)
+        for column in (
+            "id", "name_en", "name_ko", "market_type", "api_source",
+            "exchange", "currency", "fifty_two_week_low", "fifty_two_week_high",
+        )
+    },
+    **{column: getattr(stock_model.StockLatestQuote, column) for column in QUOTE_RESPONSE_COLUMNS},
+    **{column: getattr(stock_model.StockIndicator, column) for column in INDICATOR_RESPONSE_COLUMNS[1:]},
+}
+
+async def get_stock_fields_by_symbols(
+    db: AsyncSession, symbols: Sequence[str], fields: Sequence[str]
+) -> list[Dict[str, Any]]:
+    """
+    여러 심볼의 지정 필드만 조회 (symbol IN (...) 단일 쿼리), {symbol, 필드...} 행 목록
+    fields는 BATCH_FIELD_COLUMNS의 키
+    """
+    columns = [BATCH_FIELD_COLUMNS[field].label(field) for field in fields]
+    query = select(stock_model.Stock.symbol, *columns).filter(stock_model.Stock.symbol.in_(symbols))
+    tables = {BATCH_FIELD_COLUMNS[field].class_ for field in fields}
+    if stock_model.StockLatestQuote in tables:
+        query = query.outerjoin(
+            stock_model.StockLatestQuote,
+            stock_model.StockLatestQuote.stock_id == stock_model.Stock.id,
+        )
+    if stock_model.StockIndicator in tables:
+        query = query.outerjoin(
+            stock_model.StockIndicator,
+            stock_model.StockIndicator.stock_id == stock_model.Stock.id,
+        )
+
+    result = await db.execute(query)
+    return [dict(row) for row in result.mappings().all()]
+
+async def get_stocks_with_latest_quote_paginated(
+    db: AsyncSession,
+    skip: int,
+    limit: int,
+    market_type: Optional[str] = None,
+    screener: Optional[stock_schema.StockScreener] = None,
+) -> list[RowMapping]:
+    """주식 목록 페이징 조회 + 최신 시세 스냅샷 + 지표 (단일 쿼리, 행 매핑), 스크리너 정렬이 없으면 id 순"""
+    query = _select_stock_rows()
+    if market_type:
+        query = query.filter(stock_model.Stock.market_type == market_type)
+    if screener is not None:
+        query = _apply_screener(query, screener)
+    if screener is None or not screener.sort:
+        query = query.order_by(stock_model.Stock.id)
+
+    result = await db.execute(query.offset(skip).limit(limit))
+    return result.mappings().all()
+
+async def get_stocks_with_latest_quote_after(
+    db: AsyncSession,
+    after: Optional[Tuple[str, int]],
+    limit: int,
+    market_type: Optional[str] = None,
+) -> list[RowMapping]:
+    """주식 목록 커서(keyset) 조회: (symbol, id) 순서로 after 다음 limit개 + 최신 시세 스냅샷 + 지표 (행 매핑)"""
+    query = _select_stock_rows()
+    if market_type:
+        query = query.filter(stock_model.Stock.market_type == market_type)
+    if after is not None:
+        query = query.filter(tuple_(stock_model.Stock.symbol, stock_model.Stock.id) > tuple_(*after))
+
+    result = await db.execute(
+        query.order_by(stock_model.Stock.symbol, stock_model.Stock.id).limit(limit)
+    )
+    return result.mappings().all()
+
+async def get_stale_stocks(
+    db: AsyncSession,
+    api_source: str,
+    session_date: date,
+    refreshed_before: Optional[datetime] = None,
+) -> list[stock_model.Stock]:
+    """
+    갱신이 필요한 주식 조회 (단일 쿼리)
+    최신 시세가 없거나, session_date보다 과거이거나, refreshed_before 이전에 갱신된 종목
+    """
+    quote = stock_model.StockLatestQuote
+    stale = or_(quote.stock_id.is_(None), quote.date < session_date)
+    if refreshed_before is not None:
+        stale = or_(stale, quote.updated_at < refreshed_before)
+
+    result = await db.execute(
+        select(stock_model.Stock)
+        .outerjoin(quote, quote.stock_id == stock_model.Stock.id)
+        .filter(stock_model.Stock.api_source == api_source, stale)
+        .order_by(stock_model.Stock.id)
+    )
+    return result.scalars().all()
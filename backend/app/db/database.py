@@ -1,9 +1,26 @@
+from sqlalchemy import text
 from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession
 from sqlalchemy.orm import sessionmaker, declarative_base
 from app.core.config import settings
-from typing import AsyncGenerator
+from app.core import metrics
+from app.db.pool import engine_options, pool_stats
+from contextlib import asynccontextmanager
+from typing import Any, AsyncGenerator, AsyncIterator, Dict
 
-engine = create_async_engine(settings.DATABASE_URL, echo=False)
+# primary: 쓰기(적재/백필)와 LISTEN/NOTIFY, advisory lock
+engine = create_async_engine(settings.DATABASE_URL, **engine_options(settings.DATABASE_URL))
+
+# 읽기 전용 레플리카 (DATABASE_READ_URL이 없으면 primary 공유)
+read_engine = (
+    create_async_engine(settings.DATABASE_READ_URL, **engine_options(settings.DATABASE_READ_URL))
+    if settings.DATABASE_READ_URL
+    else engine
+)
+
+# SQL 실행 횟수/시간, 풀 게이지 수집
+metrics.instrument_engine(engine, "primary")
+if read_engine is not engine:
+    metrics.instrument_engine(read_engine, "replica")
 
 AsyncSessionLocal = sessionmaker(
     bind=engine,
@@ -11,8 +28,55 @@ AsyncSessionLocal = sessionmaker(
     expire_on_commit=False,
 )
 
+ReadSessionLocal = sessionmaker(
+    bind=read_engine,
+    class_=AsyncSession,
+    expire_on_commit=False,
+)
+
 Base = declarative_base()
 
 async def get_db() -> AsyncGenerator[AsyncSession, None]:
     async with AsyncSessionLocal() as session:
-        yield session
\ No newline at end of file
+        yield session
+
+async def get_read_db() -> AsyncGenerator[AsyncSession, None]:
+    """
+    읽기 전용 라우트용 세션 (레플리카가 있으면 레플리카)
+    레플리카는 primary보다 늦을 수 있으므로 방금 쓴 값을 다시 읽는 곳에서는 get_db 사용
+    """
+    async with ReadSessionLocal() as session:
+        yield session
+
+def get_pool_stats() -> Dict[str, Any]:
+    """엔진별 커넥션 풀 게이지 (레플리카가 없으면 primary만)"""
+    stats = {"primary": pool_stats(engine.pool)}
+    if read_engine is not engine:
+        stats["replica"] = pool_stats(read_engine.pool)
+    return stats
+
+async def dispose_engines():
+    """종료 시 풀의 연결 정리"""
+    await engine.dispose()
+    if read_engine is not engine:
+        await read_engine.dispose()
+
+@asynccontextmanager
+async def try_advisory_lock(key: int) -> AsyncIterator[bool]:
+    """
+    PostgreSQL 세션 advisory lock 획득 시도 (대기하지 않음)
+    획득 여부를 반환하고, 블록을 벗어나면 해제. PostgreSQL이 아니면 항상 획득한 것으로 처리
+    """
+    async with engine.connect() as conn:
+        if conn.dialect.name != "postgresql":
+            yield True
+            return
+
+        acquired = (await conn.execute(text("SELECT pg_try_advisory_lock(:key)"), {"key": key})).scalar()
+        await conn.commit()
+        try:
+            yield bool(acquired)
+        finally:
+            if acquired:
+                await conn.execute(text("SELECT pg_advisory_unlock(:key)"), {"key": key})
+                await conn.commit()
\ No newline at end of file
@@ -0,0 +1,96 @@
+# DB 커넥션 풀: 연결 대기 시간을 재는 풀 + 엔진 옵션 (Settings 기반)
+
+import time
+from typing import Any, Dict
+
+from sqlalchemy.engine import make_url
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+
+from ..core.config import settings
+
+class PoolWaitStats:
+    """풀에서 연결을 얻기까지 걸린 시간 (대기 없이 바로 얻은 경우 포함)"""
+
+    def __init__(self):
+        self.checkouts = 0
+        self.timeouts = 0
+        self.total_wait_seconds = 0.0
+        self.max_wait_seconds = 0.0
+
+    def record(self, seconds: float):
+        self.checkouts += 1
+        self.total_wait_seconds += seconds
+        self.max_wait_seconds = max(self.max_wait_seconds, seconds)
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {
+            "checkouts": self.checkouts,
+            "timeouts": self.timeouts,
+            "avg_wait_ms": round(self.total_wait_seconds / self.checkouts * 1000, 3) if self.checkouts else 0.0,
+            "max_wait_ms": round(self.max_wait_seconds * 1000, 3),
+        }
+
+class InstrumentedQueuePool(AsyncAdaptedQueuePool):
+    """
+    연결 획득 대기 시간/타임아웃을 기록하는 AsyncAdaptedQueuePool
+    풀을 다시 만들어도(dispose) 통계는 이어서 기록
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.wait_stats = PoolWaitStats()
+
+    def recreate(self) -> "InstrumentedQueuePool":
+        pool = super().recreate()
+        pool.wait_stats = self.wait_stats
+        return pool
+
+    def _do_get(self):
+        start = time.perf_counter()
+        try:
+            connection = super()._do_get()
+        except PoolTimeoutError:
+            self.wait_stats.timeouts += 1
+            raise
+        self.wait_stats.record(time.perf_counter() - start)
+        return connection
+
+def engine_options(url: str) -> Dict[str, Any]:
+    """
+    create_async_engine 옵션: 풀 크기/추가 연결/재생성 주기/대기 시간, 사용 전 확인, 구문 캐시
+    메모리 SQLite(단일 연결 StaticPool)는 풀 옵션 없이 기본값 사용
+    """
+    options: Dict[str, Any] = {
+        "echo": False,
+        "query_cache_size": settings.DB_QUERY_CACHE_SIZE,
+    }
+    parsed = make_url(url)
+    if parsed.get_backend_name() == "sqlite" and parsed.database in (None, "", ":memory:"):
+        return options
+
+    options.update(
+        poolclass=InstrumentedQueuePool,
+        pool_size=settings.DB_POOL_SIZE,
+        max_overflow=settings.DB_MAX_OVERFLOW,
+        pool_recycle=settings.DB_POOL_RECYCLE_SECONDS,
+        pool_timeout=settings.DB_POOL_TIMEOUT_SECONDS,
+        pool_pre_ping=settings.DB_POOL_PRE_PING,
+    )
+    if parsed.get_driver_name() == "asyncpg":
+        # 서버 측 prepared statement 캐시 (pgbouncer transaction 모드면 0)
+        options["connect_args"] = {"prepared_statement_cache_size": settings.DB_STATEMENT_CACHE_SIZE}
+    return options
+
+def pool_stats(pool: Any) -> Dict[str, Any]:
+    """풀 게이지: 크기, 사용 중/대기 중 연결 수, 추가(overflow) 연결 수, 연결 획득 대기 시간"""
+    if not isinstance(pool, InstrumentedQueuePool):
+        return {"pool": type(pool).__name__}
+    return {
+        "pool": type(pool).__name__,
+        "size": pool.size(),
+        "checked_out": pool.checkedout(),
+        "checked_in": pool.checkedin(),
+        "overflow": max(pool.overflow(), 0),
+        "wait": pool.wait_stats.as_dict(),
+    }
@@ -1,10 +1,14 @@
 # 앱 시작/종료 이벤트 (데이터 적재)
 
-from contextlib import asynccontextmanager
+import asyncio
+from contextlib import asynccontextmanager, suppress
 from fastapi import FastAPI
-from sqlalchemy.ext.asyncio import AsyncSession
-from ..db.database import Base, engine, AsyncSessionLocal
-from ..services import data_fetcher
+from typing import Optional
+from ..db.database import Base, engine, dispose_engines
+from ..services import data_fetcher, ingest_scheduler, quote_hub, symbol_search
+from ..services.ingest_state import ingest_progress
+from ..core import http_client, tracing
+from ..core.config import settings
 import logging
 
 logging.basicConfig(level=logging.INFO)
@@ -19,33 +23,97 @@ async def init_db():
     except Exception as e:
         logger.error(f"⛔ 데이터베이스 테이블을 생성하는 중에 오류가 발생했습니다: {e}")
 
+async def init_search_index():
+    """종목 검색 색인 생성 (실패해도 첫 검색 때 다시 시도)"""
+    try:
+        await symbol_search.rebuild_index()
+    except Exception as e:
+        logger.error(f"⛔ 종목 검색 색인을 만드는 중에 오류가 발생했습니다: {e}")
+
 async def run_startup_tasks():
-    """앱 시작 시 실행될 비동기 작업들"""
+    """앱 시작 시 실행될 비동기 작업들 (오류는 호출자에게 전달)"""
     logger.info("✅ 시작 작업 실행...")
 
-    try:
-        # 1. DB에 NASDAQ100 리스트 초기화
-        await data_fetcher.initialize_stock_list()
-
-        # 2. Twlevedata API에서 종가 업데이트
-        await data_fetcher.update_stock_prices_from_twelvedata()
+    # 1. DB에 제공자별 종목 목록 초기화 (Twelvedata: NASDAQ100)
+    await data_fetcher.initialize_stock_list()
 
-        # 3. 한투 API 데이터 로더 추가 예정
+    # 2. 제공자별 종가 업데이트 (제공자 간 동시 실행, 오래된 종목만, 레플리카 중 하나만)
+    #    새 제공자(한투 API 등)는 data_fetcher.PROVIDER_TYPES에 추가하고 MARKET_DATA_PROVIDERS로 선택
+    await ingest_scheduler.IngestScheduler().run_once()
 
-    except Exception as e:
-        logger.error(f"⛔ 시작 작업 중 오류 발생: {e}")
-    
     logger.info("✅ 시작 작업이 완료되었습니다.")
 
+class BackgroundIngest:
+    """
+    시작 작업을 백그라운드 태스크로 실행 (API는 즉시 요청을 받고, 적재 중에는 기존 데이터 제공)
+    실패 시 INGEST_RETRY_DELAY_SECONDS 후 최대 INGEST_MAX_ATTEMPTS회까지 재실행
+    이후 INGEST_SCHEDULE_ENABLED면 주기 적재 스케줄러 실행, 종료 시 취소
+    """
+
+    def __init__(self):
+        self._task: Optional[asyncio.Task] = None
+
+    def start(self):
+        self._task = asyncio.create_task(self._supervise(), name="background-ingest")
+
+    async def _supervise(self):
+        for attempt in range(1, settings.INGEST_MAX_ATTEMPTS + 1):
+            ingest_progress.start()
+            try:
+                await run_startup_tasks()
+            except asyncio.CancelledError:
+                ingest_progress.finish("cancelled")
+                raise
+            except Exception as e:
+                ingest_progress.finish("failed", error=str(e))
+                logger.error(f"⛔ 시작 작업 중 오류 발생 ({attempt}/{settings.INGEST_MAX_ATTEMPTS}): {e}")
+                if attempt < settings.INGEST_MAX_ATTEMPTS:
+                    await asyncio.sleep(settings.INGEST_RETRY_DELAY_SECONDS)
+                continue
+            ingest_progress.finish("succeeded")
+            break
+
+        if settings.INGEST_SCHEDULE_ENABLED:
+            await ingest_scheduler.IngestScheduler().run_forever()
+
+    async def stop(self):
+        """진행 중인 적재 취소 (이미 가져온 시세는 배치 저장기에서 마저 저장)"""
+        if self._task is None or self._task.done():
+            return
+        self._task.cancel()
+        with suppress(asyncio.CancelledError):
+            await self._task
+        logger.info("✅ 백그라운드 적재 작업을 취소했습니다.")
+
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     logger.info("✅ 애플리케이션 시작...")
 
+    tracing.init_tracing()
     await init_db()
-    
-    # asyncio.create_task: 앱 시작 속도 개선
-    await run_startup_tasks()
+    await init_search_index()
+
+    # 외부 API 공용 HTTP 클라이언트 (커넥션 재사용)
+    await http_client.init_http_client()
+
+    # 시작 작업은 백그라운드로 실행 → 요청 처리를 바로 시작
+    background_ingest = BackgroundIngest()
+    if settings.INGEST_ON_STARTUP:
+        background_ingest.start()
+
+    # 실시간 시세 알림 수신 (다른 레플리카의 적재 결과도 구독자에게 전달)
+    quote_listener: Optional[asyncio.Task] = None
+    if settings.QUOTE_STREAM_LISTEN:
+        quote_listener = asyncio.create_task(quote_hub.listen_for_quotes(), name="quote-listener")
 
     yield
 
+    if quote_listener is not None:
+        quote_listener.cancel()
+        with suppress(asyncio.CancelledError):
+            await quote_listener
+    await background_ingest.stop()
+    await http_client.close_http_client()
+    await dispose_engines()
+    tracing.shutdown_tracing()
     logger.info("✅ 애플리케이션 종료...")
@@ -1,11 +1,15 @@
 import uvicorn
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
-from .routers import stocks
+from .routers import stocks, health, metrics
 from .events.lifespan import lifespan
 from .db.database import Base, engine
+from .core.responses import ORJSONResponse
+from .core.compression import CompressionMiddleware
+from .core.metrics import MetricsMiddleware
+from .core.config import settings
 
-app = FastAPI(lifespan=lifespan)
+app = FastAPI(lifespan=lifespan, default_response_class=ORJSONResponse)
 
 app.add_middleware(
     CORSMiddleware,
@@ -15,7 +19,20 @@ app.add_middleware(
     allow_headers=["*"], # 교차-출처를 지원하는 HTTP 요청 헤더의 리스트
 )
 
+# 큰 목록 응답 압축 (작은 응답과 SSE 스트림은 그대로)
+app.add_middleware(
+    CompressionMiddleware,
+    minimum_size=settings.COMPRESSION_MINIMUM_SIZE,
+    compresslevel=settings.GZIP_COMPRESS_LEVEL,
+    brotli_quality=settings.BROTLI_QUALITY,
+)
+
+# 요청 지연/요청당 SQL 수 지표 (가장 바깥에서 압축 시간까지 포함)
+app.add_middleware(MetricsMiddleware)
+
 app.include_router(stocks.router)
+app.include_router(health.router)
+app.include_router(metrics.router)
 
 @app.get("/")
 def read_root():
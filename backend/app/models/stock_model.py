@@ -1,4 +1,4 @@
-from sqlalchemy import Column,Integer, String, Float, Date, func, ForeignKey
+from sqlalchemy import Column,Integer, String, Float, Date, DateTime, Boolean, func, ForeignKey, Index, UniqueConstraint
 from sqlalchemy.orm import relationship
 from ..db.database import Base
 import datetime
@@ -21,6 +21,14 @@ class Stock(Base):
     fifty_two_week_high = Column(Float, nullable=True)
 
     prices = relationship("StockPrice", back_populates="stock")
+    latest_quote = relationship("StockLatestQuote", back_populates="stock", uselist=False)
+    indicator = relationship("StockIndicator", back_populates="stock", uselist=False)
+
+    __table_args__ = (
+        # 커서(keyset) 페이징: ORDER BY symbol, id / WHERE (symbol, id) > (...)
+        Index("ix_stocks_symbol_id", symbol, id),
+        Index("ix_stocks_market_type_symbol_id", market_type, symbol, id),
+    )
 
 class StockPrice(Base):
     __tablename__ = "stock_prices"
@@ -37,6 +45,113 @@ class StockPrice(Base):
     change = Column(Float, nullable=True)
     percent_change = Column(Float, nullable=True)
 
-    percent_change = Column(Float, nullable=False)
+    stock = relationship("Stock", back_populates="prices")
+
+    __table_args__ = (
+        # 종목별 일자당 1행 (재실행 시 중복 방지, ON CONFLICT 대상)
+        # 종목별 최신/기간 가격 조회도 이 인덱스로 처리 (역방향 스캔)
+        UniqueConstraint("stock_id", "date", name="uq_stock_prices_stock_id_date"),
+    )
+
+class StockLatestQuote(Base):
+    """종목별 최신 시세 스냅샷 (StockPrice 적재 시 같은 트랜잭션에서 갱신)"""
+    __tablename__ = "stock_latest_quotes"
+
+    stock_id = Column(Integer, ForeignKey("stocks.id"), primary_key=True)
+    price_id = Column(Integer, nullable=False) # 원본 StockPrice.id
+    date = Column(Date, nullable=False)
+    close_price = Column(Float, nullable=False)
+
+    open_price = Column(Float, nullable=True)
+    high_price = Column(Float, nullable=True)
+    low_price = Column(Float, nullable=True)
+    volume = Column(Float, nullable=True)
+    change = Column(Float, nullable=True)
+    percent_change = Column(Float, nullable=True)
+
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
+
+    stock = relationship("Stock", back_populates="latest_quote")
+
+    __table_args__ = (
+        # 스크리너 상위 N개: ORDER BY <컬럼>, stock_id (DESC는 역방향 스캔) LIMIT N
+        Index("ix_stock_latest_quotes_percent_change_stock_id", percent_change, stock_id),
+        Index("ix_stock_latest_quotes_volume_stock_id", volume, stock_id),
+        Index("ix_stock_latest_quotes_close_price_stock_id", close_price, stock_id),
+    )
+
+
+class BackfillCheckpoint(Base):
+    """종목별 과거 시세 백필 진행 상황 (중단 후 재실행 시 이어서 적재)"""
+    __tablename__ = "backfill_checkpoints"
+
+    stock_id = Column(Integer, ForeignKey("stocks.id"), primary_key=True)
+    start_date = Column(Date, nullable=False) # 백필 목표 구간
+    end_date = Column(Date, nullable=False)
+    last_date = Column(Date, nullable=True) # 적재 완료된 마지막 날짜
+    completed = Column(Boolean, nullable=False, default=False)
+
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
+
+class FetchFailure(Base):
+    """제공자별 직전 시세 적재에서 실패한 종목 (프로세스가 바뀌어도 실패 종목만 다시 시도)"""
+    __tablename__ = "fetch_failures"
+
+    api_source = Column(String, primary_key=True)
+    symbol = Column(String, primary_key=True)
+    error = Column(String, nullable=True)
+    attempts = Column(Integer, nullable=False, default=0)
+
+    failed_at = Column(DateTime(timezone=True), server_default=func.now())
+
+class DatasetVersion(Base):
+    """
+    데이터셋 버전 (시세 적재/백필/지표 재계산이 커밋될 때마다 1 증가)
+    HTTP ETag/Last-Modified와 목록 캐시 키에 사용 → 레플리카가 여러 개여도 같은 값
+    """
+    __tablename__ = "dataset_versions"
+
+    name = Column(String, primary_key=True)
+    version = Column(Integer, nullable=False, default=0)
+
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
+
+class StockIndicator(Base):
+    """
+    종목별 최신 기술적 지표 (시세 적재 시 이전 상태에서 증분 갱신)
+    base_* 는 마지막 봉 직전까지의 재귀 지표 상태 (당일 시세가 다시 들어오면 여기서부터 재계산)
+    """
+    __tablename__ = "stock_indicators"
+
+    stock_id = Column(Integer, ForeignKey("stocks.id"), primary_key=True)
+    date = Column(Date, nullable=False) # 지표 기준일 (마지막 봉)
+    close_price = Column(Float, nullable=False)
+
+    sma_20 = Column(Float, nullable=True)
+    sma_50 = Column(Float, nullable=True)
+    sma_200 = Column(Float, nullable=True)
+    rsi_14 = Column(Float, nullable=True)
+    macd = Column(Float, nullable=True)
+    macd_signal = Column(Float, nullable=True)
+    macd_hist = Column(Float, nullable=True)
+    bb_upper = Column(Float, nullable=True) # 볼린저 밴드 (20일, 2σ), 중심선은 sma_20
+    bb_lower = Column(Float, nullable=True)
+    high_52w = Column(Float, nullable=True) # 최근 252거래일 고가/저가
+    low_52w = Column(Float, nullable=True)
+
+    # 재귀 지표 상태 (EMA/와일더 평활)
+    ema_12 = Column(Float, nullable=True)
+    ema_26 = Column(Float, nullable=True)
+    avg_gain_14 = Column(Float, nullable=True)
+    avg_loss_14 = Column(Float, nullable=True)
+    base_date = Column(Date, nullable=True)
+    base_close = Column(Float, nullable=True)
+    base_ema_12 = Column(Float, nullable=True)
+    base_ema_26 = Column(Float, nullable=True)
+    base_macd_signal = Column(Float, nullable=True)
+    base_avg_gain_14 = Column(Float, nullable=True)
+    base_avg_loss_14 = Column(Float, nullable=True)
+
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
 
-    stock = relationship("Stock", back_populates="prices")
\ No newline at end of file
+    stock = relationship("Stock", back_populates="indicator")
@@ -0,0 +1,53 @@
+from fastapi import APIRouter, Depends, Response
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+from ..db.database import get_db, get_read_db, get_pool_stats, read_engine, engine
+from ..services.ingest_state import ingest_progress
+
+router = APIRouter(
+    prefix="/health",
+    tags=["health"],
+)
+
+@router.get("/live")
+async def read_liveness():
+    """
+    프로세스 생존 여부
+    """
+    return {"status": "ok"}
+
+@router.get("/ready")
+async def read_readiness(
+    response: Response,
+    db: AsyncSession = Depends(get_db),
+    read_db: AsyncSession = Depends(get_read_db),
+):
+    """
+    요청 처리 가능 여부 (DB 연결, 레플리카가 있으면 레플리카 연결 포함) + 시세 적재 진행 상황
+    적재 중에도 기존 데이터를 제공하므로 ready
+    """
+    sessions = {"database": db}
+    if read_engine is not engine:
+        sessions["read_database"] = read_db
+
+    status = {}
+    for name, session in sessions.items():
+        try:
+            await session.execute(text("SELECT 1"))
+            status[name] = "ok"
+        except Exception as e:
+            status[name] = f"error: {e}"
+            response.status_code = 503
+
+    return {
+        "ready": all(value == "ok" for value in status.values()),
+        **status,
+        "ingest": ingest_progress.as_dict(),
+    }
+
+@router.get("/db/pool")
+async def read_pool_stats():
+    """
+    DB 커넥션 풀 게이지 (엔진별 사용 중/추가 연결 수, 연결 획득 대기 시간)
+    """
+    return get_pool_stats()
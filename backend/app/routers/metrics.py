@@ -0,0 +1,11 @@
+from fastapi import APIRouter, Response
+from prometheus_client import CONTENT_TYPE_LATEST, generate_latest
+
+router = APIRouter(tags=["metrics"])
+
+@router.get("/metrics", include_in_schema=False)
+async def read_metrics():
+    """
+    Prometheus 지표 (요청 지연, 요청당 SQL 수/시간, 외부 API 호출, 적재 결과, DB 커넥션 풀)
+    """
+    return Response(content=generate_latest(), media_type=CONTENT_TYPE_LATEST)
@@ -1,8 +1,15 @@
-from fastapi import APIRouter, Depends, Query
+import asyncio
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
+from fastapi.responses import StreamingResponse
+from pydantic import ValidationError
 from sqlalchemy.ext.asyncio import AsyncSession
-from typing import Literal
-from ..db.database import get_db
-from ..services import stock_service
+from typing import List, Literal, Optional
+from datetime import date
+from ..db.database import get_read_db
+from ..services import stock_service, price_history_service, quote_hub, symbol_search
+from ..core.config import settings
+from ..core import http_cache
+from ..core.responses import ORJSONResponse
 from ..schemas import stock_schema
 
 router = APIRouter(
@@ -11,20 +18,225 @@ router = APIRouter(
     responses={404: {"description": "Not found"}},
 )
 
+async def check_not_modified(request: Request, db: AsyncSession = Depends(get_read_db)) -> stock_service.DatasetVersion:
+    """
+    조건부 요청 처리: 클라이언트 캐시가 현재 데이터셋 버전과 같으면 조회 없이 304
+    (버전 확인 외에는 DB를 사용하지 않음, 버전도 DATASET_VERSION_TTL_SECONDS 동안 메모리 값 사용)
+    """
+    dataset_version = await stock_service.get_dataset_version(db)
+    if http_cache.is_not_modified(request.headers, dataset_version.version, dataset_version.updated_at):
+        raise HTTPException(
+            status_code=304,
+            headers=http_cache.cache_headers(dataset_version.version, dataset_version.updated_at),
+        )
+    return dataset_version
+
+def _cached_response(body: bytes, dataset_version: stock_service.DatasetVersion) -> ORJSONResponse:
+    """직렬화된 JSON + ETag/Last-Modified/Cache-Control"""
+    return ORJSONResponse(body, headers=http_cache.cache_headers(dataset_version.version, dataset_version.updated_at))
+
 @router.get("/", response_model=stock_schema.PaginatedStockResponse)
 async def read_stocks(
     page: int = Query(1, ge=1, description="페이지 번호"),
     size: int = Query(10, ge=1, le=100, description="페이지당 아이템 수"),
     market: Literal["all", "domestic", "overseas"] = Query("all", description="시장 구분"),
-    db: AsyncSession = Depends(get_db)
+    sort: Optional[Literal["percent_change", "volume", "close"]] = Query(None, description="정렬 기준 (값이 없는 종목은 제외)"),
+    order: Literal["desc", "asc"] = Query("desc", description="정렬 방향"),
+    min_price: Optional[float] = Query(None, ge=0, description="최소 종가"),
+    max_price: Optional[float] = Query(None, ge=0, description="최대 종가"),
+    min_volume: Optional[float] = Query(None, ge=0, description="최소 거래량"),
+    max_volume: Optional[float] = Query(None, ge=0, description="최대 거래량"),
+    min_from_52w_high: Optional[float] = Query(None, ge=0, le=100, description="52주 최고가 대비 최소 하락률(%)"),
+    max_from_52w_high: Optional[float] = Query(None, ge=0, le=100, description="52주 최고가 대비 최대 하락률(%) (예: 5 → 신고가 5% 이내)"),
+    exchange: Optional[str] = Query(None, description="거래소 (예: NASDAQ)"),
+    currency: Optional[str] = Query(None, description="통화 (예: USD)"),
+    db: AsyncSession = Depends(get_read_db),
+    dataset_version: stock_service.DatasetVersion = Depends(check_not_modified),
 ):
     """
     주식 목록을 페이징하여 조회 (전체/국내/해외)
+    스크리너: 등락률/거래량/종가 정렬 (상승률 상위, 거래량 상위 등), 가격/거래량/52주 신고가 거리 범위, 거래소/통화 필터
     """
-    paginated_stocks = await stock_service.get_paginated_stock_list(
+    try:
+        screener = stock_schema.StockScreener(
+            sort=sort,
+            order=order,
+            min_price=min_price,
+            max_price=max_price,
+            min_volume=min_volume,
+            max_volume=max_volume,
+            min_from_52w_high=min_from_52w_high,
+            max_from_52w_high=max_from_52w_high,
+            exchange=exchange,
+            currency=currency,
+        )
+    except ValidationError as e:
+        raise HTTPException(status_code=400, detail=str(e.errors()[0]["ctx"]["error"]))
+
+    # 캐시된 JSON을 그대로 반환 (response_model 재검증/직렬화 생략)
+    body = await stock_service.get_paginated_stock_list_json(
         db=db,
         page=page,
         size=size,
-        market=market
+        market=market,
+        screener=screener,
+        dataset_version=dataset_version.version,
+    )
+    return _cached_response(body, dataset_version)
+
+@router.get("/cursor", response_model=stock_schema.CursorStockResponse)
+async def read_stocks_by_cursor(
+    cursor: Optional[str] = Query(None, description="이전 응답의 next_cursor (첫 페이지는 생략)"),
+    size: int = Query(10, ge=1, le=100, description="페이지당 아이템 수"),
+    market: Literal["all", "domestic", "overseas"] = Query("all", description="시장 구분"),
+    include_total: bool = Query(False, description="총 아이템 개수 포함 여부 (COUNT 쿼리 추가)"),
+    db: AsyncSession = Depends(get_read_db),
+    dataset_version: stock_service.DatasetVersion = Depends(check_not_modified),
+):
+    """
+    주식 목록을 커서 기반으로 조회 (페이지 깊이와 무관하게 일정한 비용)
+    """
+    try:
+        body = await stock_service.get_cursor_stock_list_json(
+            db=db,
+            cursor=cursor,
+            size=size,
+            market=market,
+            include_total=include_total,
+            dataset_version=dataset_version.version,
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    return _cached_response(body, dataset_version)
+
+@router.get("/cache/stats")
+async def read_stock_list_cache_stats():
+    """
+    주식 목록 응답 캐시 통계 (적중/미스/축출)
+    """
+    return stock_service.get_stock_list_cache_stats()
+
+@router.get("/batch", response_model=stock_schema.StockBatchResponse)
+async def read_stock_batch(
+    symbols: str = Query(..., description="심볼 목록 (쉼표 구분, 예: AAPL,MSFT)"),
+    fields: Optional[str] = Query(None, description="반환할 필드 (쉼표 구분, 예: close_price,percent_change / 생략 시 기본 필드)"),
+    db: AsyncSession = Depends(get_read_db),
+    dataset_version: stock_service.DatasetVersion = Depends(check_not_modified),
+):
+    """
+    여러 종목을 한 번에 조회 (관심 종목 목록용, 요청한 필드만 반환)
+    """
+    symbol_list = [symbol.strip().upper() for symbol in symbols.split(",") if symbol.strip()]
+    if not symbol_list:
+        raise HTTPException(status_code=400, detail="심볼을 1개 이상 입력하세요.")
+    if len(symbol_list) > settings.STOCK_BATCH_MAX_SYMBOLS:
+        raise HTTPException(status_code=400, detail=f"심볼은 최대 {settings.STOCK_BATCH_MAX_SYMBOLS}개까지 조회할 수 있습니다.")
+    field_list = [field.strip() for field in fields.split(",") if field.strip()] if fields else None
+
+    try:
+        body = await stock_service.get_stock_batch_json(db=db, symbols=symbol_list, fields=field_list)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    return _cached_response(body, dataset_version)
+
+@router.get("/search", response_model=List[stock_schema.StockSearchResult])
+async def search_stocks(
+    q: str = Query(..., min_length=1, max_length=50, description="티커, 영문명, 한글명 또는 한글 초성 (예: AAPL, apple, 애플, ㅇㅍ)"),
+    limit: int = Query(10, ge=1, le=50, description="최대 결과 수"),
+):
+    """
+    종목 검색/자동완성 (메모리 내 색인, DB 조회 없음)
+    """
+    return ORJSONResponse(symbol_search.search(q, limit))
+
+@router.get("/stream")
+async def stream_stocks(
+    request: Request,
+    symbols: Optional[str] = Query(None, description="구독할 심볼 (쉼표 구분, 생략 시 전체)"),
+):
+    """
+    실시간 시세 스트림 (Server-Sent Events, 적재 커밋 시 `quote` 이벤트로 델타 전달)
+    처리가 밀려 큐가 가득 찬 구독자는 연결을 끊음 (클라이언트는 재연결 후 목록 API로 동기화)
+    """
+    symbol_set = None
+    if symbols:
+        symbol_set = {symbol.strip().upper() for symbol in symbols.split(",") if symbol.strip()}
+        if len(symbol_set) > settings.QUOTE_STREAM_MAX_SYMBOLS:
+            raise HTTPException(status_code=400, detail=f"심볼은 최대 {settings.QUOTE_STREAM_MAX_SYMBOLS}개까지 구독할 수 있습니다.")
+
+    subscription = quote_hub.hub.subscribe(symbol_set)
+
+    async def event_stream():
+        try:
+            yield b"retry: 3000\n\n"
+            while True:
+                try:
+                    message = await asyncio.wait_for(subscription.queue.get(), timeout=settings.QUOTE_STREAM_KEEPALIVE_SECONDS)
+                except asyncio.TimeoutError:
+                    if await request.is_disconnected():
+                        break
+                    yield b": keep-alive\n\n"
+                    continue
+                if message is None:
+                    # 느린 구독자로 판단되어 끊김
+                    yield b"event: dropped\ndata: {}\n\n"
+                    break
+                yield message
+        finally:
+            quote_hub.hub.unsubscribe(subscription)
+
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
     )
-    return paginated_stocks
\ No newline at end of file
+
+@router.get("/stream/stats")
+async def read_stream_stats():
+    """
+    실시간 시세 스트림 통계 (구독자 수/전달한 델타 수/끊은 구독자 수)
+    """
+    return quote_hub.hub.stats()
+
+@router.get("/{symbol}/prices", response_model=stock_schema.PriceSeriesResponse)
+async def read_stock_prices(
+    symbol: str,
+    from_: Optional[date] = Query(None, alias="from", description="시작일 (기본값: to 기준 1년 전)"),
+    to: Optional[date] = Query(None, description="종료일 (기본값: 오늘)"),
+    interval: Literal["daily", "weekly", "monthly"] = Query("daily", description="봉 단위 (주봉/월봉은 SQL 집계)"),
+    max_points: Optional[int] = Query(None, ge=3, le=10000, description="최대 포인트 수 (LTTB로 축소, 차트용)"),
+    db: AsyncSession = Depends(get_read_db),
+    dataset_version: stock_service.DatasetVersion = Depends(check_not_modified),
+):
+    """
+    기간별 시세 조회 (열 단위 배열: dates/opens/highs/lows/closes/volumes)
+    """
+    try:
+        series = await price_history_service.get_price_series(
+            db=db,
+            symbol=symbol.upper(),
+            start=from_,
+            end=to,
+            interval=interval,
+            max_points=max_points
+        )
+    except price_history_service.StockNotFoundError:
+        raise HTTPException(status_code=404, detail=f"{symbol}을(를) 찾을 수 없습니다.")
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    return _cached_response(series.model_dump_json().encode(), dataset_version)
+
+@router.get("/{symbol}", response_model=stock_schema.StockResponse)
+async def read_stock(
+    symbol: str,
+    db: AsyncSession = Depends(get_read_db),
+    dataset_version: stock_service.DatasetVersion = Depends(check_not_modified),
+):
+    """
+    주식 상세 조회 (최신 시세 + 기술적 지표)
+    """
+    try:
+        body = await stock_service.get_stock_detail_json(db=db, symbol=symbol.upper())
+    except stock_service.StockNotFoundError:
+        raise HTTPException(status_code=404, detail=f"{symbol}을(를) 찾을 수 없습니다.")
+    return _cached_response(body, dataset_version)
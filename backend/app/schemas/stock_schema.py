@@ -1,6 +1,6 @@
-from pydantic import BaseModel
+from pydantic import BaseModel, model_validator
 from datetime import date
-from typing import List, Optional
+from typing import Any, Dict, List, Literal, Optional
 
 class StockPriceBase(BaseModel):
     date: date
@@ -39,16 +39,93 @@ class StockBase(BaseModel):
 class StockCreate(StockBase):
     pass
 
+class StockIndicatorResponse(BaseModel):
+    """기술적 지표 (date 종가 기준, 이력이 부족한 지표는 None)"""
+    date: date
+    sma_20: Optional[float] = None
+    sma_50: Optional[float] = None
+    sma_200: Optional[float] = None
+    rsi_14: Optional[float] = None
+    macd: Optional[float] = None
+    macd_signal: Optional[float] = None
+    macd_hist: Optional[float] = None
+    bb_upper: Optional[float] = None
+    bb_lower: Optional[float] = None
+    high_52w: Optional[float] = None
+    low_52w: Optional[float] = None
+
+    class Config:
+        from_attributes = True
+
 class StockResponse(StockBase):
     id: int
     latest_price: Optional[StockPriceResponse] = None
+    indicators: Optional[StockIndicatorResponse] = None
+
+    class Config:
+        from_attributes = True
+
+class StockScreener(BaseModel):
+    """주식 목록 스크리너 조건 (None이면 미적용, 가격/거래량은 최신 시세 스냅샷 기준)"""
+    sort: Optional[Literal["percent_change", "volume", "close"]] = None
+    order: Literal["desc", "asc"] = "desc"
+    min_price: Optional[float] = None
+    max_price: Optional[float] = None
+    min_volume: Optional[float] = None
+    max_volume: Optional[float] = None
+    min_from_52w_high: Optional[float] = None # 52주 최고가 대비 하락률(%)
+    max_from_52w_high: Optional[float] = None
+    exchange: Optional[str] = None
+    currency: Optional[str] = None
+
+    class Config:
+        frozen = True
+
+    @model_validator(mode="after")
+    def check_ranges(self) -> "StockScreener":
+        """최솟값이 최댓값보다 크면 오류 (결과가 항상 비므로)"""
+        for name in ("price", "volume", "from_52w_high"):
+            low, high = getattr(self, f"min_{name}"), getattr(self, f"max_{name}")
+            if low is not None and high is not None and low > high:
+                raise ValueError(f"min_{name}({low})이 max_{name}({high})보다 큽니다.")
+        return self
+
+class StockSearchResult(BaseModel):
+    id: int
+    symbol: str
+    name_en: Optional[str] = None
+    name_ko: Optional[str] = None
 
     class Config:
         from_attributes = True
 
+class StockBatchResponse(BaseModel):
+    """다중 종목 조회 (items: symbol + 요청한 필드만, 요청 순서)"""
+    fields: List[str]
+    items: List[Dict[str, Any]]
+    missing: List[str] # 존재하지 않는 심볼
+
 class PaginatedStockResponse(BaseModel):
     total_items: int
     total_pages: int
     page: int
     size: int
-    items: List[StockResponse]
\ No newline at end of file
+    items: List[StockResponse]
+
+class CursorStockResponse(BaseModel):
+    size: int
+    next_cursor: Optional[str] = None # 마지막 페이지면 None
+    total_items: Optional[int] = None # include_total=true 일 때만 계산
+    items: List[StockResponse]
+
+class PriceSeriesResponse(BaseModel):
+    """기간별 시세 (열 단위 배열: 같은 인덱스가 같은 봉)"""
+    symbol: str
+    interval: str
+    count: int
+    dates: List[date]
+    opens: List[Optional[float]]
+    highs: List[Optional[float]]
+    lows: List[Optional[float]]
+    closes: List[float]
+    volumes: List[Optional[float]]
\ No newline at end of file
@@ -1,172 +1,251 @@
-# 외부 API 호출 및 데이터 저장 로직
+# 시세 적재 오케스트레이터: 제공자별 API 호출(각자의 속도 제한/동시 실행 제한)을 동시에 실행 → 공용 배치 저장 단계
 
-import httpx
 import asyncio
-from datetime import date
-from typing import Optional, Dict, Any
+import time
+from datetime import date, datetime, timezone
+from typing import Optional, Dict, Any, Callable, List, Sequence, Tuple
 
 from ..db.database import AsyncSessionLocal
-from ..core.config import settings, NASDAQ_100_SYMBOLS
-from ..crud import crud_stock, crud_price
-from ..schemas import stock_schema
-from ..models import stock_model
+from ..core.config import settings
+from ..core import metrics, tracing
+from ..crud import crud_stock, crud_fetch
+from . import ingest_pipeline, fetch_scheduler, symbol_search, stock_service
+from .market_data import MarketDataProvider, create_scheduler, chunk_symbols
+from .twelvedata_provider import TwelvedataProvider
+from .fake_provider import FakeProvider
+from .ingest_state import ingest_progress
 
 import logging # 코드 실행 상태를 기록하기 위한 표준 모듈
 
 logging.basicConfig(level=logging.INFO) # INFO 이상의 로그 출력
 logger = logging.getLogger(__name__) # 현재 모듈 이름을 가진 로거 객체 생성
 
-def _safe_float_cast(value: Optional[str]) -> Optional[float]:
-    """문자열을 float로 변환"""
-    if value is None:
-        return None
-    try:
-        return float(value)
-    except (ValueError, TypeError):
-        return None
-
-async def initialize_stock_list():
+# MARKET_DATA_PROVIDERS 이름 → 제공자 클래스
+PROVIDER_TYPES = {
+    TwelvedataProvider.name: TwelvedataProvider,
+    FakeProvider.name: FakeProvider,
+}
+
+# 생성된 제공자 (분당 크레딧 버킷을 실행 간 공유하도록 프로세스당 1개)
+_providers: Dict[str, MarketDataProvider] = {}
+
+# 제공자 → 이 시각 이전에 갱신된 시세도 다시 가져옴 (None이면 세션 시세가 있는 종목은 건너뜀)
+# 제공자마다 자기 거래소 캘린더로 계산 (예: IngestScheduler.refreshed_before)
+StaleCutoff = Callable[[MarketDataProvider], Optional[datetime]]
+
+# 제공자별 직전 종가 업데이트 결과 (이 프로세스 기준, 실패 종목은 fetch_failures 테이블에 저장)
+last_fetch_reports: Dict[str, fetch_scheduler.FetchReport] = {}
+
+def get_provider(name: str) -> MarketDataProvider:
+    """이름으로 제공자 조회 (없으면 생성)"""
+    provider = _providers.get(name)
+    if provider is None:
+        provider_type = PROVIDER_TYPES.get(name)
+        if provider_type is None:
+            raise ValueError(f"알 수 없는 시세 제공자입니다: {name}")
+        provider = _providers[name] = provider_type()
+    return provider
+
+def provider_names() -> List[str]:
+    """MARKET_DATA_PROVIDERS에 설정된 제공자 이름"""
+    return [name.strip() for name in settings.MARKET_DATA_PROVIDERS.split(",") if name.strip()]
+
+def get_providers(names: Optional[Sequence[str]] = None) -> List[MarketDataProvider]:
+    """적재 대상 제공자 (기본값: MARKET_DATA_PROVIDERS), 설정이 없는 제공자는 제외"""
+    if names is None:
+        names = provider_names()
+    providers = []
+    for name in names:
+        provider = get_provider(name)
+        if not provider.is_configured():
+            logger.error(f"⛔ {name} API 키가 설정되지 않았습니다. 이 제공자는 건너뜁니다.")
+            continue
+        providers.append(provider)
+    return providers
+
+async def initialize_stock_list(providers: Optional[Sequence[MarketDataProvider]] = None):
     """
-    nasdaq100_symbols.txt → Stock 테이블에 초기화
+    제공자별 종목 목록 → Stock 테이블에 초기화 (목록은 동시에 조회, 다중 행 upsert, 커밋 1회)
     """
-    logger.info(f"✅ {len(NASDAQ_100_SYMBOLS)}개 심볼의 주식 목록을 초기화합니다...")
+    providers = get_providers() if providers is None else providers
+    listings = await asyncio.gather(*(provider.list_symbols() for provider in providers))
+    stock_rows = [row for rows in listings for row in rows]
+
+    logger.info(f"✅ {len(stock_rows)}개 심볼의 주식 목록을 초기화합니다...")
+    ingest_progress.set_phase("stock_list", total=len(stock_rows))
+
     async with AsyncSessionLocal() as db:
-        for symbol, name_ko in NASDAQ_100_SYMBOLS:
-            db_stock = await crud_stock.get_stock_by_symbol(db, symbol)
-            if not db_stock:
-                stock_in = stock_schema.StockCreate(
-                    symbol=symbol,
-                    name_en=symbol,
-                    name_ko=name_ko,
-                    market_type="overseas",
-                    api_source="twelvedata"
-                )
-                await crud_stock.create_stock(db, stock_in)
-
-    logger.info("✅ NASDAQ100 목록 초기화가 완료되었습니다.")
-
-async def fetch_twelvedata_quote_data(symbol: str, api_key: str) -> Optional[Dict[str, Any]]:
-    """Twelvedata API: 해외 주식 상세 정보(Quote) 가져오기"""
-    url = f"{settings.TWELVEDATA_BASE_URL}/quote?symbol={symbol}&apikey={api_key}"
+        # 이미 있는 종목은 한글명만 목록 기준으로 갱신 (name_en 등은 API 값 유지)
+        await crud_stock.upsert_stocks(db, stock_rows, update_columns=("name_ko",))
+        await db.commit()
 
-    try:
-        async with httpx.AsyncClient() as client:
-            response = await client.get(url)
-            response.raise_for_status()
-            data = response.json()
-
-            extracted_data = {
-                "name_en": data.get("name"),
-                "exchange": data.get("exchange"),
-                "currency": data.get("currency"),
-                "fifty_two_week_low": _safe_float_cast(data.get("fifty_two_week", {}).get("low")),
-                "fifty_two_week_high": _safe_float_cast(data.get("fifty_two_week", {}).get("high")),
-
-                "open_price": _safe_float_cast(data.get("open")),
-                "high_price": _safe_float_cast(data.get("high")),
-                "low_price": _safe_float_cast(data.get("low")),
-                "volume": _safe_float_cast(data.get("volume")),
-                "change": _safe_float_cast(data.get("change")),
-                "percent_change": _safe_float_cast(data.get("percent_change")),
-            }
-
-            # 1. 종가 (close 또는 previous_close)
-            if data.get("is_market_open") == True and data.get("close"):
-                 extracted_data["close_price"] = _safe_float_cast(data.get("close"))
-            elif data.get("previous_close"):
-                extracted_data["close_price"] = _safe_float_cast(data.get("previous_close"))
-            elif data.get("close"): # Fallback
-                extracted_data["close_price"] = _safe_float_cast(data.get("close"))
-            else:
-                logger.warning(f"⚠️ API 응답에서 {symbol}에 대한 종가를 찾을 수 없습니다: {data}")
-                return None
-            
-            return extracted_data
-
-    except httpx.HTTPStatusError as e:
-        logger.error(f"⛔ {symbol}을(를) 가져오는 중에 HTTP 오류가 발생했습니다: {e}")
-    except Exception as e:
-        logger.error(f"⛔ {symbol}을(를) 가져오는 중에 오류가 발생했습니다: {e}")
-    return None
-
-async def update_stock_prices_from_twelvedata():
+    # 한글명이 바뀌었으면 검색 색인 재생성
+    if symbol_search.index.has_changes(stock_rows):
+        await symbol_search.rebuild_index()
+        # 목록/상세 응답의 한글명도 바뀜 → 데이터셋 버전 증가
+        await stock_service.invalidate_stock_list_cache()
+
+    ingest_progress.advance(done=len(stock_rows))
+    logger.info(f"✅ 주식 목록 초기화가 완료되었습니다. ({', '.join(provider.name for provider in providers)})")
+
+async def fetch_quotes_batch(provider: MarketDataProvider, symbols: List[str]) -> Dict[str, Optional[Dict[str, Any]]]:
     """
-    twlevedata API 사용: 해외 주식 종가 업데이트
+    종목 목록을 제공자의 요청 1회 분량씩 나눠 요청하고 결과를 합침 (저장하지 않음)
+    (속도 제한/동시 실행 제한/재시도 적용), {symbol: 시세 또는 None} 반환
     """
-    logger.info("✅ Twelvedata에서 종가 업데이트를 시작합니다...")
-    api_key = settings.TWELVEDATA_API_KEY
-    if not api_key:
-        logger.error("⛔ Twlevedata API 키가 설정되지 않았습니다. 업데이트를 건너뜁니다.")
-        return
-    
-    today = date.today()
-    stocks_to_fetch = []
-
-    # 세션 잠깐 사용, 필요한 데이터만 가져옴
+    results: Dict[str, Optional[Dict[str, Any]]] = {symbol: None for symbol in symbols}
+
+    async def worker(job: fetch_scheduler.FetchJob) -> Dict[str, str]:
+        quotes, errors = await provider.fetch_quotes(job.keys)
+        results.update(quotes)
+        return errors
+
+    jobs = [fetch_scheduler.FetchJob(keys=chunk) for chunk in chunk_symbols(provider, symbols)]
+    await create_scheduler(provider).run(jobs, worker)
+    return results
+
+async def _select_targets(
+    providers: Sequence[MarketDataProvider],
+    only_failed: bool,
+    session_date: Optional[date],
+    refreshed_before: Optional[StaleCutoff],
+    now: datetime,
+) -> Dict[str, Tuple[date, List[str]]]:
+    """제공자별 (세션 날짜, 갱신 대상 심볼), 세션 날짜/기준 시각은 제공자 캘린더로 계산, 세션 1개에서 제공자마다 단일 쿼리"""
+    targets: Dict[str, Tuple[date, List[str]]] = {}
     async with AsyncSessionLocal() as db:
-        all_stocks = await crud_stock.get_stocks_by_source(db, api_source="twelvedata")
-        for stock in all_stocks:
-            latest_data_in_db = await crud_price.get_latest_price_data(db, stock.id)
-            if latest_data_in_db != today:
-                stocks_to_fetch.append(stock)
-            else:
-                logger.info(f"✅ {stock.symbol} 건너뛰기: 오늘의 종가가 이미 존재합니다.")
-
-    # 세션이 닫힌 후, API 호출 작업 리스트 생성
-    tasks = []
-    for stock in stocks_to_fetch:
-        # DB에서 가장 최근 날짜 확인
-        tasks.append(fetch_and_save_price(stock.symbol, api_key, today))
-
-    await asyncio.gather(*tasks)
-    logger.info("✅ Twelvedata의 종가 업데이트가 완료되었습니다.")
-
-async def fetch_and_save_price(symbol: str, api_key: str, fetch_date: date):
-    """단일 종목 상세 정보를 비동기로 가져와 Stock은 업데이트, StockPrice는 생성"""
-
-    # 1. API에서 상세 데이터 호출
-    quote_data = await fetch_twelvedata_quote_data(symbol, api_key)
-
-    if quote_data is None or quote_data.get("close_price") is None:
-        logger.warning(f"⚠️ {symbol}의 가격 정보를 가져오지 못했습니다.")
-        return
-
-    # 2. DB 세션을 열고, Stock과 StockPrice 동시 처리
+        for provider in providers:
+            provider_session_date = session_date or provider.calendar.latest_session_date(now)
+            stocks = await crud_stock.get_stale_stocks(
+                db,
+                api_source=provider.name,
+                session_date=provider_session_date,
+                refreshed_before=refreshed_before(provider) if refreshed_before else None,
+            )
+            symbols = [stock.symbol for stock in stocks]
+            logger.info(f"✅ {provider.name} 갱신 대상 {len(symbols)}개 종목 (세션 {provider_session_date})")
+
+            if only_failed:
+                failed_symbols = await crud_fetch.get_failed_symbols(db, provider.name)
+                symbols = [symbol for symbol in symbols if symbol in failed_symbols]
+                logger.info(f"✅ {provider.name} 직전 실행에서 실패한 {len(symbols)}개 종목만 다시 시도합니다.")
+
+            targets[provider.name] = (provider_session_date, symbols)
+    return targets
+
+async def _fetch_provider_quotes(
+    provider: MarketDataProvider,
+    symbols: List[str],
+    session_date: date,
+    writer: ingest_pipeline.QuoteBatchWriter,
+) -> Tuple[fetch_scheduler.FetchReport, float]:
+    """제공자 1개의 시세를 제공자 한도에 맞춰 가져와 공용 저장 단계에 전달, (보고서, 소요 시간) 반환"""
+
+    def on_job_done(job: fetch_scheduler.FetchJob, report: fetch_scheduler.FetchReport):
+        failed = sum(1 for key in job.keys if not report.outcomes[key].ok)
+        ingest_progress.advance(done=len(job.keys), failed=failed)
+
+    async def worker(job: fetch_scheduler.FetchJob) -> Dict[str, str]:
+        return await fetch_prices(provider, job.keys, session_date, writer)
+
+    started_at = time.perf_counter()
+    with tracing.span(f"ingest {provider.name}_quotes", **{"ingest.symbols": len(symbols)}):
+        jobs = [fetch_scheduler.FetchJob(keys=chunk) for chunk in chunk_symbols(provider, symbols)]
+        report = await create_scheduler(provider).run(jobs, worker, on_job_done=on_job_done)
+    return report, time.perf_counter() - started_at
+
+async def update_stock_prices(
+    providers: Optional[Sequence[MarketDataProvider]] = None,
+    only_failed: bool = False,
+    session_date: Optional[date] = None,
+    refreshed_before: Optional[StaleCutoff] = None,
+    now: Optional[datetime] = None,
+) -> Dict[str, fetch_scheduler.FetchReport]:
+    """
+    제공자별 종가 업데이트 (제공자 간 동시 실행, 저장은 배치 저장기 1개 공유)
+    now: 기준 시각 (기본값: 현재 시각), 제공자마다 자기 캘린더로 가장 최근 세션을 구해 시세 날짜로 사용
+    session_date: 모든 제공자에 같은 세션 날짜를 강제 (벤치마크 등, 주기 적재는 사용하지 않음)
+    refreshed_before: 제공자별로 이 시각 이전에 갱신된 시세도 다시 가져옴 (장중 주기 갱신)
+    only_failed=True면 직전 실행(다른 프로세스 포함)에서 실패한 종목만 다시 시도
+    {제공자 이름: 결과 보고서} 반환
+    """
+    providers = get_providers() if providers is None else providers
+    if not providers:
+        logger.error("⛔ 사용할 수 있는 시세 제공자가 없습니다. 업데이트를 건너뜁니다.")
+        return {}
+
+    logger.info(f"✅ 종가 업데이트를 시작합니다... ({', '.join(provider.name for provider in providers)})")
+
+    # 세션 잠깐 사용, 갱신이 필요한 종목만 조회
+    now = now or datetime.now(timezone.utc)
+    targets = await _select_targets(providers, only_failed, session_date, refreshed_before, now)
+    ingest_progress.set_phase("quotes", total=sum(len(symbols) for _, symbols in targets.values()))
+
+    # 세션이 닫힌 후, 제공자별 API 호출 (각자의 속도 제한/재시도) → 공용 배치 저장
+    started_at = time.perf_counter()
+    try:
+        async with ingest_pipeline.QuoteBatchWriter() as writer:
+            results = await asyncio.gather(*(
+                _fetch_provider_quotes(provider, targets[provider.name][1], targets[provider.name][0], writer)
+                for provider in providers
+            ))
+    except BaseException:
+        for provider in providers:
+            metrics.observe_ingest_run(f"{provider.name}_quotes", time.perf_counter() - started_at, None)
+        raise
+
+    failed_writes = set(writer.failed_symbols)
+    reports: Dict[str, fetch_scheduler.FetchReport] = {}
+    for provider, (report, elapsed) in zip(providers, results):
+        report.mark_failed([symbol for symbol in report.outcomes if symbol in failed_writes], "DB 저장 실패")
+        reports[provider.name] = last_fetch_reports[provider.name] = report
+        metrics.observe_ingest_run(f"{provider.name}_quotes", elapsed, report)
+
+        summary = report.summary()
+        logger.info(
+            f"✅ {provider.name}의 종가 업데이트가 완료되었습니다. "
+            f"(대상 {summary['total']}건, 성공 {summary['succeeded']}건, 실패 {summary['failed']}건, {elapsed:.1f}초)"
+        )
+        if report.failed:
+            logger.warning(f"⚠️ {provider.name} 실패 종목: {', '.join(sorted(report.failed))}")
+
+    # 실패 종목 저장 (별도 워커 프로세스/재시작 후에도 only_failed로 이어서 재시도)
+    await _save_fetch_failures(reports)
+    return reports
+
+async def _save_fetch_failures(reports: Dict[str, fetch_scheduler.FetchReport]):
+    """제공자별 실패 종목 저장 (다음 only_failed 실행에서 사용, 저장 실패는 기록만 함)"""
     async with AsyncSessionLocal() as db:
         try:
-            # 2-1. Stock 모델 업데이트 (기본 정보)
-            # 이 세션에서 stock 객체를 다시 가져와야 함 (Managed 상태)
-            db_stock = await crud_stock.get_stock_by_symbol(db, symbol)
-            if not db_stock:
-                logger.error(f"⛔ {symbol}을(를) DB에서 찾을 수 없어 업데이트/저장에 실패했습니다.")
-                return
-
-            db_stock.name_en = quote_data.get("name_en")
-            db_stock.exchange = quote_data.get("exchange")
-            db_stock.currency = quote_data.get("currency")
-            db_stock.fifty_two_week_low = quote_data.get("fifty_two_week_low")
-            db_stock.fifty_two_week_high = quote_data.get("fifty_two_week_high")
-            
-            # 2-2. StockPrice 모델 생성 (일별 시세)
-            price_in = stock_schema.StockPriceCreate(
-                stock_id=db_stock.id,
-                date=fetch_date,
-                close_price=quote_data["close_price"],
-                open_price=quote_data.get("open_price"),
-                high_price=quote_data.get("high_price"),
-                low_price=quote_data.get("low_price"),
-                volume=quote_data.get("volume"),
-                change=quote_data.get("change"),
-                percent_change=quote_data.get("percent_change")
-            )
-            
-            db.add(db_stock)
-            await crud_price.create_stock_price(db, price_in)
-            
-            logger.info(f"✅ {symbol}의 정보 및 가격이 성공적으로 저장/업데이트되었습니다.")
-            
+            for name, report in reports.items():
+                failures = {
+                    key: (outcome.error, outcome.attempts)
+                    for key, outcome in report.outcomes.items() if not outcome.ok
+                }
+                await crud_fetch.save_fetch_results(db, name, list(report.outcomes), failures)
+            await db.commit()
         except Exception as e:
             await db.rollback()
-            logger.error(f"⛔ {symbol}의 정보를 저장하는 중 오류가 발생했습니다: {e}")
-
-# 한투 API 추가 예정
\ No newline at end of file
+            logger.error(f"⛔ 실패 종목을 저장하는 중 오류가 발생했습니다: {e}")
+
+async def fetch_prices(
+    provider: MarketDataProvider,
+    symbols: List[str],
+    fetch_date: date,
+    writer: ingest_pipeline.QuoteBatchWriter,
+) -> Dict[str, str]:
+    """여러 종목 시세를 요청 1회로 가져와 배치 저장 파이프라인에 전달, {실패 symbol: 사유} 반환"""
+    quotes, errors = await provider.fetch_quotes(symbols)
+
+    for symbol, quote_data in quotes.items():
+        await writer.add(ingest_pipeline.FetchedQuote(
+            symbol=symbol,
+            fetch_date=fetch_date,
+            data=quote_data,
+            market_type=provider.market_type,
+            api_source=provider.name,
+        ))
+
+    for symbol, message in errors.items():
+        logger.warning(f"⚠️ {symbol}의 가격 정보를 가져오지 못했습니다: {message}")
+    return errors
@@ -0,0 +1,144 @@
+# 가짜 시세 제공자 (오프라인 테스트): 네트워크 없이 심볼/날짜별로 항상 같은 합성 시세와 일봉 생성
+# 응답 지연, 재시도 대상 오류 비율을 설정해 스케줄러/일괄 저장 단계를 그대로 재현
+#
+# 사용: MARKET_DATA_PROVIDERS=fake (또는 twelvedata,fake) FAKE_PROVIDER_SYMBOLS=500 FAKE_PROVIDER_LATENCY_MS=50
+
+import asyncio
+import math
+import random
+from datetime import date, timedelta
+from typing import Any, AsyncIterator, Dict, List, Optional, Sequence, Tuple
+
+from ..core.clock import Clock, SystemClock
+from ..core.config import settings
+from ..core.market_calendar import US_EQUITY_CALENDAR
+from ..schemas import stock_schema
+from .fetch_scheduler import RetryableFetchError, TokenBucket
+from .market_data import ProviderLimits
+
+# 합성 시세: 기준가 × (1 + 추세 ± 노이즈), 52주 고가/저가는 이 범위로 계산
+_TREND_AMPLITUDE = 0.15
+_NOISE = 0.02
+
+class FakeProvider:
+    """
+    심볼 FAKE0000 ~ FAKE{n-1}, 미국 시장 캘린더
+    시세는 clock 기준 가장 최근 세션 날짜로 생성 (테스트는 FakeClock을 넘겨 날짜 고정)
+    """
+
+    name = "fake"
+    market_type = "overseas"
+    calendar = US_EQUITY_CALENDAR
+
+    def __init__(
+        self,
+        n_symbols: Optional[int] = None,
+        latency_ms: Optional[float] = None,
+        error_rate: Optional[float] = None,
+        seed: int = 0,
+        clock: Optional[Clock] = None,
+    ):
+        self.n_symbols = n_symbols if n_symbols is not None else settings.FAKE_PROVIDER_SYMBOLS
+        self.latency_ms = latency_ms if latency_ms is not None else settings.FAKE_PROVIDER_LATENCY_MS
+        self.error_rate = error_rate if error_rate is not None else settings.FAKE_PROVIDER_ERROR_RATE
+        self.clock = clock or SystemClock()
+        self.limiter = TokenBucket(rate_per_minute=self.limits.credits_per_minute)
+        self._rng = random.Random(seed)
+        self.requests = 0 # 받은 요청 수 (시세 + 일봉 페이지)
+
+    @property
+    def limits(self) -> ProviderLimits:
+        return ProviderLimits(
+            credits_per_minute=settings.FAKE_PROVIDER_CREDITS_PER_MINUTE,
+            quote_batch_size=50,
+            max_concurrency=settings.FETCH_MAX_CONCURRENCY,
+            history_page_size=5000,
+        )
+
+    def is_configured(self) -> bool:
+        return True
+
+    @property
+    def symbols(self) -> List[str]:
+        return [f"FAKE{i:04d}" for i in range(self.n_symbols)]
+
+    async def _request(self):
+        """요청 1회: 지연 후 error_rate 확률로 재시도 대상 오류"""
+        self.requests += 1
+        if self.latency_ms:
+            await asyncio.sleep(self.latency_ms / 1000)
+        if self._rng.random() < self.error_rate:
+            raise RetryableFetchError("가짜 제공자 오류 (HTTP 429)")
+
+    @staticmethod
+    def _base_price(symbol: str) -> float:
+        return random.Random(symbol).uniform(10, 500)
+
+    def bar(self, symbol: str, day: date) -> Dict[str, Any]:
+        """심볼/날짜별로 항상 같은 일봉 (이전 날짜와 무관하게 계산 → 페이지를 나눠 받아도 이어짐)"""
+        rng = random.Random(f"{symbol}:{day.isoformat()}")
+        base = self._base_price(symbol)
+        phase = base % (2 * math.pi)
+        close = base * (1 + _TREND_AMPLITUDE * math.sin(day.toordinal() / 20 + phase) + rng.uniform(-_NOISE, _NOISE))
+        open_ = close * (1 + rng.uniform(-_NOISE, _NOISE))
+        return {
+            "date": day,
+            "open": round(open_, 4),
+            "high": round(max(open_, close) * (1 + rng.uniform(0, _NOISE)), 4),
+            "low": round(min(open_, close) * (1 - rng.uniform(0, _NOISE)), 4),
+            "close": round(close, 4),
+            "volume": float(rng.randint(100_000, 10_000_000)),
+        }
+
+    def quote(self, symbol: str, session_date: date) -> Dict[str, Any]:
+        """session_date 일봉 + 직전 세션 종가 기준 등락 → 저장용 시세"""
+        bar = self.bar(symbol, session_date)
+        prev_close = self.bar(symbol, self.calendar.previous_trading_day(session_date))["close"]
+        base = self._base_price(symbol)
+        change = bar["close"] - prev_close
+        return {
+            "name_en": f"Fake {symbol[4:]} Inc.",
+            "exchange": "FAKE",
+            "currency": "USD",
+            "fifty_two_week_low": round(base * (1 - _TREND_AMPLITUDE - _NOISE), 4),
+            "fifty_two_week_high": round(base * (1 + _TREND_AMPLITUDE + _NOISE), 4),
+            "close_price": bar["close"],
+            "open_price": bar["open"],
+            "high_price": bar["high"],
+            "low_price": bar["low"],
+            "volume": bar["volume"],
+            "change": round(change, 4),
+            "percent_change": round(change / prev_close * 100, 4),
+        }
+
+    async def list_symbols(self) -> List[Dict[str, Any]]:
+        return [
+            stock_schema.StockCreate(
+                symbol=symbol,
+                name_en=f"Fake {symbol[4:]} Inc.",
+                name_ko=f"가짜 종목 {symbol[4:]}",
+                market_type=self.market_type,
+                api_source=self.name,
+            ).model_dump()
+            for symbol in self.symbols
+        ]
+
+    async def fetch_quotes(self, symbols: Sequence[str]) -> Tuple[Dict[str, Dict[str, Any]], Dict[str, str]]:
+        await self._request()
+        session_date = self.calendar.latest_session_date(self.clock.now())
+        known = set(self.symbols)
+        quotes = {symbol: self.quote(symbol, session_date) for symbol in symbols if symbol in known}
+        errors = {symbol: "응답 없음" for symbol in symbols if symbol not in known}
+        return quotes, errors
+
+    async def stream_history(self, symbol: str, start: date, end: date, page_size: int) -> AsyncIterator[Dict[str, Any]]:
+        """Twelvedata와 같이 구간에 page_size개보다 많은 봉이 있으면 최신 쪽 page_size개만 (과거 → 최신 순)"""
+        await self._request()
+        days: List[date] = []
+        day = end
+        while day >= start and len(days) < page_size:
+            if self.calendar.is_trading_day(day):
+                days.append(day)
+            day -= timedelta(days=1)
+        for day in reversed(days):
+            yield self.bar(symbol, day)
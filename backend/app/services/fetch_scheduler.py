@@ -0,0 +1,178 @@
+# 외부 API 호출 스케줄러: 토큰 버킷 속도 제한 + 동시 실행 제한 + 지수 백오프 재시도
+# 공급자와 무관 (Twelvedata, 한투 API 등에서 공통 사용)
+
+import asyncio
+import logging
+import random
+import time
+from dataclasses import dataclass, field
+from typing import Awaitable, Callable, Dict, List, Optional, Sequence
+
+logger = logging.getLogger(__name__)
+
+class RetryableFetchError(Exception):
+    """재시도 대상 오류 (429, 5xx, 네트워크 오류), retry_after: 서버가 알려준 대기 시간(초)"""
+
+    def __init__(self, message: str, retry_after: Optional[float] = None):
+        super().__init__(message)
+        self.retry_after = retry_after
+
+class TokenBucket:
+    """
+    분당 크레딧 한도를 지키는 토큰 버킷
+    capacity만큼 몰아서 쓸 수 있고, 이후에는 rate_per_minute 속도로 충전됨
+    """
+
+    def __init__(self, rate_per_minute: float, capacity: Optional[float] = None):
+        self.rate_per_second = rate_per_minute / 60
+        self.capacity = capacity if capacity is not None else rate_per_minute
+        self._tokens = self.capacity
+        self._updated_at = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    def _refill(self):
+        now = time.monotonic()
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated_at) * self.rate_per_second)
+        self._updated_at = now
+
+    async def acquire(self, tokens: float = 1):
+        """
+        토큰이 충분해질 때까지 대기 후 차감 (대기 순서대로 처리)
+        capacity보다 큰 요청은 버킷이 가득 차면 전부 차감 → 잔량이 음수가 되고 다음 요청이 부족분만큼 더 대기
+        """
+        required = min(tokens, self.capacity)
+        async with self._lock:
+            self._refill()
+            while self._tokens < required:
+                await asyncio.sleep((required - self._tokens) / self.rate_per_second)
+                self._refill()
+            self._tokens -= tokens
+
+@dataclass
+class FetchJob:
+    """요청 1회 분량의 작업 (keys: 결과를 보고할 단위, 예: 심볼 목록)"""
+    keys: List[str]
+    cost: float = 0 # 소모 크레딧 (0이면 len(keys))
+
+    def __post_init__(self):
+        if not self.cost:
+            self.cost = len(self.keys)
+
+@dataclass
+class FetchOutcome:
+    """단일 key 처리 결과"""
+    key: str
+    ok: bool
+    attempts: int
+    error: Optional[str] = None
+
+@dataclass
+class FetchReport:
+    """실행 전체 결과 (key별 성공/실패)"""
+    outcomes: Dict[str, FetchOutcome] = field(default_factory=dict)
+    started_at: float = field(default_factory=time.time)
+    finished_at: Optional[float] = None
+
+    @property
+    def succeeded(self) -> List[str]:
+        return [key for key, outcome in self.outcomes.items() if outcome.ok]
+
+    @property
+    def failed(self) -> List[str]:
+        return [key for key, outcome in self.outcomes.items() if not outcome.ok]
+
+    def mark_failed(self, keys: Sequence[str], error: str):
+        """스케줄러 밖 단계(예: DB 저장)에서 실패한 key 반영"""
+        for key in keys:
+            outcome = self.outcomes.get(key)
+            attempts = outcome.attempts if outcome else 0
+            self.outcomes[key] = FetchOutcome(key=key, ok=False, attempts=attempts, error=error)
+
+    def summary(self) -> Dict[str, int]:
+        return {"total": len(self.outcomes), "succeeded": len(self.succeeded), "failed": len(self.failed)}
+
+# worker(job) → {실패 key: 사유} (나머지 key는 성공), 재시도하려면 RetryableFetchError 발생
+FetchWorker = Callable[[FetchJob], Awaitable[Optional[Dict[str, str]]]]
+
+# 작업 1개 처리가 끝날 때마다 호출 (진행 상황 보고용)
+JobDoneCallback = Callable[[FetchJob, FetchReport], None]
+
+class FetchScheduler:
+    """작업 목록을 속도 제한/동시 실행 제한/재시도 정책에 따라 실행"""
+
+    def __init__(
+        self,
+        limiter: TokenBucket,
+        max_concurrency: int,
+        max_retries: int,
+        backoff_base_seconds: float,
+        backoff_max_seconds: float,
+    ):
+        self.limiter = limiter
+        self.max_concurrency = max_concurrency
+        self.max_retries = max_retries
+        self.backoff_base_seconds = backoff_base_seconds
+        self.backoff_max_seconds = backoff_max_seconds
+
+    def _backoff_delay(self, attempt: int, retry_after: Optional[float]) -> float:
+        """지수 백오프 + full jitter, 서버가 Retry-After를 주면 그 이상 대기"""
+        cap = min(self.backoff_max_seconds, self.backoff_base_seconds * 2 ** (attempt - 1))
+        delay = random.uniform(0, cap)
+        if retry_after is not None:
+            delay = max(delay, retry_after)
+        return delay
+
+    async def _run_job(
+        self,
+        job: FetchJob,
+        worker: FetchWorker,
+        report: FetchReport,
+        semaphore: asyncio.Semaphore,
+        on_job_done: Optional[JobDoneCallback],
+    ):
+        async with semaphore:
+            await self._attempt_job(job, worker, report)
+        if on_job_done:
+            on_job_done(job, report)
+
+    async def _attempt_job(self, job: FetchJob, worker: FetchWorker, report: FetchReport):
+        """작업 1개를 재시도 정책에 따라 실행하고 key별 결과 기록"""
+        attempt = 0
+        while True:
+            attempt += 1
+            await self.limiter.acquire(job.cost)
+            try:
+                failures = await worker(job) or {}
+            except RetryableFetchError as e:
+                if attempt > self.max_retries:
+                    logger.error(f"⛔ {','.join(job.keys)} 재시도 {self.max_retries}회 초과: {e}")
+                    for key in job.keys:
+                        report.outcomes[key] = FetchOutcome(
+                            key=key, ok=False, attempts=attempt, error=f"재시도 초과: {e}"
+                        )
+                    return
+                delay = self._backoff_delay(attempt, e.retry_after)
+                logger.warning(f"⚠️ {','.join(job.keys)} 재시도 {attempt}/{self.max_retries} ({delay:.1f}초 후): {e}")
+                await asyncio.sleep(delay)
+                continue
+            except Exception as e:
+                logger.error(f"⛔ {','.join(job.keys)} 처리 중 오류가 발생했습니다: {e}")
+                failures = {key: str(e) for key in job.keys}
+
+            for key in job.keys:
+                error = failures.get(key)
+                report.outcomes[key] = FetchOutcome(key=key, ok=error is None, attempts=attempt, error=error)
+            return
+
+    async def run(
+        self,
+        jobs: Sequence[FetchJob],
+        worker: FetchWorker,
+        on_job_done: Optional[JobDoneCallback] = None,
+    ) -> FetchReport:
+        """모든 작업 실행 후 key별 결과 보고서 반환"""
+        report = FetchReport()
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        await asyncio.gather(*(self._run_job(job, worker, report, semaphore, on_job_done) for job in jobs))
+        report.finished_at = time.time()
+        return report
@@ -0,0 +1,203 @@
+# 과거 일봉 백필: 제공자 일봉 스트리밍 → 다중 행 upsert, 종목별 체크포인트 (제공자 간 동시 실행)
+
+import asyncio
+import logging
+import time
+from datetime import date, datetime, timedelta, timezone
+from typing import Any, Dict, List, Optional, Sequence
+
+from ..core import metrics, tracing
+from ..core.config import settings
+from ..crud import crud_backfill, crud_price, crud_stock
+from ..db.database import AsyncSessionLocal
+from . import data_fetcher, fetch_scheduler, indicator_engine, stock_service
+from .market_data import MarketDataProvider, create_scheduler
+
+logger = logging.getLogger(__name__)
+
+# 스트리밍 중 모아서 INSERT할 행 수
+INSERT_CHUNK_SIZE = crud_price.UPSERT_CHUNK_SIZE
+
+def _to_price_row(stock_id: int, bar: Dict[str, Any], prev_close: Optional[float]) -> Optional[Dict[str, Any]]:
+    """일봉 → StockPrice 행 (종가가 없으면 None)"""
+    close = bar.get("close")
+    if close is None:
+        return None
+    change = close - prev_close if prev_close is not None else None
+    return {
+        "stock_id": stock_id,
+        "date": bar["date"],
+        "close_price": close,
+        "open_price": bar.get("open"),
+        "high_price": bar.get("high"),
+        "low_price": bar.get("low"),
+        "volume": bar.get("volume"),
+        "change": change,
+        "percent_change": change / prev_close * 100 if change is not None and prev_close else None,
+    }
+
+def _window_end(provider: MarketDataProvider, cursor: date, end: date, page_size: int) -> date:
+    """cursor부터 영업일 page_size일째 되는 날 (end 이하), 구간 1개가 요청 1회 분량이 되도록 나눔"""
+    day, trading_days = cursor, 0
+    while day < end:
+        if provider.calendar.is_trading_day(day):
+            trading_days += 1
+            if trading_days >= page_size:
+                break
+        day += timedelta(days=1)
+    return day
+
+async def backfill_symbol(provider: MarketDataProvider, stock_id: int, symbol: str, start: date, end: date) -> int:
+    """
+    한 종목의 [start, end] 일봉 적재, 저장한 봉 수 반환
+    과거 → 최신 순으로 영업일 page_size일씩 구간을 나눠 적재
+    제공자는 구간의 최신 쪽 page_size개만 주므로, 페이지가 꽉 차면 가장 이른 봉 전날까지로 다시 요청 (구간 시작까지)
+    구간마다 (가격 + 최신 시세 스냅샷 + 체크포인트)를 한 트랜잭션으로 커밋 → 중단 시 다음 구간부터 재개
+    첫 요청 크레딧은 스케줄러가, 이후 요청은 여기서 차감
+    """
+    page_size = min(settings.BACKFILL_PAGE_SIZE, provider.limits.history_page_size)
+
+    async with AsyncSessionLocal() as db:
+        checkpoint = (await crud_backfill.get_checkpoints(db, [stock_id])).get(stock_id)
+        cursor = start
+        if checkpoint and checkpoint.start_date <= start and checkpoint.last_date:
+            cursor = max(start, checkpoint.last_date + timedelta(days=1))
+        prev_close = await crud_price.get_close_before(db, stock_id, cursor)
+
+    requests = 0
+
+    async def fetch_window(window_start: date, window_end: date) -> List[Dict[str, Any]]:
+        """[window_start, window_end] 일봉 전체 (과거 → 최신 순)"""
+        nonlocal requests
+        bars: Dict[date, Dict[str, Any]] = {}
+        request_end = window_end
+        while True:
+            if requests:
+                await provider.limiter.acquire(1)
+            requests += 1
+            page = [bar async for bar in provider.stream_history(symbol, window_start, request_end, page_size)]
+            bars.update((bar["date"], bar) for bar in page)
+            if len(page) < page_size:
+                break
+            earliest = min(bar["date"] for bar in page)
+            if earliest <= window_start:
+                break
+            request_end = earliest - timedelta(days=1)
+        return [bars[day] for day in sorted(bars)]
+
+    saved_total = 0
+    while cursor <= end:
+        window_end = _window_end(provider, cursor, end, page_size)
+        bars = await fetch_window(cursor, window_end)
+
+        saved_rows: List[Dict[str, Any]] = []
+        async with AsyncSessionLocal() as db:
+            rows: List[Dict[str, Any]] = []
+            for bar in bars:
+                row = _to_price_row(stock_id, bar, prev_close)
+                if row is None:
+                    continue
+                prev_close = row["close_price"]
+                rows.append(row)
+            for i in range(0, len(rows), INSERT_CHUNK_SIZE):
+                saved_rows.extend(await crud_price.upsert_stock_prices(db, rows[i:i + INSERT_CHUNK_SIZE]))
+
+            if saved_rows:
+                await crud_price.upsert_latest_quotes(db, saved_rows)
+            # 완료는 구간이 end까지 덮였을 때만
+            await crud_backfill.save_checkpoint(
+                db, stock_id, start_date=start, end_date=end, last_date=window_end, completed=window_end >= end
+            )
+            await db.commit()
+        saved_total += len(saved_rows)
+        cursor = window_end + timedelta(days=1)
+
+    # 과거 봉이 추가되면 증분 상태가 맞지 않으므로 전체 이력으로 지표 재계산
+    if saved_total:
+        async with AsyncSessionLocal() as db:
+            await indicator_engine.update_indicators(db, [stock_id], full=True)
+            await db.commit()
+
+    logger.info(f"✅ {symbol} 과거 시세 {saved_total}건을 적재했습니다. ({start} ~ {end}, 요청 {requests}회)")
+    return saved_total
+
+def _needs_backfill(checkpoint, start: date, end: date) -> bool:
+    """이미 같은 구간 이상을 완료한 종목은 건너뜀"""
+    return not (
+        checkpoint
+        and checkpoint.completed
+        and checkpoint.start_date <= start
+        and checkpoint.end_date >= end
+    )
+
+async def backfill_provider(
+    provider: MarketDataProvider,
+    symbols: Optional[Sequence[str]],
+    years: int,
+    restart: bool,
+) -> fetch_scheduler.FetchReport:
+    """제공자 1개의 종목 백필 (종목 간 병렬, 제공자의 분당 크레딧 한도 준수)"""
+    end = provider.calendar.latest_session_date(datetime.now(timezone.utc))
+    start = end - timedelta(days=365 * years)
+
+    async with AsyncSessionLocal() as db:
+        stocks = await crud_stock.get_stocks_by_source(db, api_source=provider.name)
+        if symbols:
+            wanted = {symbol.upper() for symbol in symbols}
+            stocks = [stock for stock in stocks if stock.symbol in wanted]
+        stock_ids = [stock.id for stock in stocks]
+        if restart:
+            await crud_backfill.delete_checkpoints(db, stock_ids)
+            await db.commit()
+        checkpoints = await crud_backfill.get_checkpoints(db, stock_ids)
+
+    targets = {stock.symbol: stock.id for stock in stocks if _needs_backfill(checkpoints.get(stock.id), start, end)}
+    logger.info(
+        f"✅ {provider.name} {len(targets)}개 종목의 과거 시세 백필을 시작합니다. "
+        f"({start} ~ {end}, 완료 종목 {len(stocks) - len(targets)}개 건너뜀)"
+    )
+
+    async def worker(job: fetch_scheduler.FetchJob) -> Dict[str, str]:
+        symbol = job.keys[0]
+        await backfill_symbol(provider, targets[symbol], symbol, start, end)
+        return {}
+
+    jobs = [fetch_scheduler.FetchJob(keys=[symbol], cost=1) for symbol in targets]
+    job_name = f"{provider.name}_backfill"
+    started_at = time.perf_counter()
+    try:
+        with tracing.span(f"ingest {job_name}", **{"ingest.symbols": len(targets)}):
+            report = await create_scheduler(provider).run(jobs, worker)
+    except BaseException:
+        metrics.observe_ingest_run(job_name, time.perf_counter() - started_at, None)
+        raise
+    metrics.observe_ingest_run(job_name, time.perf_counter() - started_at, report)
+
+    summary = report.summary()
+    logger.info(f"✅ {provider.name} 과거 시세 백필 완료 (성공 {summary['succeeded']}건, 실패 {summary['failed']}건)")
+    if report.failed:
+        logger.warning(f"⚠️ 실패 종목 (다시 실행하면 체크포인트부터 재개): {', '.join(sorted(report.failed))}")
+    return report
+
+async def run_backfill(
+    symbols: Optional[Sequence[str]] = None,
+    years: Optional[int] = None,
+    restart: bool = False,
+    providers: Optional[Sequence[MarketDataProvider]] = None,
+) -> Dict[str, fetch_scheduler.FetchReport]:
+    """
+    과거 일봉 백필 (제공자 간 동시 실행, 각 제공자의 한도 준수)
+    symbols: 대상 심볼 (기본값: 전체), restart=True면 체크포인트를 지우고 처음부터
+    {제공자 이름: 결과 보고서} 반환
+    """
+    providers = data_fetcher.get_providers() if providers is None else providers
+    if not providers:
+        logger.error("⛔ 사용할 수 있는 시세 제공자가 없습니다. 백필을 건너뜁니다.")
+        return {}
+
+    years = years or settings.BACKFILL_YEARS
+    reports = await asyncio.gather(*(backfill_provider(provider, symbols, years, restart) for provider in providers))
+
+    # 최신 시세 스냅샷이 바뀌었을 수 있음 → 주식 목록 캐시 무효화
+    await stock_service.invalidate_stock_list_cache()
+    return {provider.name: report for provider, report in zip(providers, reports)}
@@ -0,0 +1,243 @@
+# 기술적 지표 엔진 (NumPy, 종목 축으로 벡터화)
+#
+# 종목 × 거래일 행렬(오른쪽 정렬, 이력이 짧은 종목은 앞쪽을 NaN으로 채움)에서 한 번에 계산
+# - 재귀 지표(EMA/MACD/RSI): 시간 축으로 한 칸씩 진행하며 종목 전체를 한 번에 갱신
+#   적재 시에는 저장된 상태(마지막 봉 직전)에서 새 봉만 재생 → 전체 이력을 다시 읽지 않음
+# - 윈도 지표(SMA/볼린저/52주): 종목별 최근 TAIL_BARS개 봉만으로 계산
+
+import logging
+from bisect import bisect_right
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.future import select
+
+from ..crud import crud_indicator
+from ..db.database import AsyncSessionLocal
+from ..models import stock_model
+
+logger = logging.getLogger(__name__)
+
+SMA_WINDOWS = (20, 50, 200)
+RSI_PERIOD = 14
+MACD_FAST = 12
+MACD_SLOW = 26
+MACD_SIGNAL = 9
+BOLLINGER_WINDOW = 20
+BOLLINGER_WIDTH = 2.0
+FIFTY_TWO_WEEK_BARS = 252
+
+# 윈도 지표 계산에 필요한 최근 봉 수
+TAIL_BARS = max(*SMA_WINDOWS, BOLLINGER_WINDOW, FIFTY_TWO_WEEK_BARS)
+
+# 전체 재계산 시 한 번에 처리하는 종목 수 (종목 × 이력 행렬 메모리 제한)
+RECOMPUTE_CHUNK_SIZE = 500
+
+# 재귀 지표 상태 (키 → StockIndicator 컬럼, base_ 접두사는 마지막 봉 직전 상태)
+STATE_COLUMNS = {
+    "close": "close_price",
+    "ema_fast": "ema_12",
+    "ema_slow": "ema_26",
+    "macd_signal": "macd_signal",
+    "avg_gain": "avg_gain_14",
+    "avg_loss": "avg_loss_14",
+}
+BASE_STATE_COLUMNS = {
+    "close": "base_close",
+    "ema_fast": "base_ema_12",
+    "ema_slow": "base_ema_26",
+    "macd_signal": "base_macd_signal",
+    "avg_gain": "base_avg_gain_14",
+    "avg_loss": "base_avg_loss_14",
+}
+
+State = Dict[str, np.ndarray]
+
+def empty_state(n: int) -> State:
+    """초기화 전 상태 (NaN: 첫 봉에서 시작값으로 설정)"""
+    return {key: np.full(n, np.nan) for key in STATE_COLUMNS}
+
+def right_align(row_keys: np.ndarray, *columns: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray, List[np.ndarray]]:
+    """
+    (종목, 날짜) 순으로 정렬된 행 → 종목 × 봉 행렬 (마지막 봉이 마지막 열)
+    반환: (종목 키, 종목별 시작 행, 종목별 봉 수, 컬럼별 행렬)
+    """
+    keys, starts, counts = np.unique(row_keys, return_index=True, return_counts=True)
+    width = int(counts.max()) if len(counts) else 0
+    group = np.repeat(np.arange(len(keys)), counts)
+    cols = width - counts[group] + (np.arange(len(row_keys)) - starts[group])
+    matrices = []
+    for values in columns:
+        matrix = np.full((len(keys), width), np.nan)
+        matrix[group, cols] = values
+        matrices.append(matrix)
+    return keys, starts, counts, matrices
+
+def _smooth(state: np.ndarray, x: np.ndarray, alpha: float) -> np.ndarray:
+    """지수 평활 한 단계 (x가 NaN이면 유지, 상태가 NaN이면 x로 시작)"""
+    return np.where(np.isnan(x), state, np.where(np.isnan(state), x, state + alpha * (x - state)))
+
+def run_recursive(closes: np.ndarray, state: State) -> Tuple[State, State]:
+    """
+    재귀 지표를 closes의 열 순서대로 진행 (pandas ewm(adjust=False)와 같은 점화식)
+    반환: (마지막 열 이후 상태, 마지막 열 직전 상태)
+    """
+    state = {key: values.copy() for key, values in state.items()}
+    base = state
+    fast_alpha = 2 / (MACD_FAST + 1)
+    slow_alpha = 2 / (MACD_SLOW + 1)
+    signal_alpha = 2 / (MACD_SIGNAL + 1)
+    rsi_alpha = 1 / RSI_PERIOD
+
+    for t in range(closes.shape[1]):
+        if t == closes.shape[1] - 1:
+            base = {key: values.copy() for key, values in state.items()}
+        x = closes[:, t]
+        diff = x - state["close"]
+        state["avg_gain"] = _smooth(state["avg_gain"], np.where(np.isnan(diff), np.nan, np.maximum(diff, 0.0)), rsi_alpha)
+        state["avg_loss"] = _smooth(state["avg_loss"], np.where(np.isnan(diff), np.nan, np.maximum(-diff, 0.0)), rsi_alpha)
+        state["ema_fast"] = _smooth(state["ema_fast"], x, fast_alpha)
+        state["ema_slow"] = _smooth(state["ema_slow"], x, slow_alpha)
+        macd = np.where(np.isnan(x), np.nan, state["ema_fast"] - state["ema_slow"])
+        state["macd_signal"] = _smooth(state["macd_signal"], macd, signal_alpha)
+        state["close"] = np.where(np.isnan(x), state["close"], x)
+    return state, base
+
+def _window_mean_std(values: np.ndarray, window: int) -> Tuple[np.ndarray, np.ndarray]:
+    """최근 window개 봉의 평균/표준편차 (봉이 부족하면 NaN)"""
+    tail = values[:, -window:]
+    valid = ~np.isnan(tail)
+    count = valid.sum(axis=1)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        mean = np.where(valid, tail, 0.0).sum(axis=1) / count
+        std = np.sqrt(np.where(valid, (tail - mean[:, None]) ** 2, 0.0).sum(axis=1) / count)
+    enough = count >= window
+    return np.where(enough, mean, np.nan), np.where(enough, std, np.nan)
+
+def compute_indicators(closes: np.ndarray, highs: np.ndarray, lows: np.ndarray, state: State) -> Dict[str, np.ndarray]:
+    """최근 봉 행렬(윈도 지표) + 재귀 상태 → 종목별 지표 배열"""
+    result: Dict[str, np.ndarray] = {}
+    for window in SMA_WINDOWS:
+        result[f"sma_{window}"], _ = _window_mean_std(closes, window)
+
+    bb_mean, bb_std = _window_mean_std(closes, BOLLINGER_WINDOW)
+    result["bb_upper"] = bb_mean + BOLLINGER_WIDTH * bb_std
+    result["bb_lower"] = bb_mean - BOLLINGER_WIDTH * bb_std
+
+    # 고가/저가가 없는 봉은 종가로 대체
+    recent_highs = np.where(np.isnan(highs), closes, highs)[:, -FIFTY_TWO_WEEK_BARS:]
+    recent_lows = np.where(np.isnan(lows), closes, lows)[:, -FIFTY_TWO_WEEK_BARS:]
+    high_52w = np.where(np.isnan(recent_highs), -np.inf, recent_highs).max(axis=1, initial=-np.inf)
+    low_52w = np.where(np.isnan(recent_lows), np.inf, recent_lows).min(axis=1, initial=np.inf)
+    result["high_52w"] = np.where(np.isinf(high_52w), np.nan, high_52w)
+    result["low_52w"] = np.where(np.isinf(low_52w), np.nan, low_52w)
+
+    avg_gain, avg_loss = state["avg_gain"], state["avg_loss"]
+    with np.errstate(invalid="ignore", divide="ignore"):
+        rsi = 100 - 100 / (1 + avg_gain / avg_loss)
+    result["rsi_14"] = np.where(avg_loss == 0, np.where(avg_gain == 0, 50.0, 100.0), rsi)
+
+    result["macd"] = state["ema_fast"] - state["ema_slow"]
+    result["macd_signal"] = state["macd_signal"]
+    result["macd_hist"] = result["macd"] - state["macd_signal"]
+    return result
+
+def _to_optional(value: float) -> Optional[float]:
+    return None if np.isnan(value) else float(value)
+
+async def update_indicators(db: AsyncSession, stock_ids: Sequence[int], full: bool = False) -> int:
+    """
+    종목별 지표 갱신 (커밋은 호출자가 담당), 갱신한 종목 수 반환
+    저장된 상태의 base_date가 최근 봉 구간에 있으면 그 이후 봉만 재생, 아니면(첫 계산/긴 공백/full) 전체 이력 재계산
+    """
+    stock_ids = sorted(set(stock_ids))
+    if not stock_ids:
+        return 0
+
+    tail_rows = await crud_indicator.get_price_tails(db, stock_ids, TAIL_BARS)
+    if not tail_rows:
+        return 0
+    existing = {} if full else await crud_indicator.get_indicators(db, stock_ids)
+
+    row_stock_ids, dates, highs, lows, closes = zip(*tail_rows)
+    keys, starts, counts, (high_matrix, low_matrix, close_matrix) = right_align(
+        np.array(row_stock_ids),
+        np.array(highs, dtype=float),
+        np.array(lows, dtype=float),
+        np.array(closes, dtype=float),
+    )
+
+    # 1. 증분 대상: base_date 이후 봉 수(replay) 계산
+    incremental: List[Tuple[int, int]] = []
+    full_rows: List[int] = []
+    for i, stock_id in enumerate(keys.tolist()):
+        indicator = existing.get(stock_id)
+        stock_dates = dates[starts[i]:starts[i] + counts[i]]
+        if indicator is not None and indicator.base_date is not None:
+            position = bisect_right(stock_dates, indicator.base_date)
+            if position > 0 and stock_dates[position - 1] == indicator.base_date and position < len(stock_dates):
+                incremental.append((i, len(stock_dates) - position))
+                continue
+        full_rows.append(i)
+
+    state = empty_state(len(keys))
+    base = empty_state(len(keys))
+
+    # 2. 증분: 저장된 base 상태에서 새 봉만 재생
+    if incremental:
+        rows = np.array([i for i, _ in incremental])
+        replay_counts = np.array([count for _, count in incremental])
+        width = int(replay_counts.max())
+        replay = close_matrix[rows, -width:].copy()
+        replay[np.arange(width)[None, :] < (width - replay_counts)[:, None]] = np.nan
+        initial = {
+            key: np.array([getattr(existing[int(keys[i])], column) for i, _ in incremental], dtype=float)
+            for key, column in BASE_STATE_COLUMNS.items()
+        }
+        new_state, new_base = run_recursive(replay, initial)
+        for key in STATE_COLUMNS:
+            state[key][rows] = new_state[key]
+            base[key][rows] = new_base[key]
+
+    # 3. 전체 재계산: 전체 종가 이력으로 처음부터
+    if full_rows:
+        history = await crud_indicator.get_price_closes(db, [int(keys[i]) for i in full_rows])
+        history_ids, _, history_closes = zip(*history)
+        _, _, _, (history_matrix,) = right_align(np.array(history_ids), np.array(history_closes, dtype=float))
+        new_state, new_base = run_recursive(history_matrix, empty_state(len(full_rows)))
+        rows = np.array(full_rows)
+        for key in STATE_COLUMNS:
+            state[key][rows] = new_state[key]
+            base[key][rows] = new_base[key]
+
+    # 4. 윈도 지표 + 저장
+    values = compute_indicators(close_matrix, high_matrix, low_matrix, state)
+    indicator_rows: List[Dict[str, Any]] = []
+    for i, stock_id in enumerate(keys.tolist()):
+        end = starts[i] + counts[i]
+        row = {
+            "stock_id": stock_id,
+            "date": dates[end - 1],
+            "base_date": dates[end - 2] if counts[i] >= 2 else None,
+        }
+        row.update({name: _to_optional(column[i]) for name, column in values.items()})
+        row.update({column: _to_optional(state[key][i]) for key, column in STATE_COLUMNS.items()})
+        row.update({column: _to_optional(base[key][i]) for key, column in BASE_STATE_COLUMNS.items()})
+        indicator_rows.append(row)
+    await crud_indicator.upsert_indicators(db, indicator_rows)
+    return len(indicator_rows)
+
+async def recompute_all_indicators(chunk_size: int = RECOMPUTE_CHUNK_SIZE) -> int:
+    """전 종목 지표를 전체 이력으로 다시 계산 (종목 chunk_size개씩 트랜잭션)"""
+    async with AsyncSessionLocal() as db:
+        result = await db.execute(select(stock_model.Stock.id).order_by(stock_model.Stock.id))
+        stock_ids = result.scalars().all()
+
+    updated = 0
+    for i in range(0, len(stock_ids), chunk_size):
+        async with AsyncSessionLocal() as db:
+            updated += await update_indicators(db, stock_ids[i:i + chunk_size], full=True)
+            await db.commit()
+        logger.info(f"✅ 지표 재계산 {min(i + chunk_size, len(stock_ids))}/{len(stock_ids)}")
+    return updated
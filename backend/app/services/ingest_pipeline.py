@@ -0,0 +1,148 @@
+# 시세 적재 파이프라인: 수집한 시세를 모아 배치 단위로 일괄 저장
+
+import asyncio
+import logging
+from dataclasses import dataclass
+from datetime import date
+from typing import Any, Dict, List, Optional
+
+from ..db.database import AsyncSessionLocal
+from ..core.config import settings
+from ..crud import crud_stock, crud_price
+from . import stock_service, quote_hub, indicator_engine, symbol_search
+
+logger = logging.getLogger(__name__)
+
+# 시세 응답에서 Stock에 반영하는 기본 정보 컬럼
+STOCK_METADATA_COLUMNS = (
+    "name_en",
+    "exchange",
+    "currency",
+    "fifty_two_week_low",
+    "fifty_two_week_high",
+)
+
+# 시세 응답에서 StockPrice에 저장하는 컬럼 (close_price 필수)
+PRICE_COLUMNS = (
+    "close_price",
+    "open_price",
+    "high_price",
+    "low_price",
+    "volume",
+    "change",
+    "percent_change",
+)
+
+@dataclass
+class FetchedQuote:
+    """API에서 가져온 단일 종목 시세 (MarketDataProvider.fetch_quotes 결과)"""
+    symbol: str
+    fetch_date: date
+    data: Dict[str, Any]
+    # 제공자 정보: 시세 적재로 처음 생기는 종목의 Stock 행에 저장 (기존 종목은 바꾸지 않음)
+    market_type: str
+    api_source: str
+
+class QuoteBatchWriter:
+    """
+    수집한 시세를 batch_size개씩 모아 저장
+    배치당 세션 1개, 문장 3개 (Stock 기본 정보 / StockPrice / 최신 시세 스냅샷), 커밋 1회
+    커밋과 함께 저장된 시세 델타를 실시간 스트림 구독자에게 전달, 커밋 후 기술적 지표 증분 갱신
+
+    사용법:
+        async with QuoteBatchWriter() as writer:
+            await writer.add(quote)   # 배치가 차면 자동 저장
+        # 블록 종료 시 남은 시세 저장
+    """
+
+    def __init__(self, batch_size: Optional[int] = None):
+        self.batch_size = batch_size or settings.INGEST_BATCH_SIZE
+        self._buffer: List[FetchedQuote] = []
+        self._lock = asyncio.Lock()
+        self.saved_count = 0
+        self.failed_count = 0
+        self.failed_symbols: List[str] = []
+
+    async def __aenter__(self) -> "QuoteBatchWriter":
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.flush()
+
+    async def add(self, quote: FetchedQuote):
+        """시세 추가, 배치가 차면 저장"""
+        self._buffer.append(quote)
+        if len(self._buffer) >= self.batch_size:
+            await self.flush()
+
+    async def flush(self):
+        """버퍼의 시세를 단일 트랜잭션으로 저장"""
+        async with self._lock:
+            batch, self._buffer = self._buffer, []
+            if not batch:
+                return
+            await self._write_batch(batch)
+
+    async def _write_batch(self, batch: List[FetchedQuote]):
+        stock_rows = [
+            {
+                "symbol": quote.symbol,
+                "market_type": quote.market_type,
+                "api_source": quote.api_source,
+                **{column: quote.data.get(column) for column in STOCK_METADATA_COLUMNS},
+            }
+            for quote in batch
+        ]
+
+        async with AsyncSessionLocal() as db:
+            try:
+                # 1. Stock 기본 정보 다중 행 upsert → {symbol: id}
+                stock_ids = await crud_stock.upsert_stocks(db, stock_rows, update_columns=STOCK_METADATA_COLUMNS)
+
+                # 2. StockPrice 다중 행 upsert (stock_id, date 충돌 시 갱신)
+                price_rows = [
+                    {
+                        "stock_id": stock_ids[quote.symbol],
+                        "date": quote.fetch_date,
+                        **{column: quote.data.get(column) for column in PRICE_COLUMNS},
+                    }
+                    for quote in batch
+                ]
+                saved_prices = await crud_price.upsert_stock_prices(db, price_rows)
+
+                # 3. 최신 시세 스냅샷 갱신 (같은 트랜잭션)
+                await crud_price.upsert_latest_quotes(db, saved_prices)
+
+                # 4. 실시간 스트림 알림 (커밋 시 전달, PostgreSQL이 아니면 커밋 후 이 프로세스 허브로 직접 전달)
+                symbols_by_id = {stock_id: symbol for symbol, stock_id in stock_ids.items()}
+                local_deltas = await quote_hub.notify_quotes(db, [
+                    {"symbol": symbols_by_id[row["stock_id"]], **{column: row[column] for column in crud_price.LATEST_QUOTE_COLUMNS}}
+                    for row in saved_prices
+                ])
+                await db.commit()
+            except Exception as e:
+                await db.rollback()
+                self.failed_count += len(batch)
+                self.failed_symbols.extend(quote.symbol for quote in batch)
+                logger.error(f"⛔ 시세 {len(batch)}건을 저장하는 중 오류가 발생했습니다: {e}")
+                return
+
+        self.saved_count += len(batch)
+        logger.info(f"✅ 시세 {len(batch)}건을 일괄 저장했습니다.")
+        if local_deltas:
+            quote_hub.hub.publish(local_deltas)
+
+        # 기술적 지표 증분 갱신 (실패해도 저장된 시세는 유지, 다음 적재에서 다시 갱신)
+        async with AsyncSessionLocal() as db:
+            try:
+                await indicator_engine.update_indicators(db, stock_ids.values())
+                await db.commit()
+            except Exception as e:
+                await db.rollback()
+                logger.error(f"⛔ 기술적 지표를 갱신하는 중 오류가 발생했습니다: {e}")
+
+        # 영문명이 바뀌었으면 검색 색인 재생성
+        await symbol_search.refresh_if_changed(stock_rows)
+
+        # 새 가격 커밋 → 주식 목록 캐시 무효화
+        await stock_service.invalidate_stock_list_cache()
@@ -0,0 +1,109 @@
+# 주기 시세 적재: 장중에는 일정 간격, 장 마감 후 1회 (제공자별 거래소 캘린더 기준)
+
+import asyncio
+import logging
+from datetime import datetime, timedelta
+from typing import Awaitable, Callable, List, Optional, Sequence
+
+from ..core.clock import Clock, SystemClock
+from ..core.config import settings
+from ..core.market_calendar import MarketCalendar, US_EQUITY_CALENDAR
+from ..db.database import try_advisory_lock
+from . import data_fetcher
+from .ingest_state import ingest_progress
+
+logger = logging.getLogger(__name__)
+
+# (now, refreshed_before: 제공자 → 기준 시각) → 적재 실행
+IngestRunner = Callable[..., Awaitable[object]]
+
+def provider_calendars() -> List[MarketCalendar]:
+    """MARKET_DATA_PROVIDERS 제공자들의 캘린더 (중복 제거, 설정 순서, 제공자가 없으면 미국 시장)"""
+    calendars: List[MarketCalendar] = []
+    for name in data_fetcher.provider_names():
+        calendar = data_fetcher.get_provider(name).calendar
+        if calendar not in calendars:
+            calendars.append(calendar)
+    return calendars or [US_EQUITY_CALENDAR]
+
+class IngestScheduler:
+    """
+    장중: interval마다 refreshed_before=now-interval 기준으로 오래된 시세만 갱신
+    장 마감 후: close+post_close_delay 시점에 1회 (장중 시세 → 최종 종가로 갱신)
+    장외: 다음 장 시작까지 대기, 실행은 advisory lock을 잡은 레플리카 하나만 수행
+    캘린더가 여럿이면(거래소가 다른 제공자) 가장 이른 실행 시각에 깨어나고,
+    세션 날짜와 refreshed_before는 제공자마다 자기 캘린더로 계산
+    """
+
+    def __init__(
+        self,
+        run_ingest: IngestRunner = data_fetcher.update_stock_prices,
+        clock: Optional[Clock] = None,
+        calendars: Optional[Sequence[MarketCalendar]] = None,
+        interval_seconds: Optional[float] = None,
+        post_close_delay_seconds: Optional[float] = None,
+        lock_key: Optional[int] = None,
+    ):
+        self.run_ingest = run_ingest
+        self.clock = clock or SystemClock()
+        self.calendars = list(calendars) if calendars else provider_calendars()
+        self.interval = timedelta(seconds=interval_seconds or settings.INGEST_INTERVAL_SECONDS)
+        self.post_close_delay = timedelta(
+            seconds=post_close_delay_seconds if post_close_delay_seconds is not None
+            else settings.INGEST_POST_CLOSE_DELAY_SECONDS
+        )
+        self.lock_key = lock_key if lock_key is not None else settings.INGEST_ADVISORY_LOCK_KEY
+
+    def _post_close_at(self, calendar: MarketCalendar, session_date) -> datetime:
+        return calendar.session_bounds(session_date)[1] + self.post_close_delay
+
+    def refreshed_before(self, calendar: MarketCalendar, now: datetime) -> datetime:
+        """calendar 거래소 시세 중 이 시각 이전에 갱신된 시세는 다시 가져옴"""
+        if calendar.is_open(now):
+            return now - self.interval
+        # 장외: 최근 세션의 마감 후 반영분이 있으면 최신으로 간주
+        return min(now, self._post_close_at(calendar, calendar.latest_session_date(now)))
+
+    def _next_run_at(self, calendar: MarketCalendar, now: datetime) -> datetime:
+        if calendar.is_open(now):
+            session_date = calendar.local_date(now)
+            return min(now + self.interval, self._post_close_at(calendar, session_date))
+
+        post_close_at = self._post_close_at(calendar, calendar.latest_session_date(now))
+        if now < post_close_at:
+            return post_close_at
+        return calendar.next_open(now)
+
+    def next_run_at(self, now: datetime) -> datetime:
+        """다음 실행 시각 (캘린더별 다음 실행 시각 중 가장 이른 시각)"""
+        return min(self._next_run_at(calendar, now) for calendar in self.calendars)
+
+    async def run_once(self) -> bool:
+        """1회 적재 (다른 레플리카가 적재 중이면 건너뜀), 실행 여부 반환"""
+        now = self.clock.now()
+        async with try_advisory_lock(self.lock_key) as acquired:
+            if not acquired:
+                logger.info("✅ 다른 인스턴스가 적재 중입니다. 이번 주기는 건너뜁니다.")
+                return False
+            await self.run_ingest(now=now, refreshed_before=lambda provider: self.refreshed_before(provider.calendar, now))
+        return True
+
+    async def run_forever(self):
+        """다음 실행 시각까지 대기 → 적재 반복 (취소될 때까지)"""
+        while True:
+            now = self.clock.now()
+            next_run_at = self.next_run_at(now)
+            logger.info(f"✅ 다음 시세 적재 예정: {next_run_at.astimezone(self.calendars[0].timezone).isoformat()}")
+            await self.clock.sleep((next_run_at - now).total_seconds())
+
+            ingest_progress.start()
+            try:
+                ran = await self.run_once()
+            except asyncio.CancelledError:
+                ingest_progress.finish("cancelled")
+                raise
+            except Exception as e:
+                ingest_progress.finish("failed", error=str(e))
+                logger.error(f"⛔ 주기 시세 적재 중 오류 발생: {e}")
+                continue
+            ingest_progress.finish("succeeded" if ran else "idle")
@@ -0,0 +1,51 @@
+# 시세 적재 진행 상황 (readiness 엔드포인트에서 조회)
+
+from dataclasses import asdict, dataclass
+from datetime import datetime, timezone
+from typing import Any, Dict, Optional
+
+@dataclass
+class IngestProgress:
+    status: str = "idle" # idle / running / succeeded / failed / cancelled
+    phase: Optional[str] = None # 현재 단계 (예: stock_list, quotes)
+    total: int = 0 # 이번 실행 대상 종목 수
+    done: int = 0 # 처리 완료 종목 수 (성공 + 실패)
+    failed: int = 0
+    runs: int = 0 # 누적 실행 횟수
+    started_at: Optional[datetime] = None
+    finished_at: Optional[datetime] = None
+    last_success_at: Optional[datetime] = None
+    last_error: Optional[str] = None
+
+    def start(self):
+        self.status = "running"
+        self.phase = None
+        self.total = self.done = self.failed = 0
+        self.runs += 1
+        self.started_at = datetime.now(timezone.utc)
+        self.finished_at = None
+        self.last_error = None
+
+    def set_phase(self, phase: str, total: int = 0):
+        self.phase = phase
+        self.total = total
+        self.done = self.failed = 0
+
+    def advance(self, done: int, failed: int = 0):
+        self.done += done
+        self.failed += failed
+
+    def finish(self, status: str, error: Optional[str] = None):
+        self.status = status
+        self.finished_at = datetime.now(timezone.utc)
+        if status == "succeeded":
+            self.last_success_at = self.finished_at
+        if error:
+            self.last_error = error
+
+    def as_dict(self) -> Dict[str, Any]:
+        data = asdict(self)
+        data["percent"] = round(self.done / self.total * 100, 1) if self.total else None
+        return data
+
+ingest_progress = IngestProgress()
@@ -0,0 +1,78 @@
+# 시세 제공자 추상화: 다중 종목 시세, 과거 일봉, 종목 목록, 호출 한도
+# 적재 흐름(data_fetcher, history_backfill)은 제공자와 무관, 제공자는 API 호출/응답 변환만 담당
+# (Twelvedata, 오프라인 테스트용 가짜 제공자, 한투 API 등)
+
+import logging
+from dataclasses import dataclass
+from datetime import date
+from typing import Any, AsyncIterator, Dict, List, Protocol, Sequence, Tuple
+
+from ..core.config import settings
+from ..core.market_calendar import MarketCalendar
+from .fetch_scheduler import FetchScheduler, TokenBucket
+
+logger = logging.getLogger(__name__)
+
+@dataclass(frozen=True)
+class ProviderLimits:
+    """제공자별 호출 한도 (스케줄러 설정)"""
+    credits_per_minute: float # 분당 크레딧 (심볼 1개 = 1크레딧)
+    quote_batch_size: int # 시세 요청 1회당 심볼 수
+    max_concurrency: int # 동시 요청 수
+    history_page_size: int # 일봉 요청 1회당 최대 봉 수
+
+class MarketDataProvider(Protocol):
+    """
+    시세 제공자
+    fetch_quotes 결과 (심볼별): ingest_pipeline.STOCK_METADATA_COLUMNS + PRICE_COLUMNS 키 (close_price 필수)
+    stream_history 결과 (봉별): date(date), open/high/low/close/volume(float 또는 None), 과거 → 최신 순, 최신 쪽 page_size개
+    재시도 대상 오류(속도 제한, 5xx, 네트워크 오류)는 RetryableFetchError 발생
+    """
+
+    name: str # Stock.api_source 값, 로그/지표 레이블
+    market_type: str
+    calendar: MarketCalendar # 세션 날짜 기준 거래소 캘린더
+    limiter: TokenBucket # 분당 크레딧 버킷 (실행 간 공유)
+
+    @property
+    def limits(self) -> ProviderLimits: ...
+
+    def is_configured(self) -> bool:
+        """API 키 등 호출에 필요한 설정이 있는지"""
+        ...
+
+    async def list_symbols(self) -> List[Dict[str, Any]]:
+        """제공 종목 목록 (StockCreate 형식 행)"""
+        ...
+
+    async def fetch_quotes(self, symbols: Sequence[str]) -> Tuple[Dict[str, Dict[str, Any]], Dict[str, str]]:
+        """여러 종목 시세를 요청 1회로 가져오기, ({symbol: 시세}, {symbol: 실패 사유}) 반환"""
+        ...
+
+    def stream_history(self, symbol: str, start: date, end: date, page_size: int) -> AsyncIterator[Dict[str, Any]]:
+        """
+        [start, end] 일봉을 과거 → 최신 순으로 전달
+        구간에 page_size개보다 많으면 최신 쪽(end 쪽) page_size개만 전달 (이전 봉은 end를 당겨 다시 요청)
+        """
+        ...
+
+def create_scheduler(provider: MarketDataProvider) -> FetchScheduler:
+    """제공자 호출 스케줄러 (제공자별 크레딧 버킷/동시 요청 수, 재시도 정책은 공통)"""
+    return FetchScheduler(
+        limiter=provider.limiter,
+        max_concurrency=provider.limits.max_concurrency,
+        max_retries=settings.FETCH_MAX_RETRIES,
+        backoff_base_seconds=settings.FETCH_BACKOFF_BASE_SECONDS,
+        backoff_max_seconds=settings.FETCH_BACKOFF_MAX_SECONDS,
+    )
+
+def chunk_symbols(provider: MarketDataProvider, symbols: Sequence[str]) -> List[List[str]]:
+    """심볼 목록을 시세 요청 1회 분량으로 나눔 (요청 1회 비용이 분당 크레딧 한도를 넘으면 항상 거절되므로 한도로 제한)"""
+    limits = provider.limits
+    size = max(1, min(limits.quote_batch_size, int(limits.credits_per_minute)))
+    if size < limits.quote_batch_size:
+        logger.warning(
+            f"⚠️ {provider.name} 요청 1회당 심볼 수({limits.quote_batch_size})가 "
+            f"분당 크레딧 한도({limits.credits_per_minute:g})보다 커서 {size}개로 줄입니다."
+        )
+    return [list(symbols[i:i + size]) for i in range(0, len(symbols), size)]
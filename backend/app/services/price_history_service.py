@@ -0,0 +1,88 @@
+# 기간별 시세 조회: 주봉/월봉 집계(SQL), LTTB 포인트 축소
+
+from sqlalchemy.ext.asyncio import AsyncSession
+from datetime import date, timedelta
+from typing import List, Optional, Sequence
+from ..crud import crud_stock, crud_price
+from ..schemas import stock_schema
+
+# interval → date_trunc 단위 (daily는 집계 없음)
+_AGGREGATE_PERIODS = {"weekly": "week", "monthly": "month"}
+
+DEFAULT_RANGE_DAYS = 365
+
+class StockNotFoundError(Exception):
+    """요청한 심볼의 주식이 없음"""
+
+def lttb_indices(values: Sequence[float], threshold: int) -> List[int]:
+    """
+    Largest-Triangle-Three-Buckets: 모양을 유지하며 threshold개 점으로 축소할 인덱스 목록
+    x축은 인덱스(거래일 순서)로 사용
+    """
+    n = len(values)
+    if threshold >= n or threshold < 3:
+        return list(range(n))
+
+    indices = [0]
+    bucket_size = (n - 2) / (threshold - 2)
+    a = 0
+    for i in range(threshold - 2):
+        # 다음 버킷 평균점
+        next_start = int((i + 1) * bucket_size) + 1
+        next_end = min(int((i + 2) * bucket_size) + 1, n)
+        avg_x = (next_start + next_end - 1) / 2
+        avg_y = sum(values[next_start:next_end]) / (next_end - next_start)
+
+        # 현재 버킷에서 (이전 선택점, 다음 버킷 평균점)과 만드는 삼각형이 가장 큰 점 선택
+        start = int(i * bucket_size) + 1
+        end = int((i + 1) * bucket_size) + 1
+        ax, ay = a, values[a]
+        max_area, selected = -1.0, start
+        for j in range(start, end):
+            area = abs((ax - avg_x) * (values[j] - ay) - (ax - j) * (avg_y - ay))
+            if area > max_area:
+                max_area, selected = area, j
+        indices.append(selected)
+        a = selected
+    indices.append(n - 1)
+    return indices
+
+async def get_price_series(
+    db: AsyncSession,
+    symbol: str,
+    start: Optional[date],
+    end: Optional[date],
+    interval: str,
+    max_points: Optional[int] = None,
+) -> stock_schema.PriceSeriesResponse:
+    """기간별 시세를 열 단위 배열로 반환 (interval: daily/weekly/monthly, max_points: LTTB 축소)"""
+    stock = await crud_stock.get_stock_by_symbol(db, symbol)
+    if not stock:
+        raise StockNotFoundError(symbol)
+
+    end = end or date.today()
+    start = start or end - timedelta(days=DEFAULT_RANGE_DAYS)
+    if start > end:
+        raise ValueError("from은 to보다 이후일 수 없습니다.")
+
+    if interval in _AGGREGATE_PERIODS:
+        rows = await crud_price.get_price_history_aggregated(db, stock.id, start, end, _AGGREGATE_PERIODS[interval])
+    else:
+        rows = await crud_price.get_price_history(db, stock.id, start, end)
+
+    if max_points and len(rows) > max_points:
+        rows = [rows[i] for i in lttb_indices([row[4] for row in rows], max_points)]
+
+    dates, opens, highs, lows, closes, volumes = (list(column) for column in zip(*rows)) if rows else ([], [], [], [], [], [])
+    # DB에서 온 값이라 재검증 없이 생성 (포인트 수만큼의 검증 비용 생략)
+    return stock_schema.PriceSeriesResponse.model_construct(
+        symbol=stock.symbol,
+        interval=interval,
+        count=len(dates),
+        dates=dates,
+        opens=opens,
+        highs=highs,
+        lows=lows,
+        closes=closes,
+        volumes=volumes,
+    )
@@ -0,0 +1,160 @@
+# 실시간 시세 브로드캐스트 허브 (SSE 구독자에게 새 시세 델타 전달)
+#
+# 적재 트랜잭션에서 pg_notify로 델타를 보내면, 각 API 프로세스의 리스너가 받아 자기 허브로 전달
+# (적재는 advisory lock을 잡은 레플리카 하나만 하므로, 모든 레플리카가 같은 델타를 받도록 DB를 경유)
+
+import asyncio
+import logging
+from typing import Any, Dict, FrozenSet, Iterable, List, Optional, Set
+
+import orjson
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ..core.config import settings
+from ..db.database import engine
+
+logger = logging.getLogger(__name__)
+
+NOTIFY_CHANNEL = "stock_quotes"
+
+# NOTIFY payload 한도(8000 bytes) 안에 들어가도록 나눠 보냄
+NOTIFY_MAX_PAYLOAD_BYTES = 7000
+
+class Subscription:
+    """구독자 1명: 관심 심볼(None이면 전체) + 크기 제한 큐 (None 수신 시 종료)"""
+
+    def __init__(self, symbols: Optional[FrozenSet[str]], max_queue: int):
+        self.symbols = symbols
+        self.queue: "asyncio.Queue[Optional[bytes]]" = asyncio.Queue(maxsize=max_queue)
+        self.dropped = False
+
+class QuoteHub:
+    """
+    프로세스 내 단일 브로드캐스트 허브
+    델타는 한 번만 직렬화해 모든 구독자가 같은 bytes를 공유, 큐가 가득 찬 느린 구독자는 끊음
+    """
+
+    def __init__(self, max_queue: int):
+        self.max_queue = max_queue
+        self._by_symbol: Dict[str, Set[Subscription]] = {}
+        self._all_symbols: Set[Subscription] = set()
+        self.subscribers = 0
+        self.published = 0
+        self.dropped_clients = 0
+
+    def subscribe(self, symbols: Optional[Iterable[str]] = None) -> Subscription:
+        subscription = Subscription(frozenset(symbols) if symbols else None, self.max_queue)
+        if subscription.symbols is None:
+            self._all_symbols.add(subscription)
+        else:
+            for symbol in subscription.symbols:
+                self._by_symbol.setdefault(symbol, set()).add(subscription)
+        self.subscribers += 1
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription):
+        if subscription.symbols is None:
+            if subscription not in self._all_symbols:
+                return
+            self._all_symbols.discard(subscription)
+        else:
+            found = False
+            for symbol in subscription.symbols:
+                subscribers = self._by_symbol.get(symbol)
+                if subscribers and subscription in subscribers:
+                    found = True
+                    subscribers.discard(subscription)
+                    if not subscribers:
+                        del self._by_symbol[symbol]
+            if not found:
+                return
+        self.subscribers -= 1
+
+    def _drop(self, subscription: Subscription):
+        """느린 구독자 끊기: 밀린 메시지를 버리고 종료 신호 전달"""
+        subscription.dropped = True
+        self.unsubscribe(subscription)
+        while not subscription.queue.empty():
+            subscription.queue.get_nowait()
+        subscription.queue.put_nowait(None)
+        self.dropped_clients += 1
+
+    def publish(self, deltas: List[Dict[str, Any]]):
+        """시세 델타 목록을 관심 구독자에게 전달 (SSE 이벤트로 직렬화)"""
+        for delta in deltas:
+            message = b"event: quote\ndata: " + orjson.dumps(delta) + b"\n\n"
+            targets = self._all_symbols | self._by_symbol.get(delta["symbol"], set())
+            for subscription in targets:
+                try:
+                    subscription.queue.put_nowait(message)
+                except asyncio.QueueFull:
+                    self._drop(subscription)
+            self.published += 1
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "subscribers": self.subscribers,
+            "published": self.published,
+            "dropped_clients": self.dropped_clients,
+        }
+
+hub = QuoteHub(max_queue=settings.QUOTE_STREAM_QUEUE_SIZE)
+
+async def notify_quotes(db: AsyncSession, deltas: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """
+    적재 트랜잭션 안에서 호출: 커밋되면 모든 프로세스의 리스너에 델타 전달 (pg_notify)
+    PostgreSQL이 아니면(로컬 SQLite 등) 알릴 리스너가 없으므로 델타를 그대로 반환
+    → 호출자가 커밋이 성공한 뒤 hub.publish (롤백된 시세는 전달하지 않음)
+    """
+    if not deltas:
+        return []
+    if db.bind.dialect.name != "postgresql":
+        return deltas
+
+    chunk: List[str] = []
+    size = 2
+    for delta in deltas:
+        encoded = orjson.dumps(delta).decode()
+        if chunk and size + len(encoded.encode()) + 1 > NOTIFY_MAX_PAYLOAD_BYTES:
+            await db.execute(text("SELECT pg_notify(:channel, :payload)"), {"channel": NOTIFY_CHANNEL, "payload": f"[{','.join(chunk)}]"})
+            chunk, size = [], 2
+        chunk.append(encoded)
+        size += len(encoded.encode()) + 1
+    await db.execute(text("SELECT pg_notify(:channel, :payload)"), {"channel": NOTIFY_CHANNEL, "payload": f"[{','.join(chunk)}]"})
+    return []
+
+def _on_notification(connection, pid, channel, payload):
+    try:
+        hub.publish(orjson.loads(payload))
+    except Exception as e:
+        logger.error(f"⛔ 시세 알림을 처리하는 중 오류가 발생했습니다: {e}")
+
+async def listen_for_quotes(reconnect_delay_seconds: float = 5.0):
+    """
+    LISTEN stock_quotes → 허브로 전달 (백그라운드 태스크, 연결이 끊기면 재연결)
+    PostgreSQL이 아니면 아무것도 하지 않음 (적재 프로세스가 커밋 후 직접 전달)
+    """
+    if engine.dialect.name != "postgresql":
+        return
+
+    while True:
+        try:
+            async with engine.connect() as conn:
+                raw_connection = await conn.get_raw_connection()
+                driver_connection = raw_connection.driver_connection
+                terminated = asyncio.Event()
+                driver_connection.add_termination_listener(lambda _: terminated.set())
+                await driver_connection.add_listener(NOTIFY_CHANNEL, _on_notification)
+                logger.info("✅ 실시간 시세 알림 수신을 시작합니다.")
+                try:
+                    await terminated.wait()
+                finally:
+                    if not driver_connection.is_closed():
+                        await driver_connection.remove_listener(NOTIFY_CHANNEL, _on_notification)
+            logger.warning("⚠️ 실시간 시세 알림 연결이 끊어졌습니다. 다시 연결합니다.")
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.error(f"⛔ 실시간 시세 알림 수신 중 오류가 발생했습니다: {e}")
+        await asyncio.sleep(reconnect_delay_seconds)
@@ -1,46 +1,278 @@
 # 페이징, 필터링 등 비즈니스 로직
 
 from sqlalchemy.ext.asyncio import AsyncSession
-from ..crud import crud_stock, crud_price
+from ..db.database import AsyncSessionLocal
+from ..crud import crud_stock, crud_dataset
 from ..schemas import stock_schema
+from ..core.cache import InMemoryCacheBackend, ResponseCache
+from ..core.config import settings
+from .price_history_service import StockNotFoundError
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Dict, Mapping, Optional, Sequence, Tuple
+import base64
+import binascii
+import json
+import logging
 import math
+import orjson
+import time
 
-async def get_paginated_stock_list(
+logger = logging.getLogger(__name__)
+
+# dataset_versions 테이블의 주식 데이터셋 이름
+STOCK_DATASET = "stocks"
+
+# 주식 목록 응답 캐시 (직렬화된 JSON bytes, 가격 적재 커밋 시 무효화)
+stock_list_cache = ResponseCache(
+    backend=InMemoryCacheBackend(max_entries=settings.STOCK_LIST_CACHE_MAX_ENTRIES),
+    namespace="stock_list",
+    ttl_seconds=settings.STOCK_LIST_CACHE_TTL_SECONDS,
+)
+
+@dataclass(frozen=True)
+class DatasetVersion:
+    version: int
+    updated_at: Optional[datetime] = None
+
+# 마지막으로 읽은 데이터셋 버전, 읽은 시각
+_dataset_version: Optional[DatasetVersion] = None
+_dataset_version_checked_at = 0.0
+
+async def get_dataset_version(db: AsyncSession) -> DatasetVersion:
+    """
+    주식 데이터셋 버전 (HTTP ETag/Last-Modified, 목록 캐시 키)
+    DATASET_VERSION_TTL_SECONDS 동안은 DB 조회 없이 마지막 값 사용
+    """
+    global _dataset_version, _dataset_version_checked_at
+    now = time.monotonic()
+    if _dataset_version is None or now - _dataset_version_checked_at >= settings.DATASET_VERSION_TTL_SECONDS:
+        row = await crud_dataset.get_dataset_version(db, STOCK_DATASET)
+        _dataset_version = DatasetVersion(*row) if row else DatasetVersion(0)
+        _dataset_version_checked_at = now
+    return _dataset_version
+
+async def invalidate_stock_list_cache():
+    """
+    새 가격/지표가 커밋되었을 때 호출
+    데이터셋 버전 증가 (모든 레플리카의 ETag와 목록 캐시 키가 바뀜) + 이 프로세스 목록 캐시 무효화
+    """
+    global _dataset_version
+    try:
+        async with AsyncSessionLocal() as db:
+            await crud_dataset.bump_dataset_version(db, STOCK_DATASET)
+            await db.commit()
+        # 다음 요청에서 읽기 DB로 다시 조회 (레플리카가 새 버전을 받기 전에는 이전 버전 유지 → 이전 데이터에 새 ETag를 붙이지 않음)
+        _dataset_version = None
+    except Exception as e:
+        logger.error(f"⛔ 데이터셋 버전을 올리는 중 오류가 발생했습니다: {e}")
+    await stock_list_cache.invalidate()
+
+def get_stock_list_cache_stats() -> Dict[str, Any]:
+    """주식 목록 캐시 적중/미스/축출 카운터"""
+    return stock_list_cache.stats()
+
+def _row_to_item(row: Mapping[str, Any]) -> Dict[str, Any]:
+    """
+    목록/상세 행 매핑 → StockResponse 모양의 dict (Pydantic 모델 생성/검증 없이 바로 직렬화)
+    latest_price.id는 원본 StockPrice.id, 52주 최고/최저는 시세 이력으로 계산한 값 우선
+    """
+    item = {column: row[column] for column in crud_stock.STOCK_RESPONSE_COLUMNS}
+
+    latest_price = None
+    if row["quote_price_id"] is not None:
+        latest_price = {column: row[f"quote_{column}"] for column in crud_stock.QUOTE_RESPONSE_COLUMNS}
+        latest_price["id"] = row["quote_price_id"]
+    item["latest_price"] = latest_price
+
+    indicators = None
+    if row["indicator_date"] is not None:
+        indicators = {column: row[f"indicator_{column}"] for column in crud_stock.INDICATOR_RESPONSE_COLUMNS}
+        if indicators["high_52w"] is not None:
+            item["fifty_two_week_high"] = indicators["high_52w"]
+            item["fifty_two_week_low"] = indicators["low_52w"]
+    item["indicators"] = indicators
+    return item
+
+def _build_stock_items(rows: Sequence[Mapping[str, Any]]) -> list[Dict[str, Any]]:
+    """행 매핑 목록 → StockResponse 모양의 dict 목록"""
+    return [_row_to_item(row) for row in rows]
+
+async def _get_stock_detail_item(db: AsyncSession, symbol: str) -> Dict[str, Any]:
+    row = await crud_stock.get_stock_with_latest_quote(db, symbol)
+    if row is None:
+        raise StockNotFoundError(symbol)
+    return _row_to_item(row)
+
+async def get_stock_detail(db: AsyncSession, symbol: str) -> stock_schema.StockResponse:
+    """단일 주식 상세 (최신 시세 + 기술적 지표), 없으면 StockNotFoundError"""
+    return stock_schema.StockResponse.model_validate(await _get_stock_detail_item(db, symbol))
+
+async def get_stock_detail_json(db: AsyncSession, symbol: str) -> bytes:
+    """get_stock_detail 결과를 직렬화된 JSON으로 반환 (모델 검증 생략)"""
+    return orjson.dumps(await _get_stock_detail_item(db, symbol))
+
+# /stocks/batch 에서 fields를 생략했을 때 반환하는 필드 (관심 종목 목록용)
+DEFAULT_BATCH_FIELDS = ("name_en", "name_ko", "date", "close_price", "change", "percent_change")
+
+async def get_stock_batch_json(db: AsyncSession, symbols: Sequence[str], fields: Optional[Sequence[str]] = None) -> bytes:
+    """
+    여러 종목의 지정 필드만 JSON으로 반환 (요청 순서 유지, 없는 심볼은 missing)
+    Pydantic 모델을 거치지 않고 행 매핑을 바로 직렬화, 알 수 없는 필드는 ValueError
+    """
+    fields = list(dict.fromkeys(fields or DEFAULT_BATCH_FIELDS))
+    unknown = [field for field in fields if field not in crud_stock.BATCH_FIELD_COLUMNS]
+    if unknown:
+        raise ValueError(f"지원하지 않는 필드입니다: {', '.join(unknown)}")
+    symbols = list(dict.fromkeys(symbols))
+
+    rows = await crud_stock.get_stock_fields_by_symbols(db, symbols, fields)
+    by_symbol = {row["symbol"]: row for row in rows}
+    body = {
+        "fields": fields,
+        "items": [by_symbol[symbol] for symbol in symbols if symbol in by_symbol],
+        "missing": [symbol for symbol in symbols if symbol not in by_symbol],
+    }
+    return orjson.dumps(body)
+
+def encode_cursor(symbol: str, stock_id: int) -> str:
+    """(symbol, id) → 불투명 커서 문자열"""
+    raw = json.dumps([symbol, stock_id], separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+def decode_cursor(cursor: str) -> Tuple[str, int]:
+    """불투명 커서 문자열 → (symbol, id), 형식이 잘못되면 ValueError"""
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        symbol, stock_id = json.loads(raw)
+    except (binascii.Error, UnicodeDecodeError, json.JSONDecodeError, TypeError, ValueError):
+        raise ValueError(f"잘못된 커서입니다: {cursor}")
+    if not isinstance(symbol, str) or not isinstance(stock_id, int):
+        raise ValueError(f"잘못된 커서입니다: {cursor}")
+    return symbol, stock_id
+
+async def _get_paginated_stock_page(
     db: AsyncSession,
     page: int,
     size: int,
-    market: str
-) -> stock_schema.PaginatedStockResponse:
-    """페이징 및 시장별 필터링 적용"""
+    market: str,
+    screener: Optional[stock_schema.StockScreener] = None,
+) -> Dict[str, Any]:
+    """페이징 및 시장별 필터링 적용, 스크리너 조건(정렬/범위/거래소/통화)은 SQL에서 처리 (PaginatedStockResponse 모양의 dict)"""
     market_type = market if market != "all" else None
 
     # 총 아이템 개수 계산
-    total_items = await crud_stock.count_stocks(db, market_type)
+    total_items = await crud_stock.count_stocks(db, market_type, screener)
     total_pages = math.ceil(total_items / size)
 
     # 페이징 계산
     skip = (page - 1) * size
 
-    # 페이징된 주식 목록
-    db_stocks = await crud_stock.get_stocks_paginated(db, skip=skip, limit=size, market_type=market_type)
+    # 페이징된 주식 목록 + 최신 시세 스냅샷 (단일 쿼리, 이력 크기와 무관)
+    rows = await crud_stock.get_stocks_with_latest_quote_paginated(
+        db, skip=skip, limit=size, market_type=market_type, screener=screener
+    )
 
     # 각 주식의 최근 가격 정보 조합
-    response_items = []
-    for stock in db_stocks:
-        latest_price_db = await crud_price.get_latest_price_for_stock(db, stock.id)
+    response_items = _build_stock_items(rows)
 
-        stock_data = stock_schema.StockResponse.from_orm(stock)
+    # 최종 페이징 응답 반환
+    return {
+        "total_items": total_items,
+        "total_pages": total_pages,
+        "page": page,
+        "size": size,
+        "items": response_items,
+    }
 
-        if latest_price_db:
-            stock_data.latest_price = stock_schema.StockPriceResponse.from_orm(latest_price_db)
+async def get_paginated_stock_list(
+    db: AsyncSession,
+    page: int,
+    size: int,
+    market: str,
+    screener: Optional[stock_schema.StockScreener] = None,
+) -> stock_schema.PaginatedStockResponse:
+    """페이징 및 시장별 필터링 적용 (검증된 응답 모델)"""
+    return stock_schema.PaginatedStockResponse.model_validate(
+        await _get_paginated_stock_page(db=db, page=page, size=size, market=market, screener=screener)
+    )
+
+async def _get_cursor_stock_page(
+    db: AsyncSession,
+    cursor: Optional[str],
+    size: int,
+    market: str,
+    include_total: bool = False,
+) -> Dict[str, Any]:
+    """커서(keyset) 페이징 및 시장별 필터링 적용, 총 개수는 요청 시에만 계산 (CursorStockResponse 모양의 dict)"""
+    market_type = market if market != "all" else None
+    after = decode_cursor(cursor) if cursor else None
+
+    # 다음 페이지 존재 여부 확인을 위해 1개 더 조회
+    rows = await crud_stock.get_stocks_with_latest_quote_after(
+        db, after=after, limit=size + 1, market_type=market_type
+    )
+    has_next = len(rows) > size
+    rows = rows[:size]
+
+    next_cursor = None
+    if has_next:
+        next_cursor = encode_cursor(rows[-1]["symbol"], rows[-1]["id"])
+
+    total_items = await crud_stock.count_stocks(db, market_type) if include_total else None
+
+    return {
+        "size": size,
+        "next_cursor": next_cursor,
+        "total_items": total_items,
+        "items": _build_stock_items(rows),
+    }
+
+async def get_cursor_stock_list(
+    db: AsyncSession,
+    cursor: Optional[str],
+    size: int,
+    market: str,
+    include_total: bool = False,
+) -> stock_schema.CursorStockResponse:
+    """커서(keyset) 페이징 및 시장별 필터링 적용 (검증된 응답 모델)"""
+    return stock_schema.CursorStockResponse.model_validate(
+        await _get_cursor_stock_page(db=db, cursor=cursor, size=size, market=market, include_total=include_total)
+    )
+
+async def get_paginated_stock_list_json(
+    db: AsyncSession,
+    page: int,
+    size: int,
+    market: str,
+    screener: Optional[stock_schema.StockScreener] = None,
+    dataset_version: int = 0,
+) -> bytes:
+    """
+    get_paginated_stock_list 결과를 직렬화된 JSON으로 반환 (캐시 적용, 모델 검증 생략)
+    dataset_version을 캐시 키에 넣어 다른 레플리카가 적재한 뒤에는 이전 응답을 쓰지 않음
+    """
+    key = ("page", dataset_version, page, size, market, *(screener.model_dump().values() if screener else ()))
+
+    async def produce() -> bytes:
+        return orjson.dumps(await _get_paginated_stock_page(db=db, page=page, size=size, market=market, screener=screener))
+
+    return await stock_list_cache.get_or_set(key, produce)
+
+async def get_cursor_stock_list_json(
+    db: AsyncSession,
+    cursor: Optional[str],
+    size: int,
+    market: str,
+    include_total: bool = False,
+    dataset_version: int = 0,
+) -> bytes:
+    """get_cursor_stock_list 결과를 직렬화된 JSON으로 반환 (캐시 적용, 모델 검증 생략, 캐시 키에 dataset_version 포함)"""
+    key = ("cursor", dataset_version, cursor or "", size, market, include_total)
 
-        response_items.append(stock_data)
+    async def produce() -> bytes:
+        return orjson.dumps(await _get_cursor_stock_page(
+            db=db, cursor=cursor, size=size, market=market, include_total=include_total
+        ))
 
-    # 최종 페이징 응답 객체 반환
-    return stock_schema.PaginatedStockResponse(
-        total_items=total_items,
-        total_pages=total_pages,
-        page=page,
-        size=size,
-        items=response_items
-    )
\ No newline at end of file
+    return await stock_list_cache.get_or_set(key, produce)
\ No newline at end of file
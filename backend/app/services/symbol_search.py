@@ -0,0 +1,255 @@
+# 종목 검색/자동완성 (메모리 내 접두사 + n-gram 색인, 한글 초성 검색)
+#
+# 검색 대상 키: 티커, 영문명, 한글명, 한글명 초성 (소문자, 공백 제거, 한글은 자모로 분해)
+# - 한글을 자모로 비교해 입력 중인 글자도 일치 (예: "사", "삼성저", "삼성ㅈ" → 삼성전자)
+# - 접두사: 일치 종류별 키 정렬 목록에서 이분 탐색 (영문명은 단어 시작 위치도 키로 추가)
+# - 중간 일치: 2글자는 bigram, 3글자 이상은 trigram 색인 교집합 후 포함 여부 확인
+# 색인은 시작 시 stocks 테이블에서 만들고, 이름이 바뀌면 다시 만들어 통째로 교체
+
+import asyncio
+import logging
+import time
+from bisect import bisect_left
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Mapping, Optional, Sequence, Set, Tuple
+
+import numpy as np
+from sqlalchemy.future import select
+
+from ..core.config import settings
+from ..db.database import AsyncSessionLocal, ReadSessionLocal
+from ..models import stock_model
+
+logger = logging.getLogger(__name__)
+
+CHOSEONG = "ㄱㄲㄴㄷㄸㄹㅁㅂㅃㅅㅆㅇㅈㅉㅊㅋㅌㅍㅎ"
+HANGUL_START = 0xAC00
+HANGUL_END = 0xD7A3
+SYLLABLES_PER_CHOSEONG = 21 * 28
+JUNGSEONG = "ㅏㅐㅑㅒㅓㅔㅕㅖㅗㅘㅙㅚㅛㅜㅝㅞㅟㅠㅡㅢㅣ"
+JONGSEONG = ("", *"ㄱㄲㄳㄴㄵㄶㄷㄹㄺㄻㄼㄽㄾㄿㅀㅁㅂㅄㅅㅆㅇㅈㅊㅋㅌㅍㅎ")
+
+# 겹모음/겹받침 → 입력 순서대로 (두벌식 입력 중간 상태와 맞추기 위해, 예: 과 → ㄱㅗㅏ, 닭 → ㄷㅏㄹㄱ)
+COMPOUND_JAMO = {
+    "ㅘ": "ㅗㅏ", "ㅙ": "ㅗㅐ", "ㅚ": "ㅗㅣ", "ㅝ": "ㅜㅓ", "ㅞ": "ㅜㅔ", "ㅟ": "ㅜㅣ", "ㅢ": "ㅡㅣ",
+    "ㄳ": "ㄱㅅ", "ㄵ": "ㄴㅈ", "ㄶ": "ㄴㅎ", "ㄺ": "ㄹㄱ", "ㄻ": "ㄹㅁ", "ㄼ": "ㄹㅂ", "ㄽ": "ㄹㅅ",
+    "ㄾ": "ㄹㅌ", "ㄿ": "ㄹㅍ", "ㅀ": "ㄹㅎ", "ㅄ": "ㅂㅅ",
+}
+
+def _decompose(code: int) -> str:
+    choseong, rest = divmod(code - HANGUL_START, SYLLABLES_PER_CHOSEONG)
+    jamo = CHOSEONG[choseong] + JUNGSEONG[rest // 28] + JONGSEONG[rest % 28]
+    return "".join(COMPOUND_JAMO.get(char, char) for char in jamo)
+
+# str.translate용 표: 음절/겹자모 → 자모
+_JAMO_TABLE = {code: _decompose(code) for code in range(HANGUL_START, HANGUL_END + 1)}
+_JAMO_TABLE.update({ord(char): jamo for char, jamo in COMPOUND_JAMO.items()})
+
+_EMPTY_IDS = np.empty(0, dtype=np.int32)
+
+# 일치 종류별 순위 (작을수록 먼저)
+RANK_EXACT_SYMBOL = 0
+RANK_SYMBOL_PREFIX = 1
+RANK_NAME_PREFIX = 2
+RANK_WORD_PREFIX = 3
+RANK_INFIX = 4
+
+def to_choseong(text: str) -> str:
+    """한글 음절 → 초성 (그 외 문자는 그대로), 예: 애플 → ㅇㅍ"""
+    return "".join(
+        CHOSEONG[(ord(char) - HANGUL_START) // SYLLABLES_PER_CHOSEONG] if HANGUL_START <= ord(char) <= HANGUL_END else char
+        for char in text
+    )
+
+def to_jamo(text: str) -> str:
+    """한글 음절 → 자모 (그 외 문자는 그대로), 예: 삼성 → ㅅㅏㅁㅅㅓㅇ"""
+    return text.translate(_JAMO_TABLE)
+
+def normalize(text: str) -> str:
+    """검색 키 정규화: 소문자, 공백 제거"""
+    return "".join(text.lower().split())
+
+@dataclass(frozen=True)
+class SearchEntry:
+    id: int
+    symbol: str
+    name_en: Optional[str] = None
+    name_ko: Optional[str] = None
+
+class SymbolSearchIndex:
+    """
+    불변 검색 색인 (갱신은 새로 만들어 교체)
+    종목을 (티커 길이, 티커) 순으로 번호를 매겨, 같은 일치 종류 안에서는 번호가 작을수록 앞 순위
+    → 일치 종류별로 가장 작은 번호 limit개만 고르면 되므로 일치 종목 수와 무관하게 빠름
+    """
+
+    def __init__(self, entries: Iterable[SearchEntry]):
+        self.entries: List[SearchEntry] = sorted(entries, key=lambda entry: (len(entry.symbol), entry.symbol))
+        self._by_symbol: Dict[str, int] = {}
+        self._texts: List[Tuple[str, ...]] = []
+        prefix_pairs: Dict[int, List[Tuple[str, int]]] = {
+            RANK_SYMBOL_PREFIX: [],
+            RANK_NAME_PREFIX: [],
+            RANK_WORD_PREFIX: [],
+        }
+        ngrams: Dict[str, List[int]] = {}
+
+        for i, entry in enumerate(self.entries):
+            symbol = normalize(entry.symbol)
+            self._by_symbol[symbol] = i
+            prefix_pairs[RANK_SYMBOL_PREFIX].append((symbol, i))
+
+            texts = [symbol]
+            if entry.name_en:
+                name_en = normalize(entry.name_en)
+                texts.append(name_en)
+                prefix_pairs[RANK_NAME_PREFIX].append((name_en, i))
+                # 영문명 두 번째 단어부터 단어 시작 접두사 (예: "Meta Platforms" → "platforms")
+                words = entry.name_en.lower().split()
+                for w in range(1, len(words)):
+                    prefix_pairs[RANK_WORD_PREFIX].append(("".join(words[w:]), i))
+            if entry.name_ko:
+                # 한글명은 자모 키 (음절 접두사는 자모 접두사이기도 하므로 음절 키는 따로 두지 않음)
+                name_ko = to_jamo(normalize(entry.name_ko))
+                choseong = to_choseong(normalize(entry.name_ko))
+                texts.append(name_ko)
+                prefix_pairs[RANK_NAME_PREFIX].append((name_ko, i))
+                if choseong != name_ko:
+                    texts.append(choseong)
+                    prefix_pairs[RANK_NAME_PREFIX].append((choseong, i))
+            self._texts.append(tuple(texts))
+
+            grams = {text[k:k + n] for text in texts for n in (2, 3) for k in range(len(text) - n + 1)}
+            for gram in grams:
+                ngrams.setdefault(gram, []).append(i) # i가 증가하므로 정렬된 상태
+
+        # 일치 종류별 (정렬된 키 목록, 같은 순서의 종목 번호 배열)
+        self._prefixes: Dict[int, Tuple[List[str], np.ndarray]] = {}
+        for rank, pairs in prefix_pairs.items():
+            pairs.sort()
+            self._prefixes[rank] = ([key for key, _ in pairs], np.array([i for _, i in pairs], dtype=np.int32))
+        self._ngrams: Dict[str, np.ndarray] = {gram: np.array(ids, dtype=np.int32) for gram, ids in ngrams.items()}
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    @staticmethod
+    def _smallest(ids: np.ndarray, k: int) -> np.ndarray:
+        """번호 배열에서 가장 작은 서로 다른 번호 k개 (한 종목이 여러 키로 들어 있을 수 있음)"""
+        if len(ids) > 4 * k:
+            ids = np.partition(ids, 4 * k)[:4 * k]
+        return np.unique(ids)[:k]
+
+    def search(self, query: str, limit: int = 10) -> List[SearchEntry]:
+        """
+        티커/영문명/한글명/초성 검색, 일치 종류 → 티커 길이 → 티커 순
+        한글은 자모로 비교: 입력 중인 마지막 글자(받침이 다음 글자로 넘어갈 수 있는 음절, 초성만 친 자음)도 일치
+        """
+        query_text = normalize(query)
+        if not query_text:
+            return []
+        q = to_jamo(query_text)
+        found: List[int] = []
+        seen: Set[int] = set()
+
+        def take(ids: Iterable[int]) -> bool:
+            for i in ids:
+                if i not in seen:
+                    seen.add(i)
+                    found.append(i)
+                    if len(found) >= limit:
+                        return True
+            return False
+
+        def result() -> List[SearchEntry]:
+            return [self.entries[i] for i in found]
+
+        exact = self._by_symbol.get(query_text)
+        if exact is not None and take((exact,)):
+            return result()
+
+        # 접두사 일치 (일치 종류 순)
+        for rank in (RANK_SYMBOL_PREFIX, RANK_NAME_PREFIX, RANK_WORD_PREFIX):
+            keys, ids = self._prefixes[rank]
+            lo = bisect_left(keys, q)
+            hi = bisect_left(keys, q + "\U0010ffff", lo)
+            if lo < hi and take(self._smallest(ids[lo:hi], limit + len(found)).tolist()):
+                return result()
+
+        # 중간 일치: n-gram 번호 배열 교집합 (정렬 상태 유지) → 작은 번호부터 확인
+        # (한 글자 검색어는 자모로 여러 글자여도 접두사만)
+        if len(query_text) >= 2:
+            n = 2 if len(q) == 2 else 3
+            postings = sorted(
+                (self._ngrams.get(q[k:k + n], _EMPTY_IDS) for k in range(len(q) - n + 1)),
+                key=len,
+            )
+            candidates = postings[0]
+            for posting in postings[1:]:
+                if not len(candidates):
+                    break
+                candidates = np.intersect1d(candidates, posting, assume_unique=True)
+            if len(q) == n:
+                # n-gram 자체가 검색어 → 확인 불필요
+                take(candidates[:limit + len(found)].tolist())
+            else:
+                take(i for i in candidates.tolist() if any(q in text for text in self._texts[i]))
+        return result()
+
+    def has_changes(self, stocks: Sequence[Mapping[str, Optional[str]]]) -> bool:
+        """symbol/name_en/name_ko 중 색인과 다른 값이 있는지 (없는 키는 비교하지 않음)"""
+        for stock in stocks:
+            i = self._by_symbol.get(normalize(stock["symbol"]))
+            if i is None:
+                return True
+            entry = self.entries[i]
+            for field in ("name_en", "name_ko"):
+                if field in stock and stock[field] is not None and stock[field] != getattr(entry, field):
+                    return True
+        return False
+
+# 현재 색인 (rebuild_index가 교체), 만든 시각
+index = SymbolSearchIndex([])
+_built_at = 0.0
+_rebuild_lock = asyncio.Lock()
+_background_rebuild: Optional[asyncio.Task] = None
+
+async def rebuild_index(use_replica: bool = False):
+    """
+    stocks 테이블에서 색인을 새로 만들어 교체
+    주기 재생성은 읽기 레플리카, 적재 직후 재생성은 방금 쓴 이름이 보이도록 primary에서 읽음
+    """
+    global index, _built_at
+    session_factory = ReadSessionLocal if use_replica else AsyncSessionLocal
+    async with _rebuild_lock:
+        async with session_factory() as db:
+            result = await db.execute(
+                select(stock_model.Stock.id, stock_model.Stock.symbol, stock_model.Stock.name_en, stock_model.Stock.name_ko)
+            )
+            entries = [SearchEntry(*row) for row in result.tuples().all()]
+        index = SymbolSearchIndex(entries)
+        _built_at = time.monotonic()
+    logger.info(f"✅ 종목 검색 색인을 만들었습니다. ({len(entries)}개)")
+
+async def refresh_if_changed(stocks: Sequence[Mapping[str, Optional[str]]]):
+    """적재한 종목의 이름이 색인과 다르면 색인 재생성"""
+    if index.has_changes(stocks):
+        await rebuild_index()
+
+async def _rebuild_quietly():
+    try:
+        await rebuild_index(use_replica=True)
+    except Exception as e:
+        logger.error(f"⛔ 종목 검색 색인을 만드는 중 오류가 발생했습니다: {e}")
+
+def search(query: str, limit: int = 10) -> List[SearchEntry]:
+    """
+    현재 색인으로 검색
+    색인이 SEARCH_INDEX_MAX_AGE_SECONDS보다 오래되면 백그라운드로 재생성 (다른 레플리카의 이름 변경 반영)
+    """
+    global _background_rebuild
+    if time.monotonic() - _built_at > settings.SEARCH_INDEX_MAX_AGE_SECONDS and (
+        _background_rebuild is None or _background_rebuild.done()
+    ):
+        _background_rebuild = asyncio.create_task(_rebuild_quietly(), name="search-index-rebuild")
+    return index.search(query, limit)
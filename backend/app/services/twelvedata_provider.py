@@ -0,0 +1,210 @@
+# Twelvedata 시세 제공자: quote (다중 심볼), time_series (CSV 스트리밍), NASDAQ100 종목 목록
+
+import json
+import logging
+from datetime import date
+from typing import Any, AsyncIterator, Dict, List, Optional, Sequence, Tuple
+
+import httpx
+
+from ..core import http_client
+from ..core.config import settings, NASDAQ_100_SYMBOLS
+from ..core.market_calendar import US_EQUITY_CALENDAR
+from ..schemas import stock_schema
+from .fetch_scheduler import RetryableFetchError, TokenBucket
+from .market_data import ProviderLimits
+
+logger = logging.getLogger(__name__)
+
+# 재시도 대상 HTTP 상태 코드 (Twelvedata는 본문 code로도 전달)
+_RETRYABLE_STATUS_CODES = {429, 500, 502, 503, 504}
+
+# time_series 요청 1회당 최대 봉 수
+MAX_HISTORY_PAGE_SIZE = 5000
+
+def _safe_float_cast(value: Optional[str]) -> Optional[float]:
+    """문자열을 float로 변환"""
+    if value is None:
+        return None
+    try:
+        return float(value)
+    except (ValueError, TypeError):
+        return None
+
+def _parse_retry_after(response: httpx.Response) -> Optional[float]:
+    """Retry-After 헤더(초) 파싱"""
+    try:
+        return float(response.headers["Retry-After"])
+    except (KeyError, ValueError):
+        return None
+
+def _is_twelvedata_error(data: Dict[str, Any]) -> bool:
+    """Twelvedata 오류 응답 여부 (HTTP 200이어도 본문에 status=error로 오는 경우 있음)"""
+    return data.get("status") == "error"
+
+def _extract_twelvedata_quote(symbol: str, data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """Twelvedata Quote 응답(단일 종목) → 저장용 필드 추출, 종가가 없으면 None"""
+    extracted_data = {
+        "name_en": data.get("name"),
+        "exchange": data.get("exchange"),
+        "currency": data.get("currency"),
+        "fifty_two_week_low": _safe_float_cast(data.get("fifty_two_week", {}).get("low")),
+        "fifty_two_week_high": _safe_float_cast(data.get("fifty_two_week", {}).get("high")),
+
+        "open_price": _safe_float_cast(data.get("open")),
+        "high_price": _safe_float_cast(data.get("high")),
+        "low_price": _safe_float_cast(data.get("low")),
+        "volume": _safe_float_cast(data.get("volume")),
+        "change": _safe_float_cast(data.get("change")),
+        "percent_change": _safe_float_cast(data.get("percent_change")),
+    }
+
+    # 1. 종가 (close 또는 previous_close)
+    if data.get("is_market_open") == True and data.get("close"):
+        extracted_data["close_price"] = _safe_float_cast(data.get("close"))
+    elif data.get("previous_close"):
+        extracted_data["close_price"] = _safe_float_cast(data.get("previous_close"))
+    elif data.get("close"): # Fallback
+        extracted_data["close_price"] = _safe_float_cast(data.get("close"))
+    else:
+        logger.warning(f"⚠️ API 응답에서 {symbol}에 대한 종가를 찾을 수 없습니다: {data}")
+        return None
+
+    return extracted_data
+
+def _to_bar(row: Dict[str, str]) -> Dict[str, Any]:
+    """CSV 한 줄 → 일봉 (date, open, high, low, close, volume)"""
+    return {
+        "date": date.fromisoformat(row["datetime"][:10]),
+        "open": _safe_float_cast(row.get("open")),
+        "high": _safe_float_cast(row.get("high")),
+        "low": _safe_float_cast(row.get("low")),
+        "close": _safe_float_cast(row.get("close")),
+        "volume": _safe_float_cast(row.get("volume")),
+    }
+
+class TwelvedataProvider:
+    """Twelvedata (해외 주식, 미국 시장 캘린더)"""
+
+    name = "twelvedata"
+    market_type = "overseas"
+    calendar = US_EQUITY_CALENDAR
+
+    def __init__(self):
+        self.limiter = TokenBucket(rate_per_minute=self.limits.credits_per_minute)
+
+    @property
+    def limits(self) -> ProviderLimits:
+        return ProviderLimits(
+            credits_per_minute=settings.TWELVEDATA_CREDITS_PER_MINUTE,
+            quote_batch_size=settings.TWELVEDATA_BATCH_SIZE,
+            max_concurrency=settings.FETCH_MAX_CONCURRENCY,
+            history_page_size=MAX_HISTORY_PAGE_SIZE,
+        )
+
+    def is_configured(self) -> bool:
+        return bool(settings.TWELVEDATA_API_KEY)
+
+    async def list_symbols(self) -> List[Dict[str, Any]]:
+        """nasdaq100_symbols.txt 종목 (영문명은 첫 시세 적재 때 API 값으로 갱신)"""
+        return [
+            stock_schema.StockCreate(
+                symbol=symbol,
+                name_en=symbol,
+                name_ko=name_ko,
+                market_type=self.market_type,
+                api_source=self.name,
+            ).model_dump()
+            for symbol, name_ko in NASDAQ_100_SYMBOLS
+        ]
+
+    async def fetch_quotes(self, symbols: Sequence[str]) -> Tuple[Dict[str, Dict[str, Any]], Dict[str, str]]:
+        """
+        quote 엔드포인트: 여러 종목 Quote를 요청 1회로 가져오기 (symbol=AAPL,MSFT,...)
+        재시도 대상(429, 5xx, 네트워크 오류)은 RetryableFetchError 발생
+        """
+        client = http_client.get_http_client()
+        try:
+            response = await client.get(
+                f"{settings.TWELVEDATA_BASE_URL}/quote",
+                params={"symbol": ",".join(symbols), "apikey": settings.TWELVEDATA_API_KEY},
+            )
+        except httpx.TransportError as e:
+            raise RetryableFetchError(f"네트워크 오류: {e!r}")
+
+        if response.status_code in _RETRYABLE_STATUS_CODES:
+            raise RetryableFetchError(f"HTTP {response.status_code}", retry_after=_parse_retry_after(response))
+        response.raise_for_status()
+        data = response.json()
+
+        # 요청 전체 오류 (예: 크레딧 초과는 HTTP 200 + 본문 code=429로 오기도 함)
+        if _is_twelvedata_error(data):
+            if data.get("code") in _RETRYABLE_STATUS_CODES:
+                raise RetryableFetchError(f"API 오류 {data.get('code')}: {data.get('message')}")
+            return {}, {symbol: f"API 오류: {data.get('message')}" for symbol in symbols}
+
+        # 심볼이 1개면 Quote 객체, 여러 개면 {symbol: Quote} 형태로 응답
+        per_symbol = {symbols[0]: data} if len(symbols) == 1 else data
+        quotes: Dict[str, Dict[str, Any]] = {}
+        errors: Dict[str, str] = {}
+        for symbol in symbols:
+            quote = per_symbol.get(symbol)
+            if not isinstance(quote, dict):
+                errors[symbol] = "응답 없음"
+            elif _is_twelvedata_error(quote):
+                if quote.get("code") in _RETRYABLE_STATUS_CODES:
+                    raise RetryableFetchError(f"{symbol} API 오류 {quote.get('code')}: {quote.get('message')}")
+                errors[symbol] = f"API 오류: {quote.get('message')}"
+            else:
+                extracted = _extract_twelvedata_quote(symbol, quote)
+                if extracted is None:
+                    errors[symbol] = "종가 없음"
+                else:
+                    quotes[symbol] = extracted
+        return quotes, errors
+
+    async def stream_history(self, symbol: str, start: date, end: date, page_size: int) -> AsyncIterator[Dict[str, Any]]:
+        """
+        time_series(1day)를 CSV로 받아 한 줄씩 파싱 (과거 → 최신 순)
+        구간에 page_size개보다 많은 봉이 있으면 최신 쪽 page_size개만 옴 (outputsize는 end_date 쪽부터 적용)
+        재시도 대상(429, 5xx, 네트워크 오류)은 RetryableFetchError 발생
+        """
+        client = http_client.get_http_client()
+        params = {
+            "symbol": symbol,
+            "interval": "1day",
+            "start_date": start.isoformat(),
+            "end_date": end.isoformat(),
+            "outputsize": min(page_size, MAX_HISTORY_PAGE_SIZE),
+            "order": "ASC",
+            "format": "CSV",
+            "delimiter": ";",
+            "apikey": settings.TWELVEDATA_API_KEY,
+        }
+        try:
+            async with client.stream("GET", f"{settings.TWELVEDATA_BASE_URL}/time_series", params=params) as response:
+                if response.status_code in _RETRYABLE_STATUS_CODES:
+                    raise RetryableFetchError(f"HTTP {response.status_code}", retry_after=_parse_retry_after(response))
+                response.raise_for_status()
+
+                # 오류는 CSV 요청에도 JSON으로 응답
+                if "json" in response.headers.get("content-type", ""):
+                    data = json.loads(await response.aread())
+                    if data.get("code") in _RETRYABLE_STATUS_CODES:
+                        raise RetryableFetchError(f"API 오류 {data.get('code')}: {data.get('message')}")
+                    if "no data" in str(data.get("message", "")).lower():
+                        return
+                    raise ValueError(f"API 오류: {data.get('message')}")
+
+                header: Optional[List[str]] = None
+                async for line in response.aiter_lines():
+                    line = line.strip()
+                    if not line:
+                        continue
+                    fields = line.split(";")
+                    if header is None:
+                        header = fields
+                        continue
+                    yield _to_bar(dict(zip(header, fields)))
+        except httpx.TransportError as e:
+            raise RetryableFetchError(f"네트워크 오류: {e!r}")
@@ -0,0 +1,123 @@
+# 조회 경로: stock_service.get_paginated_stock_list와 실제 앱 라우터(미들웨어 포함)를 ASGI로 호출
+#
+#   BENCH_DATABASE_URL=... python -m benchmarks.bench_api [--symbols 100 5000] [--years 1]
+#       [--iterations 200] [--concurrency 8] [--output api.json]
+#
+# 변형:
+#   service_paginated   : 서비스 함수 직접 호출 (응답 캐시 없음)
+#   router_list_cold    : GET /stocks (매 요청 전 프로세스 내 목록 캐시 무효화)
+#   router_list_cached  : GET /stocks (같은 페이지 반복, 캐시 적중)
+#   router_list_304     : GET /stocks + If-None-Match (버전 확인만 하고 304)
+#   router_screener     : GET /stocks?sort=percent_change&min_volume=... (캐시 무효화)
+#   router_detail       : GET /stocks/{symbol}
+
+import argparse
+import asyncio
+import time
+from typing import Awaitable, Callable, Dict, List
+
+import httpx
+
+from .common import AsyncSessionLocal, QueryCounter, print_report, reset_schema, seed_universe, summarize
+from app.main import app
+from app.services import stock_service
+
+TRADING_DAYS_PER_YEAR = 252
+PAGE_SIZE = 100
+
+async def _measure(call: Callable[[int], Awaitable[None]], iterations: int, concurrency: int) -> Dict[str, float]:
+    """call(i)를 concurrency개 작업자로 iterations회 실행 → 지연 분포, 처리량(전체 시간 기준), 요청당 DB 왕복 수"""
+    latencies: List[float] = []
+    counter = QueryCounter()
+    queue = iter(range(iterations))
+
+    async def worker():
+        for i in queue:
+            start = time.perf_counter()
+            await call(i)
+            latencies.append(time.perf_counter() - start)
+
+    with counter.track():
+        start = time.perf_counter()
+        await asyncio.gather(*(worker() for _ in range(concurrency)))
+        elapsed = time.perf_counter() - start
+    stats = summarize(latencies)
+    stats["throughput_per_s"] = round(iterations / elapsed, 2) if elapsed else 0.0
+    stats["round_trips_per_request"] = round(counter.count / iterations, 3)
+    return stats
+
+async def run_api(n_symbols: int, iterations: int, concurrency: int) -> List[dict]:
+    """시드된 DB에 대해 조회 변형별 측정"""
+    pages = max(1, n_symbols // PAGE_SIZE)
+
+    async def service_paginated(i: int):
+        async with AsyncSessionLocal() as db:
+            await stock_service.get_paginated_stock_list(db=db, page=i % pages + 1, size=PAGE_SIZE, market="all")
+
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        async def get(path: str, **kwargs) -> httpx.Response:
+            response = await client.get(path, **kwargs)
+            if response.status_code not in (200, 304):
+                response.raise_for_status()
+            return response
+
+        async def router_list_cold(i: int):
+            await stock_service.stock_list_cache.invalidate()
+            await get("/stocks/", params={"page": i % pages + 1, "size": PAGE_SIZE})
+
+        async def router_list_cached(i: int):
+            await get("/stocks/", params={"page": 1, "size": PAGE_SIZE})
+
+        etag = (await get("/stocks/", params={"page": 1, "size": PAGE_SIZE})).headers["ETag"]
+
+        async def router_list_304(i: int):
+            response = await get("/stocks/", params={"page": 1, "size": PAGE_SIZE}, headers={"If-None-Match": etag})
+            assert response.status_code == 304
+
+        async def router_screener(i: int):
+            await stock_service.stock_list_cache.invalidate()
+            await get("/stocks/", params={
+                "page": i % max(1, pages // 2) + 1,
+                "size": PAGE_SIZE,
+                "sort": "percent_change",
+                "min_volume": 100_000,
+            })
+
+        async def router_detail(i: int):
+            await get(f"/stocks/S{i % n_symbols:06d}")
+
+        variants = (
+            ("service_paginated", service_paginated),
+            ("router_list_cold", router_list_cold),
+            ("router_list_cached", router_list_cached),
+            ("router_list_304", router_list_304),
+            ("router_screener", router_screener),
+            ("router_detail", router_detail),
+        )
+        results = []
+        for label, call in variants:
+            await _measure(call, min(iterations, 10), 1)  # warm-up
+            stats = await _measure(call, iterations, concurrency)
+            results.append({"symbols": n_symbols, "variant": label, "concurrency": concurrency, **stats})
+    return results
+
+async def main(args):
+    results = []
+    for n_symbols in args.symbols:
+        await reset_schema()
+        await seed_universe(n_symbols, args.years * TRADING_DAYS_PER_YEAR)
+        results.extend(await run_api(n_symbols, args.iterations, args.concurrency))
+    print_report("api", results, params=vars(args), output=args.output)
+
+def add_arguments(parser: argparse.ArgumentParser):
+    parser.add_argument("--iterations", type=int, default=200)
+    parser.add_argument("--concurrency", type=int, default=8)
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--symbols", type=int, nargs="+", default=[100, 5000])
+    parser.add_argument("--years", type=int, default=1)
+    parser.add_argument("--output", default=None)
+    add_arguments(parser)
+    asyncio.run(main(parser.parse_args()))
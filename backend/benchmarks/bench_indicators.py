@@ -0,0 +1,121 @@
+# 기술적 지표 엔진: 전체 재계산 vs 적재 시 증분 갱신 (5,000종목 × 10년 기본)
+#
+#   python -m benchmarks.bench_indicators [--symbols 5000] [--years 10] [--baseline-sample 50]
+#   BENCH_DATABASE_URL=... python -m benchmarks.bench_indicators --db   # DB 적재/조회 포함
+#
+# 메모리 내 측정 (DB 없이):
+#   per_symbol_full  : 종목마다 전체 이력으로 따로 계산 (기존 클라이언트 방식, 표본 측정 후 환산)
+#   vectorized_full  : 종목 축으로 벡터화한 전체 재계산 (RECOMPUTE_CHUNK_SIZE개씩)
+#   incremental      : 새 봉 1개 → 저장된 상태에서 재생 + 최근 TAIL_BARS 봉으로 윈도 지표
+
+import argparse
+import asyncio
+import time
+
+import numpy as np
+from sqlalchemy import insert, select
+
+from .common import AsyncSessionLocal, QueryCounter, print_report, require_bench_db, reset_schema, seed_universe
+from app.core.config import settings
+from app.models import stock_model
+from app.services import indicator_engine
+
+TRADING_DAYS_PER_YEAR = 252
+
+def _synthetic_closes(n_symbols: int, days: int, seed: int = 42) -> np.ndarray:
+    rng = np.random.default_rng(seed)
+    closes = 100 * np.exp(np.cumsum(rng.normal(0, 0.02, (n_symbols, days)), axis=1))
+    # 상장 기간이 짧은 종목 섞기 (앞쪽 NaN)
+    listed = rng.integers(days // 10, days + 1, n_symbols)
+    closes[np.arange(days)[None, :] < (days - listed)[:, None]] = np.nan
+    return closes
+
+def _full(closes: np.ndarray, chunk_size: int):
+    states = []
+    for i in range(0, len(closes), chunk_size):
+        chunk = closes[i:i + chunk_size]
+        state, base = indicator_engine.run_recursive(chunk, indicator_engine.empty_state(len(chunk)))
+        tail = chunk[:, -indicator_engine.TAIL_BARS:]
+        indicator_engine.compute_indicators(tail, tail, tail, state)
+        states.append(base)
+    return {key: np.concatenate([state[key] for state in states]) for key in states[0]}
+
+def run_in_memory(n_symbols: int, years: int, baseline_sample: int) -> list:
+    days = years * TRADING_DAYS_PER_YEAR
+    closes = _synthetic_closes(n_symbols, days)
+    results = []
+
+    sample = closes[:baseline_sample]
+    start = time.perf_counter()
+    for row in sample:
+        row = row[~np.isnan(row)][None, :]
+        state, _ = indicator_engine.run_recursive(row, indicator_engine.empty_state(1))
+        indicator_engine.compute_indicators(row, row, row, state)
+    per_symbol = (time.perf_counter() - start) / len(sample)
+    results.append({"variant": "per_symbol_full", "symbols": n_symbols, "bars": days, "sampled": len(sample), "wall_ms": round(per_symbol * n_symbols * 1000, 3)})
+
+    start = time.perf_counter()
+    base = _full(closes, indicator_engine.RECOMPUTE_CHUNK_SIZE)
+    results.append({"variant": "vectorized_full", "symbols": n_symbols, "bars": days, "wall_ms": round((time.perf_counter() - start) * 1000, 3)})
+
+    # 마지막 봉이 새로 들어온 상황: base 상태에서 1봉 재생
+    start = time.perf_counter()
+    state, _ = indicator_engine.run_recursive(closes[:, -1:], base)
+    tail = closes[:, -indicator_engine.TAIL_BARS:]
+    indicator_engine.compute_indicators(tail, tail, tail, state)
+    results.append({"variant": "incremental", "symbols": n_symbols, "bars": 1, "wall_ms": round((time.perf_counter() - start) * 1000, 3)})
+    return results
+
+async def run_db(n_symbols: int, years: int) -> list:
+    require_bench_db()
+    await reset_schema()
+    await seed_universe(n_symbols, years * TRADING_DAYS_PER_YEAR)
+    results = []
+
+    counter = QueryCounter()
+    start = time.perf_counter()
+    with counter.track():
+        await indicator_engine.recompute_all_indicators()
+    results.append({"variant": "db_full_recompute", "symbols": n_symbols, "wall_ms": round((time.perf_counter() - start) * 1000, 3), "queries": counter.count})
+
+    # 적재 한 번: 종목마다 다음 날 봉 1개 추가 후 INGEST_BATCH_SIZE개씩 증분 갱신
+    async with AsyncSessionLocal() as db:
+        latest = (await db.execute(select(stock_model.StockIndicator.stock_id, stock_model.StockIndicator.date, stock_model.StockIndicator.close_price))).all()
+        await db.execute(insert(stock_model.StockPrice), [
+            {"stock_id": stock_id, "date": day.fromordinal(day.toordinal() + 1), "close_price": close * 1.01}
+            for stock_id, day, close in latest
+        ])
+        await db.commit()
+    stock_ids = [stock_id for stock_id, _, _ in latest]
+    batch_size = settings.INGEST_BATCH_SIZE
+
+    counter = QueryCounter()
+    latencies = []
+    with counter.track():
+        for i in range(0, len(stock_ids), batch_size):
+            start = time.perf_counter()
+            async with AsyncSessionLocal() as db:
+                await indicator_engine.update_indicators(db, stock_ids[i:i + batch_size])
+                await db.commit()
+            latencies.append(time.perf_counter() - start)
+    results.append({
+        "variant": "db_incremental_ingest",
+        "symbols": n_symbols,
+        "batch_size": batch_size,
+        "wall_ms": round(sum(latencies) * 1000, 3),
+        "per_batch_ms": round(sum(latencies) / len(latencies) * 1000, 3),
+        "queries": counter.count,
+    })
+    return results
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--symbols", type=int, default=5000)
+    parser.add_argument("--years", type=int, default=10)
+    parser.add_argument("--baseline-sample", type=int, default=50)
+    parser.add_argument("--db", action="store_true", help="BENCH_DATABASE_URL에 적재 후 DB 경로 측정")
+    args = parser.parse_args()
+    if args.db:
+        print_report("indicators_db", asyncio.run(run_db(args.symbols, args.years)))
+    else:
+        print_report("indicators", run_in_memory(args.symbols, args.years, args.baseline_sample))
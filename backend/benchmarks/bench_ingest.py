@@ -0,0 +1,122 @@
+# 시세 적재 전체 흐름: update_stock_prices (Twelvedata 제공자) → 로컬 Twelvedata 스텁 (지연/429 비율 설정)
+#
+#   BENCH_DATABASE_URL=... python -m benchmarks.bench_ingest [--symbols 100 5000] [--years 1]
+#       [--latency-ms 50] [--rate-429 0.05] [--credits-per-minute 0] [--backoff-base-ms 50]
+#       [--batch-size 8] [--fetch-concurrency 4] [--output ingest.json]
+#
+# 대상: 최신 시세가 세션 날짜보다 오래된 전 종목 (시드 데이터는 오늘까지라 다음 영업일을 세션 날짜로 사용)
+# 측정: 전체 소요 시간, 종목/초, 성공/실패 종목 수, DB 왕복 수, 외부 API 요청 지연 분포, 스텁 요청/429 수
+
+import argparse
+import asyncio
+import time
+from datetime import date, timedelta
+from typing import List
+
+import httpx
+
+from .common import QueryCounter, print_report, reset_schema, seed_universe, summarize
+from .twelvedata_stub import StubServer
+from app.core import http_client
+from app.core.config import settings
+from app.services import data_fetcher, fetch_scheduler
+
+TRADING_DAYS_PER_YEAR = 252
+
+class LatencyRecorder(httpx.AsyncBaseTransport):
+    """외부 API 요청별 지연 기록 (응답 헤더 수신까지)"""
+
+    def __init__(self, transport: httpx.AsyncBaseTransport):
+        self._transport = transport
+        self.latencies: List[float] = []
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        start = time.perf_counter()
+        try:
+            return await self._transport.handle_async_request(request)
+        finally:
+            self.latencies.append(time.perf_counter() - start)
+
+    async def aclose(self):
+        await self._transport.aclose()
+
+def _next_weekday(day: date) -> date:
+    day += timedelta(days=1)
+    while day.weekday() >= 5:
+        day += timedelta(days=1)
+    return day
+
+def configure(credits_per_minute: float, backoff_base_ms: float, batch_size: int, concurrency: int):
+    """스케줄러 설정 (credits_per_minute <= 0이면 속도 제한 해제 → 전송/저장 비용만 측정)"""
+    settings.TWELVEDATA_BATCH_SIZE = batch_size
+    settings.FETCH_MAX_CONCURRENCY = concurrency
+    settings.FETCH_BACKOFF_BASE_SECONDS = backoff_base_ms / 1000
+    settings.FETCH_BACKOFF_MAX_SECONDS = max(settings.FETCH_BACKOFF_BASE_SECONDS * 8, 0.001)
+    data_fetcher.get_provider("twelvedata").limiter = fetch_scheduler.TokenBucket(
+        rate_per_minute=credits_per_minute if credits_per_minute > 0 else 1e9
+    )
+
+async def run_ingest(n_symbols: int, latency_ms: float, rate_429: float, port: int, seed: int = 0) -> dict:
+    """시드된 DB에 대해 적재 1회 실행 후 결과 반환"""
+    async with StubServer(port=port, latency_ms=latency_ms, rate_429=rate_429, seed=seed) as stub:
+        settings.TWELVEDATA_BASE_URL = stub.base_url
+        await http_client.close_http_client()
+        client = http_client.create_http_client()
+        recorder = LatencyRecorder(client._transport)
+        client._transport = recorder
+        http_client._client = client
+
+        counter = QueryCounter()
+        start = time.perf_counter()
+        with counter.track():
+            reports = await data_fetcher.update_stock_prices(
+                providers=[data_fetcher.get_provider("twelvedata")], session_date=_next_weekday(date.today())
+            )
+        elapsed = time.perf_counter() - start
+        await http_client.close_http_client()
+
+    summary = reports["twelvedata"].summary()
+    provider = summarize(recorder.latencies)
+    return {
+        "symbols": n_symbols,
+        "latency_ms": latency_ms,
+        "rate_429": rate_429,
+        "batch_size": settings.TWELVEDATA_BATCH_SIZE,
+        "concurrency": settings.FETCH_MAX_CONCURRENCY,
+        "wall_ms": round(elapsed * 1000, 3),
+        "symbols_per_s": round(summary["total"] / elapsed, 2) if elapsed else 0.0,
+        **summary,
+        "db_round_trips": counter.count,
+        "db_round_trips_per_symbol": round(counter.count / summary["total"], 3) if summary["total"] else 0.0,
+        "provider_requests": provider["n"],
+        "provider_p50_ms": provider["p50_ms"],
+        "provider_p95_ms": provider["p95_ms"],
+        "provider_p99_ms": provider["p99_ms"],
+        "stub": stub.stats.as_dict(),
+    }
+
+async def main(args):
+    configure(args.credits_per_minute, args.backoff_base_ms, args.batch_size, args.fetch_concurrency)
+    results = []
+    for n_symbols in args.symbols:
+        await reset_schema()
+        await seed_universe(n_symbols, args.years * TRADING_DAYS_PER_YEAR)
+        results.append(await run_ingest(n_symbols, args.latency_ms, args.rate_429, args.port))
+    print_report("ingest", results, params=vars(args), output=args.output)
+
+def add_arguments(parser: argparse.ArgumentParser):
+    parser.add_argument("--latency-ms", type=float, default=50.0, help="스텁 응답 지연")
+    parser.add_argument("--rate-429", type=float, default=0.05, help="스텁 429 응답 비율")
+    parser.add_argument("--credits-per-minute", type=float, default=0, help="분당 크레딧 한도 (0: 제한 없음)")
+    parser.add_argument("--backoff-base-ms", type=float, default=50.0, help="재시도 백오프 기본값")
+    parser.add_argument("--batch-size", type=int, default=settings.TWELVEDATA_BATCH_SIZE, help="요청 1회당 심볼 수")
+    parser.add_argument("--fetch-concurrency", type=int, default=settings.FETCH_MAX_CONCURRENCY, help="동시 요청 수")
+    parser.add_argument("--port", type=int, default=8765)
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--symbols", type=int, nargs="+", default=[100, 5000])
+    parser.add_argument("--years", type=int, default=1)
+    parser.add_argument("--output", default=None)
+    add_arguments(parser)
+    asyncio.run(main(parser.parse_args()))
@@ -0,0 +1,61 @@
+# GET /stocks/{symbol}/prices: 10년 범위 일봉/주봉/월봉/LTTB 조회 지연
+#
+#   BENCH_DATABASE_URL=... python -m benchmarks.bench_price_history [--symbols 100] [--years 10] [--iterations 100]
+
+import argparse
+import asyncio
+import time
+from datetime import date, timedelta
+
+from .common import AsyncSessionLocal, QueryCounter, reset_schema, seed_universe, summarize, print_report
+from app.services import price_history_service
+
+TRADING_DAYS_PER_YEAR = 252
+
+VARIANTS = (
+    ("daily", None),
+    ("weekly", None),
+    ("monthly", None),
+    ("daily", 500),
+)
+
+async def main(n_symbols: int, years: int, iterations: int):
+    await reset_schema()
+    await seed_universe(n_symbols, years * TRADING_DAYS_PER_YEAR)
+
+    end = date.today()
+    start = end - timedelta(days=365 * years)
+    results = []
+    for interval, max_points in VARIANTS:
+        counter = QueryCounter()
+        latencies = []
+        points = 0
+        with counter.track():
+            for i in range(iterations):
+                symbol = f"S{i % n_symbols:06d}"
+                async with AsyncSessionLocal() as db:
+                    t0 = time.perf_counter()
+                    series = await price_history_service.get_price_series(
+                        db, symbol, start, end, interval, max_points
+                    )
+                    series.model_dump_json()
+                    latencies.append(time.perf_counter() - t0)
+                points = series.count
+        results.append({
+            "symbols": n_symbols,
+            "years": years,
+            "interval": interval,
+            "max_points": max_points,
+            "points_per_response": points,
+            "round_trips_per_request": counter.count / iterations,
+            **summarize(latencies),
+        })
+    print_report("price_history", results)
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--symbols", type=int, default=100)
+    parser.add_argument("--years", type=int, default=10)
+    parser.add_argument("--iterations", type=int, default=100)
+    args = parser.parse_args()
+    asyncio.run(main(args.symbols, args.years, args.iterations))
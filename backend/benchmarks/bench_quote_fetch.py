@@ -0,0 +1,57 @@
+# Twelvedata 시세 수집: 종목별 새 클라이언트 단건 요청 vs 공용 클라이언트 다중 심볼 요청
+#
+#   python -m benchmarks.bench_quote_fetch [--symbols 100] [--latency-ms 30]
+
+import argparse
+import asyncio
+import time
+
+import httpx
+
+from .common import print_report
+from .twelvedata_stub import StubServer
+from app.core import http_client
+from app.core.config import settings
+from app.services import data_fetcher, fetch_scheduler
+
+async def _legacy_fetch(symbols, base_url: str):
+    """기존 방식: 종목마다 새 AsyncClient로 단건 요청"""
+    async def fetch_one(symbol):
+        async with httpx.AsyncClient() as client:
+            response = await client.get(f"{base_url}/quote", params={"symbol": symbol, "apikey": "bench"})
+            response.raise_for_status()
+            return response.json()
+    await asyncio.gather(*(fetch_one(symbol) for symbol in symbols))
+
+async def _batch_fetch(symbols, base_url: str):
+    await data_fetcher.fetch_quotes_batch(data_fetcher.get_provider("twelvedata"), symbols)
+
+async def main(n_symbols: int, latency_ms: float, port: int):
+    symbols = [f"S{i:04d}" for i in range(n_symbols)]
+    # 전송 효율만 측정: 분당 크레딧 제한 해제
+    data_fetcher.get_provider("twelvedata").limiter = fetch_scheduler.TokenBucket(rate_per_minute=1e9)
+    results = []
+    for label, fn in (("legacy_per_symbol_client", _legacy_fetch), ("pooled_batch", _batch_fetch)):
+        async with StubServer(port=port, latency_ms=latency_ms) as stub:
+            settings.TWELVEDATA_BASE_URL = stub.base_url
+            await http_client.init_http_client()
+            start = time.perf_counter()
+            await fn(symbols, stub.base_url)
+            elapsed = time.perf_counter() - start
+            await http_client.close_http_client()
+            results.append({
+                "variant": label,
+                "symbols": n_symbols,
+                "batch_size": settings.TWELVEDATA_BATCH_SIZE,
+                "wall_ms": round(elapsed * 1000, 3),
+                **stub.stats.as_dict(),
+            })
+    print_report("quote_fetch", results)
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--symbols", type=int, default=100)
+    parser.add_argument("--latency-ms", type=float, default=30.0)
+    parser.add_argument("--port", type=int, default=8765)
+    args = parser.parse_args()
+    asyncio.run(main(args.symbols, args.latency_ms, args.port))
@@ -0,0 +1,62 @@
+# GET /stocks 스크리너: 전체 종목 정렬 후 상위 N개 (클라이언트 방식) vs SQL 상위 N개 (인덱스)
+#
+#   BENCH_DATABASE_URL=... python -m benchmarks.bench_screener [--symbols 5000 50000] [--iterations 200]
+
+import argparse
+import asyncio
+import time
+
+from .common import AsyncSessionLocal, QueryCounter, reset_schema, seed_universe, summarize, print_report
+from app.crud import crud_stock
+from app.schemas import stock_schema
+
+TOP_N = 20
+
+SCREENS = {
+    "top_gainers": stock_schema.StockScreener(sort="percent_change", order="desc"),
+    "top_volume": stock_schema.StockScreener(sort="volume", order="desc"),
+    "cheapest_usd": stock_schema.StockScreener(sort="close", order="asc", currency="USD"),
+}
+
+async def _client_side(db, screener: stock_schema.StockScreener):
+    """기존 방식: 전체 목록을 받아 정렬"""
+    rows = await crud_stock.get_stocks_with_latest_quote_paginated(db, skip=0, limit=10**9)
+    key = {"percent_change": "quote_percent_change", "volume": "quote_volume", "close": "quote_close_price"}[screener.sort]
+    ranked = [row for row in rows if row[key] is not None]
+    ranked.sort(key=lambda row: row[key], reverse=screener.order == "desc")
+    return ranked[:TOP_N]
+
+async def _sql_top_n(db, screener: stock_schema.StockScreener):
+    return await crud_stock.get_stocks_with_latest_quote_paginated(db, skip=0, limit=TOP_N, screener=screener)
+
+async def _measure(fn, screener, iterations: int):
+    counter = QueryCounter()
+    latencies = []
+    with counter.track():
+        for _ in range(iterations):
+            async with AsyncSessionLocal() as db:
+                start = time.perf_counter()
+                await fn(db, screener)
+                latencies.append(time.perf_counter() - start)
+    stats = summarize(latencies)
+    stats["round_trips_per_request"] = counter.count / iterations
+    return stats
+
+async def main(symbol_counts, iterations: int):
+    results = []
+    for n_symbols in symbol_counts:
+        await reset_schema()
+        await seed_universe(n_symbols, days=2)
+        for screen, screener in SCREENS.items():
+            for label, fn, runs in (("client_side_sort", _client_side, max(3, iterations // 20)), ("sql_top_n", _sql_top_n, iterations)):
+                await _measure(fn, screener, 3)  # warm-up
+                stats = await _measure(fn, screener, runs)
+                results.append({"symbols": n_symbols, "screen": screen, "variant": label, **stats})
+    print_report("screener", results)
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--symbols", type=int, nargs="+", default=[5000, 50000])
+    parser.add_argument("--iterations", type=int, default=200)
+    args = parser.parse_args()
+    asyncio.run(main(args.symbols, args.iterations))
@@ -0,0 +1,140 @@
+# 종목 검색 색인 마이크로 벤치마크: 색인 검색 vs 전체 선형 탐색 (합성 종목, DB 없음)
+#
+#   python -m benchmarks.bench_search [--symbols 10000] [--queries 20000]
+
+import argparse
+import random
+import string
+import time
+
+from .common import print_report, summarize
+from app.services.symbol_search import SearchEntry, SymbolSearchIndex, normalize, to_choseong, to_jamo
+
+WORDS = [
+    "apple", "micro", "systems", "global", "energy", "health", "capital", "digital", "network", "pharma",
+    "semiconductor", "holdings", "motors", "bank", "financial", "software", "foods", "media", "therapeutics", "industries",
+]
+
+# 입력 중인 한글 검색어 → 찾아야 하는 한글명
+IME_CASES = [
+    ("사", "삼성전자"), # 받침이 아직 안 붙은 음절
+    ("삼성저", "삼성전자"),
+    ("삼성ㅈ", "삼성전자"), # 음절 뒤 초성만 입력
+    ("ㅅㅅㅈ", "삼성전자"),
+    ("삼", "사무용품"), # 받침이 다음 글자 초성으로 넘어갈 음절
+    ("고", "과학기술"), # 겹모음 입력 중
+    ("달", "닭갈비"), # 겹받침 입력 중
+]
+
+def _random_hangul(rng: random.Random, length: int) -> str:
+    return "".join(chr(0xAC00 + rng.randrange(0, 11172, 28)) for _ in range(length))
+
+def _composing(text: str, rng: random.Random) -> str:
+    """한글명 접두사 + 입력 중인 다음 글자 (초성만 또는 받침 없는 음절)"""
+    k = rng.randrange(len(text))
+    code = ord(text[k]) - 0xAC00
+    partial = to_choseong(text[k]) if rng.random() < 0.5 else chr(0xAC00 + code - code % 28)
+    return text[:k] + partial
+
+def make_entries(n: int, seed: int = 42):
+    rng = random.Random(seed)
+    symbols = set()
+    while len(symbols) < n:
+        symbols.add("".join(rng.choices(string.ascii_uppercase, k=rng.randint(1, 5))))
+    return [
+        SearchEntry(
+            id=i,
+            symbol=symbol,
+            name_en=" ".join(rng.sample(WORDS, rng.randint(1, 3))).title() + " Inc",
+            name_ko=_random_hangul(rng, rng.randint(2, 6)),
+        )
+        for i, symbol in enumerate(sorted(symbols))
+    ]
+
+def make_queries(entries, n: int, seed: int = 7):
+    """키 입력 중인 검색어: 티커 접두사 / 영문명 접두사 / 한글 부분 / 초성 / 영문 중간 단어 / 입력 중인 한글"""
+    rng = random.Random(seed)
+    queries = []
+    for _ in range(n):
+        entry = rng.choice(entries)
+        kind = rng.randrange(6)
+        if kind == 0:
+            text = entry.symbol
+        elif kind == 1:
+            text = entry.name_en
+        elif kind == 2:
+            text = entry.name_ko[rng.randrange(len(entry.name_ko) - 1):]
+        elif kind == 3:
+            text = to_choseong(entry.name_ko)
+        elif kind == 4:
+            text = rng.choice(entry.name_en.split())
+        else:
+            queries.append(_composing(entry.name_ko, rng))
+            continue
+        queries.append(text[:rng.randint(1, max(1, len(text)))])
+    return queries
+
+def linear_search(entries, query: str, limit: int = 10):
+    """비교용: 모든 종목의 키를 매번 확인 (한글은 자모로 비교, 한 글자 검색어는 접두사만)"""
+    q = to_jamo(normalize(query))
+    prefix_only = len(normalize(query)) < 2
+    matches = []
+    for entry in entries:
+        name_ko = normalize(entry.name_ko or "")
+        keys = [normalize(entry.symbol), normalize(entry.name_en or ""), to_jamo(name_ko), to_choseong(name_ko)]
+        words = (entry.name_en or "").lower().split()
+        keys += ["".join(words[w:]) for w in range(1, len(words))]
+        if any(key.startswith(q) if prefix_only else q in key for key in keys):
+            matches.append(entry)
+    matches.sort(key=lambda entry: (len(entry.symbol), entry.symbol))
+    return matches[:limit]
+
+def check_correctness(entries, index, queries):
+    """
+    색인 결과가 선형 탐색과 같은 종목을 찾는지 (순위는 일치 종류가 먼저라 집합으로 비교)
+    + 입력 중인 한글 검색어(IME_CASES)
+    """
+    errors = []
+    for query in queries:
+        expected = {entry.id for entry in linear_search(entries, query, limit=len(entries))}
+        found = index.search(query, limit=len(entries))
+        if {entry.id for entry in found} != expected:
+            errors.append(query)
+
+    ime_index = SymbolSearchIndex(
+        [SearchEntry(id=i, symbol=f"K{i}", name_ko=name) for i, name in enumerate(sorted({name for _, name in IME_CASES}))]
+    )
+    for query, name_ko in IME_CASES:
+        if name_ko not in [entry.name_ko for entry in ime_index.search(query)]:
+            errors.append(query)
+    if errors:
+        raise AssertionError(f"검색 결과가 다른 검색어 {len(errors)}개: {errors[:10]}")
+
+def main(n_symbols: int, n_queries: int):
+    entries = make_entries(n_symbols)
+    queries = make_queries(entries, n_queries)
+
+    start = time.perf_counter()
+    index = SymbolSearchIndex(entries)
+    build_ms = (time.perf_counter() - start) * 1000
+    check_correctness(entries, index, queries[:200])
+
+    results = []
+    for label, fn, count in (
+        ("index", lambda q: index.search(q), n_queries),
+        ("linear_scan", lambda q: linear_search(entries, q), min(n_queries, 500)),
+    ):
+        latencies = []
+        for query in queries[:count]:
+            start = time.perf_counter()
+            fn(query)
+            latencies.append(time.perf_counter() - start)
+        results.append({"variant": label, "symbols": n_symbols, "build_ms": round(build_ms, 3) if label == "index" else None, **summarize(latencies)})
+    print_report("symbol_search", results)
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--symbols", type=int, default=10000)
+    parser.add_argument("--queries", type=int, default=20000)
+    args = parser.parse_args()
+    main(args.symbols, args.queries)
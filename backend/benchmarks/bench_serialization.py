@@ -0,0 +1,125 @@
+# GET /stocks 응답 생성 CPU: 엔터티 + from_orm + response_model 재검증 (기존) vs 행 매핑 + orjson (현재)
+#
+#   BENCH_DATABASE_URL=... python -m benchmarks.bench_serialization [--symbols 1000] [--sizes 10 100] [--iterations 200]
+#
+# endpoint_* : ASGI로 엔드포인트 호출 (캐시 미적중 상태), 요청당 CPU 시간(process_time)과 지연
+# build_*    : 같은 행으로 응답 본문만 생성 (DB 왕복 제외, 직렬화 비용만)
+
+import argparse
+import asyncio
+import json
+import time
+
+import httpx
+import orjson
+from fastapi import Depends, FastAPI, Query
+from fastapi.responses import JSONResponse
+from sqlalchemy import func
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.future import select
+
+from .common import AsyncSessionLocal, print_report, reset_schema, seed_universe, summarize
+from app.crud import crud_stock
+from app.db.database import get_db
+from app.models import stock_model
+from app.routers import stocks
+from app.schemas import stock_schema
+from app.services import indicator_engine, stock_service
+
+async def _legacy_rows(db: AsyncSession, skip: int, limit: int):
+    """기존 방식: Stock/StockLatestQuote/StockIndicator 엔터티 조회"""
+    result = await db.execute(
+        select(stock_model.Stock, stock_model.StockLatestQuote, stock_model.StockIndicator)
+        .outerjoin(stock_model.StockLatestQuote, stock_model.StockLatestQuote.stock_id == stock_model.Stock.id)
+        .outerjoin(stock_model.StockIndicator, stock_model.StockIndicator.stock_id == stock_model.Stock.id)
+        .order_by(stock_model.Stock.id)
+        .offset(skip)
+        .limit(limit)
+    )
+    return result.tuples().all()
+
+def _legacy_build(rows, total_items: int, page: int, size: int) -> stock_schema.PaginatedStockResponse:
+    """기존 방식: 항목마다 from_orm + 중첩 모델 생성"""
+    items = []
+    for stock, quote, indicator in rows:
+        item = stock_schema.StockResponse.from_orm(stock)
+        if quote:
+            item.latest_price = stock_schema.StockPriceResponse(
+                id=quote.price_id,
+                **{column: getattr(quote, column) for column in crud_stock.QUOTE_RESPONSE_COLUMNS},
+            )
+        if indicator:
+            item.indicators = stock_schema.StockIndicatorResponse.from_orm(indicator)
+        items.append(item)
+    return stock_schema.PaginatedStockResponse(
+        total_items=total_items, total_pages=-(-total_items // size), page=page, size=size, items=items
+    )
+
+def create_bench_app() -> FastAPI:
+    bench_app = FastAPI()
+    bench_app.include_router(stocks.router)
+
+    @bench_app.get("/legacy/stocks", response_model=stock_schema.PaginatedStockResponse, response_class=JSONResponse)
+    async def legacy_read_stocks(page: int = Query(1), size: int = Query(10), db: AsyncSession = Depends(get_db)):
+        total_items = (await db.execute(select(func.count()).select_from(stock_model.Stock))).scalar_one()
+        rows = await _legacy_rows(db, (page - 1) * size, size)
+        # response_model로 다시 검증 + jsonable_encoder + json.dumps
+        return _legacy_build(rows, total_items, page, size)
+
+    return bench_app
+
+async def _measure_endpoint(client: httpx.AsyncClient, path: str, size: int, pages: int, iterations: int):
+    cpu, latencies = [], []
+    for i in range(iterations):
+        await stock_service.invalidate_stock_list_cache()
+        params = {"page": i % pages + 1, "size": size}
+        cpu_start, start = time.process_time(), time.perf_counter()
+        response = await client.get(path, params=params)
+        latencies.append(time.perf_counter() - start)
+        cpu.append(time.process_time() - cpu_start)
+        response.raise_for_status()
+    return {**summarize(latencies), "cpu_ms_per_request": round(sum(cpu) / iterations * 1000, 3), "bytes": len(response.content)}
+
+def _measure_build(fn, iterations: int):
+    cpu_start = time.process_time()
+    for _ in range(iterations):
+        fn()
+    return {"cpu_ms_per_call": round((time.process_time() - cpu_start) / iterations * 1000, 3)}
+
+async def main(n_symbols: int, sizes, iterations: int):
+    await reset_schema()
+    await seed_universe(n_symbols, days=30)
+    await indicator_engine.recompute_all_indicators()
+
+    results = []
+    transport = httpx.ASGITransport(app=create_bench_app())
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        for size in sizes:
+            pages = max(1, n_symbols // size)
+            for label, path in (("endpoint_legacy", "/legacy/stocks"), ("endpoint_rows_orjson", "/stocks/")):
+                await _measure_endpoint(client, path, size, pages, 5)  # warm-up
+                stats = await _measure_endpoint(client, path, size, pages, iterations)
+                results.append({"variant": label, "size": size, **stats})
+
+            async with AsyncSessionLocal() as db:
+                entity_rows = await _legacy_rows(db, 0, size)
+                mapping_rows = await crud_stock.get_stocks_with_latest_quote_paginated(db, skip=0, limit=size)
+
+            def legacy():
+                response = _legacy_build(entity_rows, n_symbols, 1, size)
+                json.dumps(stock_schema.PaginatedStockResponse.model_validate(response).model_dump(mode="json"))
+
+            def current():
+                orjson.dumps({"total_items": n_symbols, "items": stock_service._build_stock_items(mapping_rows)})
+
+            results.append({"variant": "build_legacy", "size": size, **_measure_build(legacy, iterations)})
+            results.append({"variant": "build_rows_orjson", "size": size, **_measure_build(current, iterations)})
+    print_report("serialization", results)
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--symbols", type=int, default=1000)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10, 100])
+    parser.add_argument("--iterations", type=int, default=200)
+    args = parser.parse_args()
+    asyncio.run(main(args.symbols, args.sizes, args.iterations))
@@ -0,0 +1,57 @@
+# GET /stocks 목록 조회: 종목별 최신 가격 N+1 조회 vs 최신 시세 스냅샷 조인
+#
+#   BENCH_DATABASE_URL=... python -m benchmarks.bench_stock_list [--symbols 100 5000] [--days 60] [--iterations 50]
+
+import argparse
+import asyncio
+import time
+
+from .common import AsyncSessionLocal, QueryCounter, reset_schema, seed_universe, summarize, print_report
+from app.crud import crud_stock, crud_price
+from app.services import stock_service
+
+PAGE_SIZE = 100
+
+async def _legacy_page(db, skip: int, limit: int):
+    """기존 방식: 카운트 + 페이지 + 종목별 최신 가격 조회"""
+    await crud_stock.count_stocks(db, None)
+    stocks = await crud_stock.get_stocks_paginated(db, skip=skip, limit=limit)
+    return [(stock, await crud_price.get_latest_price_for_stock(db, stock.id)) for stock in stocks]
+
+async def _current_page(db, skip: int, limit: int):
+    page = skip // limit + 1
+    return await stock_service.get_paginated_stock_list(db=db, page=page, size=limit, market="all")
+
+async def _measure(fn, n_symbols: int, iterations: int):
+    counter = QueryCounter()
+    latencies = []
+    pages = max(1, n_symbols // PAGE_SIZE)
+    with counter.track():
+        for i in range(iterations):
+            skip = (i % pages) * PAGE_SIZE
+            async with AsyncSessionLocal() as db:
+                start = time.perf_counter()
+                await fn(db, skip, PAGE_SIZE)
+                latencies.append(time.perf_counter() - start)
+    stats = summarize(latencies)
+    stats["round_trips_per_request"] = counter.count / iterations
+    return stats
+
+async def main(symbol_counts, days: int, iterations: int):
+    results = []
+    for n_symbols in symbol_counts:
+        await reset_schema()
+        await seed_universe(n_symbols, days)
+        for label, fn in (("legacy_n_plus_1", _legacy_page), ("latest_quote_snapshot", _current_page)):
+            await _measure(fn, n_symbols, 3)  # warm-up
+            stats = await _measure(fn, n_symbols, iterations)
+            results.append({"symbols": n_symbols, "days": days, "variant": label, **stats})
+    print_report("stock_list", results)
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--symbols", type=int, nargs="+", default=[100, 5000])
+    parser.add_argument("--days", type=int, default=60)
+    parser.add_argument("--iterations", type=int, default=50)
+    args = parser.parse_args()
+    asyncio.run(main(args.symbols, args.days, args.iterations))
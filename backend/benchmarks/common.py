@@ -0,0 +1,225 @@
+# 벤치마크 공통 유틸 (벤치용 DB 준비, 합성 데이터 적재, 쿼리 카운트, 지연 통계)
+#
+# 실행 예시 (backend 디렉토리에서):
+#   BENCH_DATABASE_URL=postgresql+asyncpg://user:pw@localhost:5432/bench python -m benchmarks.bench_stock_list
+#
+# DB를 쓰지 않는 벤치마크(외부 API 스텁 등)는 BENCH_DATABASE_URL 없이 실행 가능
+# 주의: BENCH_DATABASE_URL의 테이블은 매 실행마다 삭제 후 재생성됨 (운영 DB 사용 금지)
+
+import os
+import sys
+import json
+import math
+import random
+import subprocess
+import time
+from contextlib import contextmanager
+from datetime import date, timedelta
+from typing import Any, Dict, List, Optional
+
+BENCH_DATABASE_URL = os.getenv("BENCH_DATABASE_URL")
+
+# app 모듈 import 전에 설정값 채우기 (app 엔진이 벤치 DB를 바라보도록)
+# DB가 필요 없는 벤치마크는 BENCH_DATABASE_URL 없이 실행 가능 (엔진은 연결 전까지 접속하지 않음)
+os.environ["DATABASE_URL"] = BENCH_DATABASE_URL or "postgresql+asyncpg://bench@127.0.0.1:5432/bench"
+os.environ.setdefault("TWELVE_DATA_API_KEY", "bench")
+os.environ.setdefault("TWELVEDATA_BASE_URL", "http://127.0.0.1:8765")
+
+from sqlalchemy import event, insert, text  # noqa: E402
+from sqlalchemy.ext.asyncio import AsyncEngine  # noqa: E402
+
+from app.db.database import Base, engine, AsyncSessionLocal  # noqa: E402
+from app.crud import crud_price  # noqa: E402
+from app.models import stock_model  # noqa: E402
+
+__all__ = [
+    "engine",
+    "AsyncSessionLocal",
+    "require_bench_db",
+    "reset_schema",
+    "seed_universe",
+    "QueryCounter",
+    "summarize",
+    "print_report",
+]
+
+INSERT_CHUNK = 5000
+
+# PostgreSQL 서버 측 생성: INSERT ... SELECT 1회에 만드는 최대 행 수 (윈도 함수 정렬 메모리 제한)
+SERVER_SIDE_ROWS_PER_STATEMENT = 2_000_000
+
+# 종목별 합성 일봉을 DB 안에서 생성 (로그 수익률 랜덤워크, 일간 ±3% 균등분포)
+# 50,000종목 × 수년치처럼 큰 유니버스를 Python에서 행을 만들어 보내는 것보다 훨씬 빠름
+_SEED_PRICES_SQL = text("""
+    INSERT INTO stock_prices (stock_id, date, open_price, high_price, low_price, close_price, volume, change, percent_change)
+    SELECT stock_id, d, prev, GREATEST(prev, close) * 1.01, LEAST(prev, close) * 0.99, close, volume,
+           close - prev, (close - prev) / prev * 100
+    FROM (
+        SELECT stock_id, d, volume,
+               base * EXP(SUM(r) OVER w) AS close,
+               base * EXP(SUM(r) OVER w - r) AS prev
+        FROM (
+            SELECT s.id AS stock_id, t.d,
+                   10 + (s.id * 7919 % 490) AS base,
+                   LN(1 + (random() - 0.5) * 0.06) AS r,
+                   FLOOR(10000 + random() * 4990000) AS volume
+            FROM stocks s CROSS JOIN unnest(CAST(:days AS date[])) AS t(d)
+            WHERE s.id BETWEEN :first_id AND :last_id
+        ) steps
+        WINDOW w AS (PARTITION BY stock_id ORDER BY d)
+    ) walk
+""")
+
+def require_bench_db():
+    """DB를 사용하는 벤치마크 시작 시 호출"""
+    if not BENCH_DATABASE_URL:
+        sys.exit("⛔ BENCH_DATABASE_URL 환경 변수를 설정하세요. (벤치마크 전용 DB)")
+
+async def reset_schema(bench_engine: AsyncEngine = engine):
+    """벤치 DB 테이블 삭제 후 재생성"""
+    require_bench_db()
+    async with bench_engine.begin() as conn:
+        await conn.run_sync(Base.metadata.drop_all)
+        await conn.run_sync(Base.metadata.create_all)
+
+async def seed_universe(n_symbols: int, days: int, bench_engine: AsyncEngine = engine, seed: int = 42):
+    """
+    합성 종목 n_symbols개 × 영업일 days일치 StockPrice 적재 + 최신 시세 스냅샷 재구성
+    PostgreSQL이면 가격은 DB 안에서 생성 (setseed로 재현 가능), 그 외에는 Python에서 생성
+    종목 메타데이터는 스텁 Quote 응답과 같게 맞춤 → 적재 벤치마크가 이름 변경(검색 색인 재생성) 없이 정상 상태를 측정
+    """
+    rng = random.Random(seed)
+    stocks = [
+        {
+            "id": i + 1,
+            "symbol": f"S{i:06d}",
+            "name_en": f"S{i:06d} Inc.",
+            "name_ko": f"합성종목{i}",
+            "market_type": "overseas" if i % 2 == 0 else "domestic",
+            "api_source": "twelvedata",
+            "exchange": "NASDAQ",
+            "currency": "USD",
+        }
+        for i in range(n_symbols)
+    ]
+
+    trading_days: List[date] = []
+    day = date.today()
+    while len(trading_days) < days:
+        if day.weekday() < 5:
+            trading_days.append(day)
+        day -= timedelta(days=1)
+    trading_days.reverse()
+
+    async with bench_engine.begin() as conn:
+        for i in range(0, len(stocks), INSERT_CHUNK):
+            await conn.execute(insert(stock_model.Stock), stocks[i:i + INSERT_CHUNK])
+
+        if conn.dialect.name == "postgresql":
+            await conn.execute(text("SELECT setseed(:seed)"), {"seed": (seed % 1000) / 1000})
+            stocks_per_statement = max(1, SERVER_SIDE_ROWS_PER_STATEMENT // max(1, days))
+            for first_id in range(1, n_symbols + 1, stocks_per_statement):
+                await conn.execute(_SEED_PRICES_SQL, {
+                    "days": trading_days,
+                    "first_id": first_id,
+                    "last_id": first_id + stocks_per_statement - 1,
+                })
+        else:
+            rows = []
+            for stock in stocks:
+                price = rng.uniform(10, 500)
+                for d in trading_days:
+                    prev = price
+                    price = max(1.0, price * (1 + rng.gauss(0, 0.02)))
+                    rows.append({
+                        "stock_id": stock["id"],
+                        "date": d,
+                        "open_price": prev,
+                        "high_price": max(prev, price) * 1.01,
+                        "low_price": min(prev, price) * 0.99,
+                        "close_price": price,
+                        "volume": float(rng.randint(10_000, 5_000_000)),
+                        "change": price - prev,
+                        "percent_change": (price - prev) / prev * 100,
+                    })
+                    if len(rows) >= INSERT_CHUNK:
+                        await conn.execute(insert(stock_model.StockPrice), rows)
+                        rows = []
+            if rows:
+                await conn.execute(insert(stock_model.StockPrice), rows)
+
+    async with AsyncSessionLocal() as db:
+        await crud_price.rebuild_latest_quotes(db)
+        await db.commit()
+
+    # 대량 적재 직후 통계 갱신 (실행마다 같은 실행 계획)
+    if bench_engine.dialect.name == "postgresql":
+        async with bench_engine.begin() as conn:
+            await conn.execute(text("ANALYZE"))
+
+class QueryCounter:
+    """엔진에서 실행된 SQL 문장 수 (DB 왕복 수) 집계"""
+
+    def __init__(self, bench_engine: AsyncEngine = engine):
+        self._sync_engine = bench_engine.sync_engine
+        self.count = 0
+
+    def _on_execute(self, *args, **kwargs):
+        self.count += 1
+
+    @contextmanager
+    def track(self):
+        event.listen(self._sync_engine, "before_cursor_execute", self._on_execute)
+        try:
+            yield self
+        finally:
+            event.remove(self._sync_engine, "before_cursor_execute", self._on_execute)
+
+def _percentile(sorted_values: List[float], pct: float) -> float:
+    if not sorted_values:
+        return 0.0
+    k = (len(sorted_values) - 1) * pct / 100
+    lo, hi = math.floor(k), math.ceil(k)
+    if lo == hi:
+        return sorted_values[int(k)]
+    return sorted_values[lo] + (sorted_values[hi] - sorted_values[lo]) * (k - lo)
+
+def summarize(latencies_s: List[float]) -> Dict[str, float]:
+    """지연 시간 목록(초) → ms 단위 통계"""
+    values = sorted(v * 1000 for v in latencies_s)
+    total = sum(latencies_s)
+    return {
+        "n": len(values),
+        "mean_ms": round(sum(values) / len(values), 3) if values else 0.0,
+        "p50_ms": round(_percentile(values, 50), 3),
+        "p95_ms": round(_percentile(values, 95), 3),
+        "p99_ms": round(_percentile(values, 99), 3),
+        "throughput_per_s": round(len(values) / total, 2) if total else 0.0,
+    }
+
+def git_commit() -> Optional[str]:
+    """현재 커밋 해시 (git 저장소가 아니면 None)"""
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+def print_report(name: str, results: list, params: Optional[Dict[str, Any]] = None, output: Optional[str] = None):
+    """
+    결과를 JSON으로 출력 (커밋 간 비교용, 커밋 해시/실행 인자 포함)
+    output을 주면 파일에도 저장
+    """
+    report = {
+        "benchmark": name,
+        "commit": git_commit(),
+        "timestamp": time.time(),
+        "params": params or {},
+        "results": results,
+    }
+    body = json.dumps(report, ensure_ascii=False, indent=2, default=str)
+    print(body)
+    if output:
+        with open(output, "w", encoding="utf-8") as f:
+            f.write(body + "\n")
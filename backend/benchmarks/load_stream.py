@@ -0,0 +1,128 @@
+# 실시간 시세 스트림(/stocks/stream) 부하 테스트: 구독자 N명 연결 후 델타 전파 지연 측정
+#
+#   python -m benchmarks.load_stream [--clients 2000] [--symbols 100] [--rounds 20] [--slow-clients 0]
+#
+# 앱과 클라이언트를 한 프로세스에서 실행 (허브에 직접 publish → 각 클라이언트 수신까지 지연)
+# 연결 수가 많으면 파일 디스크립터 한도를 올려서 실행 (예: ulimit -n 65536)
+
+import os
+
+os.environ.setdefault("QUOTE_STREAM_LISTEN", "false")
+os.environ.setdefault("INGEST_ON_STARTUP", "false")
+
+import argparse  # noqa: E402
+import asyncio  # noqa: E402
+import json  # noqa: E402
+import logging  # noqa: E402
+import random  # noqa: E402
+import time  # noqa: E402
+from typing import List  # noqa: E402
+
+import httpx  # noqa: E402
+import uvicorn  # noqa: E402
+
+from .common import print_report, summarize  # noqa: E402
+from app.main import app  # noqa: E402
+from app.services import quote_hub  # noqa: E402
+
+logging.getLogger("httpx").setLevel(logging.WARNING)
+
+async def _client(client: httpx.AsyncClient, url: str, params: dict, expected: int, latencies: List[float], connected: asyncio.Event, ready: List[int]):
+    """델타를 expected개 받을 때까지 읽으며 publish 시각 대비 수신 지연 기록"""
+    received = 0
+    async with client.stream("GET", url, params=params) as response:
+        ready.append(1)
+        connected.set()
+        async for line in response.aiter_lines():
+            if not line.startswith("data: "):
+                continue
+            payload = json.loads(line[6:])
+            if "published_at" not in payload:
+                break
+            latencies.append(time.perf_counter() - payload["published_at"])
+            received += 1
+            if received >= expected:
+                break
+
+async def _slow_client(client: httpx.AsyncClient, url: str, stop: asyncio.Event):
+    """연결만 하고 읽지 않는 구독자 (허브가 끊어야 함)"""
+    async with client.stream("GET", url):
+        await stop.wait()
+
+async def main(n_clients: int, n_symbols: int, rounds: int, symbols_per_client: int, slow_clients: int, port: int):
+    server = uvicorn.Server(uvicorn.Config(app, host="127.0.0.1", port=port, log_level="warning", lifespan="off"))
+    server_task = asyncio.create_task(server.serve())
+    while not server.started:
+        await asyncio.sleep(0.01)
+
+    url = f"http://127.0.0.1:{port}/stocks/stream"
+    symbols = [f"S{i:04d}" for i in range(n_symbols)]
+    rng = random.Random(42)
+
+    # 클라이언트별 구독 심볼, 라운드마다 전체 심볼 델타 1건씩 → 클라이언트당 기대 수신 수 계산
+    subscriptions = [rng.sample(symbols, symbols_per_client) if symbols_per_client else None for _ in range(n_clients)]
+    latencies: List[float] = []
+    ready: List[int] = []
+    connected = asyncio.Event()
+    stop_slow = asyncio.Event()
+
+    limits = httpx.Limits(max_connections=None, max_keepalive_connections=None)
+    async with httpx.AsyncClient(limits=limits, timeout=httpx.Timeout(None)) as client:
+        connect_start = time.perf_counter()
+        tasks = [
+            asyncio.create_task(_client(
+                client,
+                url,
+                {"symbols": ",".join(subscribed)} if subscribed else {},
+                rounds * (len(subscribed) if subscribed else n_symbols),
+                latencies,
+                connected,
+                ready,
+            ))
+            for subscribed in subscriptions
+        ]
+        slow_tasks = [asyncio.create_task(_slow_client(client, url, stop_slow)) for _ in range(slow_clients)]
+        while quote_hub.hub.subscribers < n_clients + slow_clients:
+            await asyncio.sleep(0.05)
+        connect_s = time.perf_counter() - connect_start
+
+        publish_start = time.perf_counter()
+        for _ in range(rounds):
+            quote_hub.hub.publish([
+                {"symbol": symbol, "close_price": rng.uniform(10, 500), "published_at": time.perf_counter()}
+                for symbol in symbols
+            ])
+            await asyncio.sleep(0)
+        await asyncio.gather(*tasks)
+        deliver_s = time.perf_counter() - publish_start
+
+        stop_slow.set()
+        for task in slow_tasks:
+            task.cancel()
+        await asyncio.gather(*slow_tasks, return_exceptions=True)
+
+    server.should_exit = True
+    await server_task
+
+    print_report("quote_stream", [{
+        "clients": n_clients,
+        "slow_clients": slow_clients,
+        "symbols": n_symbols,
+        "symbols_per_client": symbols_per_client or n_symbols,
+        "rounds": rounds,
+        "connect_ms": round(connect_s * 1000, 3),
+        "deliver_ms": round(deliver_s * 1000, 3),
+        "delivery_latency": summarize(latencies),
+        **quote_hub.hub.stats(),
+    }])
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--clients", type=int, default=2000)
+    parser.add_argument("--symbols", type=int, default=100)
+    parser.add_argument("--rounds", type=int, default=20)
+    parser.add_argument("--symbols-per-client", type=int, default=5, help="0이면 전체 구독")
+    parser.add_argument("--slow-clients", type=int, default=0)
+    parser.add_argument("--port", type=int, default=8766)
+    args = parser.parse_args()
+    asyncio.run(main(args.clients, args.symbols, args.rounds, args.symbols_per_client, args.slow_clients, args.port))
@@ -0,0 +1,48 @@
+# 전체 벤치마크 묶음: 유니버스 크기별로 시드 → 조회 경로(bench_api) → 적재 흐름(bench_ingest)
+#
+#   BENCH_DATABASE_URL=... python -m benchmarks.run_suite \
+#       [--universes 100 5000 50000] [--years 1] [--iterations 200] [--concurrency 8] \
+#       [--latency-ms 50] [--rate-429 0.05] [--output bench-$(git rev-parse --short HEAD).json]
+#
+# 결과 JSON (커밋 해시, 실행 인자 포함)을 커밋별로 저장해 두고 같은 인자로 다시 실행해 비교
+# 시드 데이터는 고정 seed로 생성 (PostgreSQL은 setseed) → 같은 인자면 같은 데이터
+
+import argparse
+import asyncio
+import time
+
+from . import bench_api, bench_ingest
+from .common import print_report, reset_schema, seed_universe
+
+TRADING_DAYS_PER_YEAR = 252
+
+async def main(args):
+    bench_ingest.configure(args.credits_per_minute, args.backoff_base_ms, args.batch_size, args.fetch_concurrency)
+    results = []
+    for n_symbols in args.universes:
+        await reset_schema()
+        start = time.perf_counter()
+        await seed_universe(n_symbols, args.years * TRADING_DAYS_PER_YEAR)
+        results.append({
+            "benchmark": "seed",
+            "symbols": n_symbols,
+            "years": args.years,
+            "wall_ms": round((time.perf_counter() - start) * 1000, 3),
+        })
+
+        # 조회 먼저 (적재가 최신 시세를 바꾸므로)
+        for result in await bench_api.run_api(n_symbols, args.iterations, args.concurrency):
+            results.append({"benchmark": "api", **result})
+        ingest = await bench_ingest.run_ingest(n_symbols, args.latency_ms, args.rate_429, args.port)
+        results.append({"benchmark": "ingest", **ingest})
+
+    print_report("suite", results, params=vars(args), output=args.output)
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--universes", type=int, nargs="+", default=[100, 5000, 50000], help="종목 수")
+    parser.add_argument("--years", type=int, default=1, help="종목별 일봉 기간 (년)")
+    parser.add_argument("--output", default=None, help="결과 JSON 파일")
+    bench_api.add_arguments(parser)
+    bench_ingest.add_arguments(parser)
+    asyncio.run(main(parser.parse_args()))
@@ -0,0 +1,219 @@
+# 로컬 Twelvedata 스텁 서버 (요청 수/커넥션 수 집계, 지연/429 비율 설정 가능)
+# /quote, /time_series (JSON/CSV) 지원. --fixtures-dir에 {SYMBOL}.csv(datetime;open;high;low;close;volume)가
+# 있으면 기록된 시세를 재생하고, 없으면 심볼별로 고정된 합성 시세를 생성
+#
+# 단독 실행: python -m benchmarks.twelvedata_stub --port 8765 --latency-ms 50 --rate-429 0.05
+# 앱을 스텁에 연결: TWELVEDATA_BASE_URL=http://127.0.0.1:8765
+
+import argparse
+import asyncio
+import hashlib
+import random
+from datetime import date, timedelta
+from pathlib import Path
+from typing import Dict, List, Optional, Set, Tuple
+
+import uvicorn
+from fastapi import FastAPI, Query, Request
+from fastapi.responses import JSONResponse, PlainTextResponse
+
+class StubStats:
+    def __init__(self):
+        self.requests = 0
+        self.symbols_requested = 0
+        self.rate_limited = 0
+        self._connections: Set[Tuple[str, int]] = set()
+
+    @property
+    def connections(self) -> int:
+        return len(self._connections)
+
+    def as_dict(self):
+        return {
+            "requests": self.requests,
+            "connections": self.connections,
+            "symbols_requested": self.symbols_requested,
+            "rate_limited": self.rate_limited,
+        }
+
+def _quote(symbol: str):
+    """심볼별로 항상 같은 값을 주는 합성 Quote"""
+    rng = random.Random(_seed_for(symbol))
+    close = round(rng.uniform(10, 500), 2)
+    prev = round(close * rng.uniform(0.95, 1.05), 2)
+    return {
+        "symbol": symbol,
+        "name": f"{symbol} Inc.",
+        "exchange": "NASDAQ",
+        "currency": "USD",
+        "open": str(prev),
+        "high": str(max(prev, close) * 1.01),
+        "low": str(min(prev, close) * 0.99),
+        "close": str(close),
+        "previous_close": str(prev),
+        "volume": str(rng.randint(100_000, 10_000_000)),
+        "change": str(round(close - prev, 2)),
+        "percent_change": str(round((close - prev) / prev * 100, 4)),
+        "is_market_open": False,
+        "fifty_two_week": {"low": str(close * 0.7), "high": str(close * 1.3)},
+    }
+
+def _seed_for(symbol: str) -> int:
+    return int(hashlib.md5(symbol.encode()).hexdigest()[:8], 16)
+
+def _synthetic_bars(symbol: str, start: date, end: date) -> List[Dict[str, str]]:
+    """심볼별로 항상 같은 합성 일봉 (2000-01-03부터 영업일 기준 랜덤워크)"""
+    rng = random.Random(_seed_for(symbol))
+    price = rng.uniform(10, 500)
+    bars = []
+    day = date(2000, 1, 3)
+    while day <= end:
+        if day.weekday() < 5:
+            prev = price
+            price = max(1.0, price * (1 + rng.gauss(0, 0.02)))
+            if day >= start:
+                bars.append({
+                    "datetime": day.isoformat(),
+                    "open": f"{prev:.4f}",
+                    "high": f"{max(prev, price) * 1.01:.4f}",
+                    "low": f"{min(prev, price) * 0.99:.4f}",
+                    "close": f"{price:.4f}",
+                    "volume": str(rng.randint(100_000, 10_000_000)),
+                })
+        day += timedelta(days=1)
+    return bars
+
+def _fixture_bars(fixtures_dir: Optional[Path], symbol: str, start: date, end: date) -> Optional[List[Dict[str, str]]]:
+    """기록된 시세 파일 재생 ({SYMBOL}.csv, 헤더 포함, ; 구분)"""
+    if fixtures_dir is None:
+        return None
+    path = fixtures_dir / f"{symbol}.csv"
+    if not path.exists():
+        return None
+    lines = [line.strip() for line in path.read_text(encoding="utf-8").splitlines() if line.strip()]
+    header = lines[0].split(";")
+    bars = [dict(zip(header, line.split(";"))) for line in lines[1:]]
+    return sorted(
+        (bar for bar in bars if start <= date.fromisoformat(bar["datetime"][:10]) <= end),
+        key=lambda bar: bar["datetime"],
+    )
+
+def create_stub_app(
+    latency_ms: float = 0.0, rate_429: float = 0.0, seed: int = 0, fixtures_dir: Optional[str] = None
+) -> FastAPI:
+    app = FastAPI()
+    stats = StubStats()
+    rng = random.Random(seed)
+    fixtures_path = Path(fixtures_dir) if fixtures_dir else None
+    app.state.stats = stats
+
+    @app.middleware("http")
+    async def count_connections(request: Request, call_next):
+        # 같은 (host, port) = 같은 TCP 커넥션 (keep-alive 재사용)
+        stats._connections.add(tuple(request.scope.get("client") or ("", 0)))
+        stats.requests += 1
+        return await call_next(request)
+
+    async def _throttle() -> Optional[JSONResponse]:
+        if latency_ms:
+            await asyncio.sleep(latency_ms / 1000)
+        if rate_429 and rng.random() < rate_429:
+            stats.rate_limited += 1
+            return JSONResponse(
+                status_code=429,
+                content={"code": 429, "message": "API credits exceeded", "status": "error"},
+            )
+        return None
+
+    @app.get("/quote")
+    async def quote(symbol: str = Query(...), apikey: str = Query("")):
+        throttled = await _throttle()
+        if throttled:
+            return throttled
+        symbols = [s for s in symbol.split(",") if s]
+        stats.symbols_requested += len(symbols)
+        if len(symbols) == 1:
+            return _quote(symbols[0])
+        return {s: _quote(s) for s in symbols}
+
+    @app.get("/time_series")
+    async def time_series(
+        symbol: str = Query(...),
+        interval: str = Query("1day"),
+        start_date: date = Query(date(2000, 1, 3)),
+        end_date: date = Query(default_factory=date.today),
+        outputsize: int = Query(30),
+        order: str = Query("DESC"),
+        format: str = Query("JSON"),
+        delimiter: str = Query(";"),
+        apikey: str = Query(""),
+    ):
+        throttled = await _throttle()
+        if throttled:
+            return throttled
+        stats.symbols_requested += 1
+
+        bars = _fixture_bars(fixtures_path, symbol, start_date, end_date)
+        if bars is None:
+            bars = _synthetic_bars(symbol, start_date, end_date)
+        if not bars:
+            return {"code": 400, "message": "No data is available on the specified dates.", "status": "error"}
+
+        # Twelvedata와 같이 outputsize는 최신 쪽부터 자름
+        bars = bars[-outputsize:]
+        if order.upper() == "DESC":
+            bars = bars[::-1]
+
+        if format.upper() == "CSV":
+            columns = ["datetime", "open", "high", "low", "close", "volume"]
+            lines = [delimiter.join(columns)] + [delimiter.join(bar[c] for c in columns) for bar in bars]
+            return PlainTextResponse("\n".join(lines) + "\n", media_type="text/csv")
+        return {"meta": {"symbol": symbol, "interval": interval}, "values": bars, "status": "ok"}
+
+    @app.get("/_stats")
+    async def read_stats():
+        return stats.as_dict()
+
+    return app
+
+class StubServer:
+    """벤치마크 안에서 스텁을 백그라운드로 띄우는 헬퍼"""
+
+    def __init__(self, host: str = "127.0.0.1", port: int = 8765, **app_options):
+        self.app = create_stub_app(**app_options)
+        self.host = host
+        self.port = port
+        self._server = uvicorn.Server(uvicorn.Config(self.app, host=host, port=port, log_level="warning"))
+        self._task: Optional[asyncio.Task] = None
+
+    @property
+    def base_url(self) -> str:
+        return f"http://{self.host}:{self.port}"
+
+    @property
+    def stats(self) -> StubStats:
+        return self.app.state.stats
+
+    async def __aenter__(self) -> "StubServer":
+        self._task = asyncio.create_task(self._server.serve())
+        while not self._server.started:
+            await asyncio.sleep(0.01)
+        return self
+
+    async def __aexit__(self, *exc):
+        self._server.should_exit = True
+        await self._task
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--latency-ms", type=float, default=0.0)
+    parser.add_argument("--rate-429", type=float, default=0.0)
+    parser.add_argument("--fixtures-dir", default=None)
+    args = parser.parse_args()
+    uvicorn.run(
+        create_stub_app(latency_ms=args.latency_ms, rate_429=args.rate_429, fixtures_dir=args.fixtures_dir),
+        host=args.host,
+        port=args.port,
+    )
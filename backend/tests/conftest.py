@@ -0,0 +1,41 @@
+# 테스트 공통 설정: 임시 SQLite 파일 DB (primary, 읽기 레플리카 각각), 외부 API 없이 실행 (Twelvedata는 benchmarks의 로컬 스텁 사용)
+#
+# 실행 (backend 디렉토리에서): python -m pytest tests
+#   필요 패키지: pytest, aiosqlite (예: uv run --with pytest --with aiosqlite python -m pytest tests)
+
+import os
+import socket
+import tempfile
+
+# app 모듈이 엔진을 만들기 전에 설정
+_db_dir = tempfile.mkdtemp(prefix="capstone-stock-tests-")
+os.environ["DATABASE_URL"] = f"sqlite+aiosqlite:///{_db_dir}/primary.db"
+os.environ["DATABASE_READ_URL"] = f"sqlite+aiosqlite:///{_db_dir}/replica.db"
+os.environ["TWELVE_DATA_API_KEY"] = "test"
+os.environ["TWELVEDATA_BASE_URL"] = "http://127.0.0.1:9"
+os.environ["QUOTE_STREAM_LISTEN"] = "false"
+os.environ["INGEST_ON_STARTUP"] = "false"
+
+import pytest
+
+from app.db.database import Base, dispose_engines, engine, read_engine
+
+@pytest.fixture
+def anyio_backend():
+    return "asyncio"
+
+@pytest.fixture
+async def db():
+    """테스트마다 빈 스키마 (종료 시 커넥션 정리 → 다음 테스트의 이벤트 루프와 섞이지 않음)"""
+    for target in (engine, read_engine):
+        async with target.begin() as conn:
+            await conn.run_sync(Base.metadata.drop_all)
+            await conn.run_sync(Base.metadata.create_all)
+    yield
+    await dispose_engines()
+
+@pytest.fixture
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
@@ -0,0 +1,105 @@
+# primary/읽기 레플리카 분리: 조회 라우트는 레플리카, 적재 쓰기와 데이터셋 버전은 primary (SQLite 파일 2개)
+
+from datetime import date
+
+import httpx
+import pytest
+from sqlalchemy import func, select
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from app.core.config import settings
+from app.crud import crud_dataset, crud_price, crud_stock
+from app.db.database import AsyncSessionLocal, ReadSessionLocal
+from app.db.pool import engine_options
+from app.main import app
+from app.models import stock_model
+from app.services import stock_service, symbol_search
+from app.services.ingest_pipeline import FetchedQuote, QuoteBatchWriter
+
+pytestmark = pytest.mark.anyio
+
+PRICE_DATE = date(2024, 1, 2)
+
+@pytest.fixture
+async def client(db):
+    # 프로세스 내 데이터셋 버전/목록 캐시는 테스트 간에 비움
+    stock_service._dataset_version = None
+    await stock_service.stock_list_cache.invalidate()
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test") as client:
+        yield client
+
+async def _seed(session_factory, symbol: str, name_ko: str):
+    """종목 1개 + 일봉 1개 + 최신 시세"""
+    async with session_factory() as session:
+        stock_ids = await crud_stock.upsert_stocks(
+            session,
+            [{"symbol": symbol, "name_en": f"{symbol} Inc", "name_ko": name_ko, "market_type": "overseas", "api_source": "twelvedata"}],
+            update_columns=(),
+        )
+        saved = await crud_price.upsert_stock_prices(session, [{
+            "stock_id": stock_ids[symbol], "date": PRICE_DATE,
+            "open_price": 10.0, "high_price": 11.0, "low_price": 9.0, "close_price": 10.5, "volume": 1000.0,
+        }])
+        await crud_price.upsert_latest_quotes(session, saved)
+        await session.commit()
+
+async def _symbols(session_factory) -> list:
+    async with session_factory() as session:
+        result = await session.execute(select(stock_model.Stock.symbol).order_by(stock_model.Stock.symbol))
+        return list(result.scalars().all())
+
+async def test_read_routes_use_replica(client):
+    await _seed(AsyncSessionLocal, "PRIMARY", "프라이머리")
+    await _seed(ReadSessionLocal, "REPLICA", "레플리카")
+    await symbol_search.rebuild_index(use_replica=True)
+
+    response = await client.get("/stocks/")
+    assert [item["symbol"] for item in response.json()["items"]] == ["REPLICA"]
+
+    assert (await client.get("/stocks/REPLICA")).status_code == 200
+    assert (await client.get("/stocks/PRIMARY")).status_code == 404
+
+    search = await client.get("/stocks/search", params={"q": "레플"})
+    assert [item["symbol"] for item in search.json()] == ["REPLICA"]
+
+    prices = await client.get("/stocks/REPLICA/prices", params={"from": "2024-01-01", "to": "2024-01-31"})
+    assert prices.json()["dates"] == [PRICE_DATE.isoformat()]
+    assert (await client.get("/stocks/PRIMARY/prices")).status_code == 404
+
+async def test_ingest_writes_go_to_primary(db):
+    quote = {"name_en": "Primary Inc", "close_price": 10.5, "open_price": 10.0, "volume": 1000.0}
+    async with QuoteBatchWriter() as writer:
+        await writer.add(FetchedQuote(
+            symbol="NEW", fetch_date=PRICE_DATE, data=quote, market_type="overseas", api_source="twelvedata"
+        ))
+    assert writer.saved_count == 1
+
+    assert await _symbols(AsyncSessionLocal) == ["NEW"]
+    assert await _symbols(ReadSessionLocal) == []
+
+    async with AsyncSessionLocal() as session:
+        assert await session.scalar(select(func.count()).select_from(stock_model.StockPrice)) == 1
+        assert (await crud_dataset.get_dataset_version(session, stock_service.STOCK_DATASET))[0] == 1
+    async with ReadSessionLocal() as session:
+        assert await crud_dataset.get_dataset_version(session, stock_service.STOCK_DATASET) is None
+
+async def test_pool_timeout_is_recorded(monkeypatch):
+    monkeypatch.setattr(settings, "DB_POOL_SIZE", 1)
+    monkeypatch.setattr(settings, "DB_MAX_OVERFLOW", 0)
+    monkeypatch.setattr(settings, "DB_POOL_TIMEOUT_SECONDS", 0.1)
+    url = settings.DATABASE_READ_URL
+    engine = create_async_engine(url, **engine_options(url))
+    try:
+        async with engine.connect():
+            with pytest.raises(PoolTimeoutError):
+                async with engine.connect():
+                    pass
+        # 연결이 반환되면 다시 얻을 수 있음
+        async with engine.connect():
+            pass
+        wait_stats = engine.pool.wait_stats
+        assert wait_stats.timeouts == 1
+        assert wait_stats.checkouts == 2
+    finally:
+        await engine.dispose()
@@ -0,0 +1,107 @@
+# 과거 일봉 백필: 기록된 시세(Twelvedata CSV 형식)를 재생하는 로컬 스텁에 작은 페이지 크기로 적재
+
+from datetime import date
+from pathlib import Path
+
+import pytest
+from sqlalchemy import select
+
+from benchmarks.twelvedata_stub import StubServer
+from app.core import http_client
+from app.core.config import settings
+from app.crud import crud_backfill, crud_stock
+from app.db.database import AsyncSessionLocal
+from app.models import stock_model
+from app.services import history_backfill
+from app.services.fetch_scheduler import RetryableFetchError, TokenBucket
+from app.services.twelvedata_provider import TwelvedataProvider
+
+pytestmark = pytest.mark.anyio
+
+FIXTURES_DIR = Path(__file__).parent / "fixtures"
+
+START = date(2024, 1, 1)
+END = date(2024, 6, 30)
+
+def _fixture_dates(symbol: str) -> list:
+    lines = (FIXTURES_DIR / "twelvedata" / f"{symbol}.csv").read_text().splitlines()[1:]
+    return [date.fromisoformat(line.split(";")[0]) for line in lines if line]
+
+@pytest.fixture
+async def stub(db, free_port, monkeypatch):
+    async with StubServer(port=free_port, fixtures_dir=str(FIXTURES_DIR / "twelvedata")) as server:
+        monkeypatch.setattr(settings, "TWELVEDATA_BASE_URL", server.base_url)
+        monkeypatch.setattr(settings, "BACKFILL_PAGE_SIZE", 20)
+        await http_client.init_http_client()
+        yield server
+        await http_client.close_http_client()
+
+@pytest.fixture
+def provider():
+    provider = TwelvedataProvider()
+    provider.limiter = TokenBucket(rate_per_minute=1e9)
+    return provider
+
+async def _create_stock(symbol: str) -> int:
+    async with AsyncSessionLocal() as session:
+        stock_ids = await crud_stock.upsert_stocks(
+            session, [{"symbol": symbol, "market_type": "overseas", "api_source": "twelvedata"}], update_columns=()
+        )
+        await session.commit()
+    return stock_ids[symbol]
+
+async def _stored_dates(stock_id: int) -> list:
+    async with AsyncSessionLocal() as session:
+        price = stock_model.StockPrice
+        result = await session.execute(select(price.date).filter(price.stock_id == stock_id).order_by(price.date))
+        return list(result.scalars().all())
+
+async def _checkpoint(stock_id: int):
+    async with AsyncSessionLocal() as session:
+        return (await crud_backfill.get_checkpoints(session, [stock_id]))[stock_id]
+
+async def test_backfill_stores_every_bar_across_pages(stub, provider):
+    stock_id = await _create_stock("AAPL")
+    expected = _fixture_dates("AAPL")
+    assert len(expected) > settings.BACKFILL_PAGE_SIZE * 5
+
+    saved = await history_backfill.backfill_symbol(provider, stock_id, "AAPL", START, END)
+
+    assert saved == len(expected)
+    assert await _stored_dates(stock_id) == expected
+    checkpoint = await _checkpoint(stock_id)
+    assert checkpoint.completed and checkpoint.last_date == END
+
+async def test_backfill_resumes_from_checkpoint(stub, provider, monkeypatch):
+    stock_id = await _create_stock("AAPL")
+    expected = _fixture_dates("AAPL")
+    stream_history = provider.stream_history
+    calls = 0
+
+    def failing_stream_history(*args, **kwargs):
+        nonlocal calls
+        calls += 1
+        if calls > 3:
+            raise RetryableFetchError("HTTP 429")
+        return stream_history(*args, **kwargs)
+
+    monkeypatch.setattr(provider, "stream_history", failing_stream_history)
+    with pytest.raises(RetryableFetchError):
+        await history_backfill.backfill_symbol(provider, stock_id, "AAPL", START, END)
+
+    # 커밋된 구간만 저장, 체크포인트는 미완료
+    checkpoint = await _checkpoint(stock_id)
+    assert not checkpoint.completed
+    partial = await _stored_dates(stock_id)
+    assert partial == [day for day in expected if day <= checkpoint.last_date]
+    assert 0 < len(partial) < len(expected)
+
+    # 다시 실행하면 체크포인트 다음 날부터 이어서 적재
+    monkeypatch.setattr(provider, "stream_history", stream_history)
+    requests_before = stub.stats.requests
+    saved = await history_backfill.backfill_symbol(provider, stock_id, "AAPL", START, END)
+
+    assert saved == len(expected) - len(partial)
+    assert await _stored_dates(stock_id) == expected
+    assert (await _checkpoint(stock_id)).completed
+    assert stub.stats.requests - requests_before < len(expected) // settings.BACKFILL_PAGE_SIZE + 1
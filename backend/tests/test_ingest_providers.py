@@ -0,0 +1,219 @@
+# 제공자 추상화 위의 적재 흐름: 가짜 제공자(네트워크 없음)로 동시 적재, 제공자별 보고서, 실패 종목 재시도, 백필
+
+from datetime import date, datetime, time, timedelta, timezone
+from zoneinfo import ZoneInfo
+
+import pytest
+from sqlalchemy import select
+
+from app.core.clock import FakeClock
+from app.core.config import settings
+from app.core.market_calendar import MarketCalendar, US_EQUITY_CALENDAR
+from app.crud import crud_backfill
+from app.db.database import AsyncSessionLocal
+from app.models import stock_model
+from app.services import data_fetcher, history_backfill
+from app.services.fake_provider import FakeProvider
+from app.services.fetch_scheduler import TokenBucket
+from app.services.ingest_pipeline import QuoteBatchWriter
+from app.services.ingest_scheduler import IngestScheduler
+
+pytestmark = pytest.mark.anyio
+
+class SecondFakeProvider(FakeProvider):
+    """다른 이름/심볼의 두 번째 가짜 제공자 (FAKE1000 ~)"""
+
+    name = "fake2"
+
+    @property
+    def symbols(self):
+        return [f"FAKE{i:04d}" for i in range(1000, 1000 + self.n_symbols)]
+
+# 미국과 시간대/거래 시간이 다른 거래소 (휴장일 없음)
+SEOUL_CALENDAR = MarketCalendar(
+    name="KR",
+    timezone=ZoneInfo("Asia/Seoul"),
+    open_time=time(9, 0),
+    close_time=time(15, 30),
+    holidays=lambda year: frozenset(),
+)
+
+class SeoulFakeProvider(SecondFakeProvider):
+    """서울 거래소 캘린더의 가짜 제공자"""
+
+    name = "fake_kr"
+    market_type = "domestic"
+    calendar = SEOUL_CALENDAR
+
+def _provider(provider_type=FakeProvider, n_symbols: int = 12, **kwargs) -> FakeProvider:
+    provider = provider_type(n_symbols=n_symbols, latency_ms=1, error_rate=0, clock=FakeClock(), **kwargs)
+    provider.limiter = TokenBucket(rate_per_minute=1e9)
+    return provider
+
+def _session_date(provider: FakeProvider) -> date:
+    return provider.calendar.latest_session_date(provider.clock.now())
+
+async def _stored_prices() -> dict:
+    """{(api_source, symbol): (date, close_price)}"""
+    async with AsyncSessionLocal() as session:
+        stock, price = stock_model.Stock, stock_model.StockPrice
+        result = await session.execute(
+            select(stock.api_source, stock.symbol, price.date, price.close_price).join(price, price.stock_id == stock.id)
+        )
+        return {(source, symbol): (day, close) for source, symbol, day, close in result.tuples().all()}
+
+async def _failed_symbols(api_source: str) -> set:
+    async with AsyncSessionLocal() as session:
+        failure = stock_model.FetchFailure
+        result = await session.execute(select(failure.symbol).filter(failure.api_source == api_source))
+        return set(result.scalars().all())
+
+async def test_fetch_quotes_uses_clock_session_date():
+    provider = _provider()
+    session_date = _session_date(provider)
+
+    quotes, errors = await provider.fetch_quotes(["FAKE0000", "NOPE"])
+
+    assert quotes == {"FAKE0000": provider.quote("FAKE0000", session_date)}
+    assert errors == {"NOPE": "응답 없음"}
+
+async def test_stream_history_keeps_newest_page():
+    provider = _provider()
+    start, end = date(2024, 1, 1), date(2024, 1, 31)
+
+    bars = [bar async for bar in provider.stream_history("FAKE0000", start, end, page_size=5)]
+
+    trading_days = [start + timedelta(days=i) for i in range((end - start).days + 1)]
+    trading_days = [day for day in trading_days if provider.calendar.is_trading_day(day)]
+    assert [bar["date"] for bar in bars] == trading_days[-5:]
+
+async def test_providers_share_one_writer(db, monkeypatch):
+    monkeypatch.setattr(settings, "INGEST_BATCH_SIZE", 5)
+    first, second = _provider(), _provider(SecondFakeProvider)
+    providers = [first, second]
+    await data_fetcher.initialize_stock_list(providers)
+
+    # 배치마다 어느 제공자의 시세가 들어 있었는지 기록
+    batch_sources = []
+    write_batch = QuoteBatchWriter._write_batch
+
+    async def recording_write_batch(self, batch):
+        batch_sources.append({"fake2" if quote.symbol >= "FAKE1000" else "fake" for quote in batch})
+        await write_batch(self, batch)
+
+    monkeypatch.setattr(QuoteBatchWriter, "_write_batch", recording_write_batch)
+    session_date = _session_date(first)
+    reports = await data_fetcher.update_stock_prices(providers, now=first.clock.now())
+
+    assert set(reports) == {"fake", "fake2"}
+    for provider in providers:
+        summary = reports[provider.name].summary()
+        assert (summary["total"], summary["succeeded"], summary["failed"]) == (12, 12, 0)
+
+    stored = await _stored_prices()
+    assert stored == {
+        (provider.name, symbol): (session_date, provider.quote(symbol, session_date)["close_price"])
+        for provider in providers
+        for symbol in provider.symbols
+    }
+    assert any(sources == {"fake", "fake2"} for sources in batch_sources)
+
+async def test_scheduler_uses_each_provider_calendar(db):
+    # 2025-01-06(월) 14:00 UTC: 뉴욕은 장 시작 전(최근 세션 1/3 금), 서울은 1/6 장 마감 후
+    clock = FakeClock(datetime(2025, 1, 6, 14, 0, tzinfo=timezone.utc))
+    us = _provider(n_symbols=3)
+    kr = _provider(SeoulFakeProvider, n_symbols=3)
+    us.clock = kr.clock = clock
+    providers = [us, kr]
+    await data_fetcher.initialize_stock_list(providers)
+
+    cutoffs = {}
+
+    async def run_ingest(now, refreshed_before):
+        cutoffs.update((provider.name, refreshed_before(provider)) for provider in providers)
+        return await data_fetcher.update_stock_prices(providers, now=now, refreshed_before=refreshed_before)
+
+    scheduler = IngestScheduler(
+        run_ingest=run_ingest,
+        clock=clock,
+        calendars=[US_EQUITY_CALENDAR, SEOUL_CALENDAR],
+        interval_seconds=900,
+        post_close_delay_seconds=1200,
+    )
+    assert await scheduler.run_once()
+
+    us_session, kr_session = date(2025, 1, 3), date(2025, 1, 6)
+    stored = await _stored_prices()
+    assert stored == {
+        **{("fake", symbol): (us_session, us.quote(symbol, us_session)["close_price"]) for symbol in us.symbols},
+        **{("fake_kr", symbol): (kr_session, kr.quote(symbol, kr_session)["close_price"]) for symbol in kr.symbols},
+    }
+    # 둘 다 장외: 각자의 최근 세션 마감 + 20분
+    assert cutoffs == {
+        "fake": datetime(2025, 1, 3, 21, 20, tzinfo=timezone.utc),
+        "fake_kr": datetime(2025, 1, 6, 6, 50, tzinfo=timezone.utc),
+    }
+    # 다음 실행: 뉴욕 장 시작 (서울 다음 장 시작보다 이름)
+    assert scheduler.next_run_at(clock.now()) == datetime(2025, 1, 6, 14, 30, tzinfo=timezone.utc)
+
+async def test_new_symbols_keep_provider_source(db):
+    # 종목 목록 초기화 없이 시세 적재로 처음 생기는 종목
+    provider = _provider(SeoulFakeProvider, n_symbols=2)
+    async with QuoteBatchWriter() as writer:
+        errors = await data_fetcher.fetch_prices(provider, provider.symbols, _session_date(provider), writer)
+    assert errors == {} and writer.saved_count == 2
+
+    async with AsyncSessionLocal() as session:
+        stock = stock_model.Stock
+        result = await session.execute(select(stock.symbol, stock.market_type, stock.api_source).order_by(stock.symbol))
+        assert result.tuples().all() == [(symbol, "domestic", "fake_kr") for symbol in provider.symbols]
+
+async def test_only_failed_retries_persisted_failures(db):
+    await data_fetcher.initialize_stock_list([_provider(n_symbols=10)])
+    now = FakeClock().now()
+
+    # FAKE0007 ~ FAKE0009는 응답에 없음 → 실패로 저장
+    partial = _provider(n_symbols=7)
+    reports = await data_fetcher.update_stock_prices([partial], now=now)
+    assert set(reports["fake"].failed) == {"FAKE0007", "FAKE0008", "FAKE0009"}
+    assert await _failed_symbols("fake") == {"FAKE0007", "FAKE0008", "FAKE0009"}
+
+    # 새 제공자 인스턴스(다른 프로세스와 같음)도 DB에 저장된 실패 종목만 다시 시도
+    data_fetcher.last_fetch_reports.clear()
+    retry = _provider(n_symbols=10)
+    reports = await data_fetcher.update_stock_prices([retry], only_failed=True, now=now)
+
+    summary = reports["fake"].summary()
+    assert (summary["total"], summary["succeeded"], summary["failed"]) == (3, 3, 0)
+    assert retry.requests == 1
+    assert await _failed_symbols("fake") == set()
+    assert len(await _stored_prices()) == 10
+
+async def test_backfill_pages_through_history(db, monkeypatch):
+    monkeypatch.setattr(settings, "BACKFILL_PAGE_SIZE", 20)
+    provider = _provider(n_symbols=2)
+    await data_fetcher.initialize_stock_list([provider])
+
+    reports = await history_backfill.run_backfill(years=1, providers=[provider])
+
+    assert reports["fake"].summary()["succeeded"] == 2
+    async with AsyncSessionLocal() as session:
+        stocks = (await session.execute(select(stock_model.Stock))).scalars().all()
+        checkpoints = await crud_backfill.get_checkpoints(session, [stock.id for stock in stocks])
+        for stock in stocks:
+            checkpoint = checkpoints[stock.id]
+            assert checkpoint.completed
+            day, expected = checkpoint.start_date, []
+            while day <= checkpoint.end_date:
+                if provider.calendar.is_trading_day(day):
+                    expected.append(day)
+                day += timedelta(days=1)
+            price = stock_model.StockPrice
+            result = await session.execute(
+                select(price.date, price.close_price).filter(price.stock_id == stock.id).order_by(price.date)
+            )
+            assert [tuple(row) for row in result.tuples().all()] == [
+                (day, provider.bar(stock.symbol, day)["close"]) for day in expected
+            ]
+    # 구간당 요청 1회 (페이지 크기 20, 종목 2개)
+    assert provider.requests >= 2 * len(expected) // 20
@@ -0,0 +1,79 @@
+# 주기 적재 스케줄러: FakeClock으로 장중 간격 실행, 장 마감 후 1회, 주말/휴장일 건너뛰고 다음 장 시작까지 대기
+
+import asyncio
+from datetime import datetime
+from types import SimpleNamespace
+from zoneinfo import ZoneInfo
+
+import pytest
+
+from app.core.clock import FakeClock
+from app.core.market_calendar import US_EQUITY_CALENDAR
+from app.services.ingest_scheduler import IngestScheduler
+
+pytestmark = pytest.mark.anyio
+
+NEW_YORK = ZoneInfo("America/New_York")
+US_PROVIDER = SimpleNamespace(name="us", calendar=US_EQUITY_CALENDAR)
+
+def _et(day: int, hour: int, minute: int = 0) -> datetime:
+    """2025년 1월 day일 뉴욕 시각 (1/17 금, 1/20 월 Martin Luther King Jr. Day 휴장)"""
+    return datetime(2025, 1, day, hour, minute, tzinfo=NEW_YORK)
+
+def _scheduler(clock: FakeClock, **kwargs) -> IngestScheduler:
+    return IngestScheduler(
+        clock=clock,
+        calendars=[US_EQUITY_CALENDAR],
+        interval_seconds=1800,
+        post_close_delay_seconds=1200,
+        **kwargs,
+    )
+
+@pytest.mark.parametrize(
+    ("now", "expected"),
+    [
+        (_et(17, 15, 0), _et(17, 15, 30)), # 장중: interval 후
+        (_et(17, 15, 55), _et(17, 16, 20)), # 장 마감 직전: 마감 후 실행이 더 이름
+        (_et(17, 16, 5), _et(17, 16, 20)), # 마감 후, 마감 후 실행 전
+        (_et(17, 16, 20), _et(21, 9, 30)), # 마감 후 실행 이후: 주말 + 휴장일 건너뜀
+        (_et(18, 12, 0), _et(21, 9, 30)), # 토요일
+        (_et(20, 12, 0), _et(21, 9, 30)), # 휴장일
+        (_et(21, 8, 0), _et(21, 9, 30)), # 장 시작 전
+    ],
+)
+def test_next_run_at(now, expected):
+    assert _scheduler(FakeClock(now)).next_run_at(now) == expected
+
+@pytest.mark.parametrize(
+    ("now", "expected"),
+    [
+        (_et(17, 15, 0), _et(17, 14, 30)), # 장중: interval 이전에 갱신된 시세
+        (_et(17, 16, 5), _et(17, 16, 5)), # 마감 후 실행 전: 장중 시세 전부
+        (_et(18, 12, 0), _et(17, 16, 20)), # 장외: 마감 후 실행 이전에 갱신된 시세
+        (_et(20, 12, 0), _et(17, 16, 20)), # 휴장일: 직전 영업일 기준
+    ],
+)
+def test_refreshed_before(now, expected):
+    assert _scheduler(FakeClock(now)).refreshed_before(US_EQUITY_CALENDAR, now) == expected
+
+async def test_run_forever_across_close_weekend_and_holiday(db):
+    clock = FakeClock(_et(17, 15, 0))
+    runs = []
+
+    async def run_ingest(now, refreshed_before):
+        runs.append((now, refreshed_before(US_PROVIDER)))
+        if len(runs) == 5:
+            raise asyncio.CancelledError
+
+    with pytest.raises(asyncio.CancelledError):
+        await _scheduler(clock, run_ingest=run_ingest).run_forever()
+
+    assert runs == [
+        (_et(17, 15, 30), _et(17, 15, 0)), # 장중 간격
+        (_et(17, 16, 0), _et(17, 16, 0)), # 장중 간격이 마감 시각과 겹침
+        (_et(17, 16, 20), _et(17, 16, 20)), # 마감 후 1회 (최종 종가)
+        (_et(21, 9, 30), _et(21, 9, 0)), # 주말 + 휴장일 다음 장 시작
+        (_et(21, 10, 0), _et(21, 9, 30)),
+    ]
+    # 실제로 기다리지 않고 시각만 이동 (금 16:20 → 화 09:30)
+    assert clock.sleeps[3] == (_et(21, 9, 30) - _et(17, 16, 20)).total_seconds()
@@ -0,0 +1,57 @@
+# 실시간 시세 스트림: 적재 배치가 커밋된 시세만 구독자에게 전달 (SQLite는 프로세스 내 허브로 직접 전달)
+
+from datetime import date
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.crud import crud_stock
+from app.db.database import AsyncSessionLocal
+from app.services import quote_hub
+from app.services.ingest_pipeline import FetchedQuote, QuoteBatchWriter
+
+pytestmark = pytest.mark.anyio
+
+QUOTE = FetchedQuote(
+    symbol="AAPL",
+    fetch_date=date(2024, 1, 2),
+    data={"close_price": 185.6, "volume": 1000.0},
+    market_type="overseas",
+    api_source="twelvedata",
+)
+
+@pytest.fixture
+def subscription():
+    subscription = quote_hub.hub.subscribe(None)
+    yield subscription
+    quote_hub.hub.unsubscribe(subscription)
+
+async def _create_stock(symbol: str):
+    async with AsyncSessionLocal() as session:
+        await crud_stock.upsert_stocks(
+            session, [{"symbol": symbol, "market_type": "overseas", "api_source": "twelvedata"}], update_columns=()
+        )
+        await session.commit()
+
+async def test_failed_batch_publishes_nothing(db, subscription, monkeypatch):
+    await _create_stock("AAPL")
+
+    async def failing_commit(self):
+        raise RuntimeError("commit failed")
+
+    monkeypatch.setattr(AsyncSession, "commit", failing_commit)
+    async with QuoteBatchWriter() as writer:
+        await writer.add(QUOTE)
+
+    assert writer.failed_symbols == ["AAPL"]
+    assert subscription.queue.empty()
+
+async def test_committed_batch_is_published(db, subscription):
+    await _create_stock("AAPL")
+
+    async with QuoteBatchWriter() as writer:
+        await writer.add(QUOTE)
+
+    assert writer.saved_count == 1
+    message = subscription.queue.get_nowait()
+    assert message.startswith(b"event: quote\n") and b'"symbol":"AAPL"' in message